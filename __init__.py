@@ -21,6 +21,8 @@
 
 """A collection of tools for building LaTeX pictures with python."""
 
+# First, in order to time the imports below. See `import_times_report`.
+from yanntricks.src.import_times import import_times_report
 
 from yanntricks.src.figure_generation_suite import FigureGenerationSuite
 
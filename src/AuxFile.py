@@ -24,6 +24,8 @@
 Describe an auxiliary file in which we make LaTeX write some informations.
 """
 
+import os
+
 from yanntricks.src.Utilities import newlengthName
 from yanntricks.src.NoMathUtilities import logging
 from yanntricks.src.paths_keeper import PathsKeeper
@@ -49,14 +51,42 @@ class AuxFile:
             f"{self.name}.yanntricks.aux")
 
         self._latex_line_list = []
-        self.already_used_interId = []
+        self.already_used_interId = set()
         self.already_warned_CompileYourLaTeXFile = False
 
+        # In-memory copy of the auxiliary file. See `id_values_dict`.
+        self._id_values = None
+        self._id_values_mtime = None
+        self._id_values_to_be_written = False
+
+        # See `box_metrics` and `font_fingerprint`.
+        self._box_metrics = None
+        self._box_metrics_opened = False
+        self._fingerprint = None
+        self._fingerprint_text = None
+        self._fingerprint_asked = False
+        self._stored_interId = set()
+
         # Able to retrieve the tex expression from the hash. See 2576-2197
         # Be careful : this dictionary stores 'unicode' objects as values,
         # while hashlib wants 'str' and some functions are passing 'str'.
         self.interId_to_tex_expression = {}
 
+    @property
+    def box_metrics(self):
+        """
+        The box metrics database of the main LaTeX directory, or None
+        when it is disabled.
+
+        It is opened on first use, so that the paths are not read
+        at the creation of the picture.
+        """
+        if not self._box_metrics_opened:
+            from yanntricks.src.box_metrics import box_metrics_cache
+            self._box_metrics = box_metrics_cache(self.paths)
+            self._box_metrics_opened = True
+        return self._box_metrics
+
     def CounterId(self, counter_name):
         return f"Counter{self.name}{counter_name}"
 
@@ -102,12 +132,32 @@ class AuxFile:
         self.add_latex_line(
             r"\immediate\write\{}{{{}:{}-}}".format(self.newwriteName, Id, value))
 
+    def _aux_file_mtime(self):
+        """Return the modification time of the file or None."""
+        try:
+            return os.path.getmtime(self.interWriteFile.from_sage())
+        except OSError:
+            return None
+
     def id_values_dict(self):
         """
-        Build the dictionary of stored values in the auxiliary file
-        and rewrite that file.
+        Build the dictionary of stored values in the auxiliary file.
+
+        The file is parsed only once and the result is kept in memory.
+        It is parsed again only when its modification time changes,
+        that is when LaTeX wrote it in the meantime.
+
+        The file itself is rewritten (cleaned) only once, by
+        `write_id_values`, from `Figure.write_the_file`.
         """
+        mtime = self._aux_file_mtime()
+        if self._id_values is not None and mtime == self._id_values_mtime:
+            return self._id_values
+
         d = {}
+        self._id_values = d
+        self._id_values_mtime = mtime
+        self._id_values_to_be_written = False
         try:
             f = open(self.interWriteFile.from_sage(), "r")
         except IOError:
@@ -118,23 +168,46 @@ class AuxFile:
                         pspict=self.picture)
                 self.already_warned_CompileYourLaTeXFile = True
             return d
-        idlist = f.read().replace('\n', '').replace(
+        with self.picture.instrumentation.phase("AuxFile read"):
+            text = f.read()
+            f.close()
+        idlist = text.replace('\n', '').replace(
             ' ', '').replace('\\par', '').split("-")
-        f.close()
 
         for els in idlist[0:-1]:
             key = els.split(":")[0]
             value = els.split(':')[1]
             d[key] = value
 
-        with open(self.interWriteFile.from_sage(), "w") as f:
-            for k in d:
-                f.write("%s:%s-\n" % (k, d[k]))
-
+        self._id_values_to_be_written = text != self._id_values_text()
         return d
 
+    def _id_values_text(self):
+        """Return the content of the cleaned auxiliary file."""
+        return "".join("%s:%s-\n" % (k, v)
+                       for k, v in self._id_values.items())
+
+    def write_id_values(self):
+        """
+        Rewrite the auxiliary file from the in-memory dictionary.
+
+        Nothing is written if the file was never read or if it is
+        already clean.
+        The new values of the box metrics database are written too.
+        """
+        if self._box_metrics is not None:
+            self._box_metrics.commit()
+        if self._id_values is None or not self._id_values_to_be_written:
+            return
+        with self.picture.instrumentation.phase("AuxFile write"):
+            with open(self.interWriteFile.from_sage(), "w") as f:
+                f.write(self._id_values_text())
+        self._id_values_mtime = self._aux_file_mtime()
+        self._id_values_to_be_written = False
+
     def get_Id_value(self, Id, default_value=0):
-        if Id not in self.id_values_dict():
+        id_values = self.id_values_dict()
+        if Id not in id_values:
 
             if not self.already_warned_CompileYourLaTeXFile:
                 logging(self.picture.name+"-----")
@@ -150,8 +223,68 @@ class AuxFile:
 
                 self.already_warned_CompileYourLaTeXFile = True
             return default_value
-        value = self.id_values_dict()[Id]
-        return value
+        return id_values[Id]
+
+    def font_fingerprint(self):
+        """
+        Return a fingerprint of the font in which LaTeX measures the boxes.
+
+        LaTeX is asked to write some dimensions of the current font
+        in the auxiliary file of each picture. The fingerprint is the
+        hash of them.
+
+        Return None as long as the auxiliary file does not contain
+        them, or when the box metrics database is disabled.
+        """
+        if self.box_metrics is None:
+            return None
+        if not self._fingerprint_asked:
+            self._fingerprint_asked = True
+            self.makeWriteValue("FontFingerprint",
+                                r"\the\fontdimen6\font,"
+                                r"\the\fontdimen5\font,"
+                                r"\the\fontdimen2\font")
+        value = self.id_values_dict().get("FontFingerprint")
+        if value is None:
+            return None
+        if value != self._fingerprint_text:
+            self._fingerprint_text = value
+            self._fingerprint = text_to_hexdigest(value)
+            self._stored_interId = set()
+            self.box_metrics.set_document_fingerprint(
+                str(self.paths["main_tex"]), self._fingerprint)
+        return self._fingerprint
+
+    def get_box_value(self, interId, default_value):
+        """
+        Return the value of a box dimension.
+
+        Look first in the auxiliary file, then in the box metrics
+        database.
+
+        The values found in the auxiliary file are recorded in the
+        database for the other pictures, but only when the font
+        fingerprint was read in the same auxiliary file.
+        Before that, the database is read with the last fingerprint
+        seen for the document.
+        """
+        fingerprint = self.font_fingerprint()
+        id_values = self.id_values_dict()
+        if interId in id_values:
+            value = id_values[interId]
+            if fingerprint is not None \
+                    and interId not in self._stored_interId:
+                self.box_metrics.store(fingerprint, interId, value)
+                self._stored_interId.add(interId)
+            return value
+        if fingerprint is None and self.box_metrics is not None:
+            fingerprint = self.box_metrics.document_fingerprint(
+                str(self.paths["main_tex"]))
+        if fingerprint is not None:
+            value = self.box_metrics.get(fingerprint, interId)
+            if value is not None:
+                return value
+        return self.get_Id_value(interId, default_value=default_value)
 
     def get_counter_value(self, counter_name, default_value=0):
         """
@@ -205,8 +338,8 @@ class AuxFile:
             self.add_latex_line(
                 r"\immediate\write\{}{{{}:{}-}}".format(self.newwriteName, interId, value))
 
-            self.already_used_interId.append(interId)
-        read_value = self.get_Id_value(interId, default_value=default_value)
+            self.already_used_interId.add(interId)
+        read_value = self.get_box_value(interId, default_value)
         dimenPT = float(read_value.replace("pt", ""))
         # 30 is the conversion factor : 1pt=(1/3)mm
         return (dimenPT)/30
@@ -118,7 +118,7 @@ class Axes(ObjectGraph):
             BB.append(self.pspict.math_bounding_box(), pspict)
         # Update the single axes taking the content of pspict into account.
         self.add_bounding_box(BB, pspict)
-        BB.check_too_large()
+        BB.check_too_large(pspict, obj=self)
         return BB
 
     def _math_bounding_box(self, pspict=None):
@@ -131,7 +131,7 @@ class Axes(ObjectGraph):
             BB.append(self.pspict.math_bounding_box(), pspict)
         # Updates the single axes taking the content of pspict into account.
         self.add_bounding_box(BB, pspict)
-        BB.check_too_large()
+        BB.check_too_large(pspict, obj=self)
         return BB
 
     def action_on_pspict(self, language=None, pspict=None):
@@ -18,6 +18,8 @@
 # copyright (c) Laurent Claessens, 2010-2017, 2019
 # email: laurent@claessens-donadello.eu
 
+import numpy
+
 from sage.all import symbolic_expression
 from sage.all import lazy_attribute, numerical_approx, var
 
@@ -25,6 +27,7 @@ from yanntricks.src.ObjectGraph import ObjectGraph
 from yanntricks.src.parameters.Parameters import Parameters
 from yanntricks.src.point import Point
 from yanntricks.src.Utilities import EnsurephyFunction
+from yanntricks.src.Utilities import two_variables_values
 from yanntricks.src.NoMathUtilities import first_bracket
 
 
@@ -204,6 +207,19 @@ class GeometricVectorField(object):
                     draw_points.append(Point(xx, yy))
         return VectorFieldGraph(self, draw_points=draw_points)
 
+    def streamlines(self, xrange, yrange, seeds=None, density=5, step=None,
+                    max_steps=1000, both_directions=True):
+        """
+        return the graph of the streamlines of self in the given ranges.
+
+        See :class:`StreamlinesGraph` for the arguments.
+        """
+        from yanntricks.src.streamlines import StreamlinesGraph
+        return StreamlinesGraph(self, xrange, yrange, seeds=seeds,
+                                density=density, step=step,
+                                max_steps=max_steps,
+                                both_directions=both_directions)
+
     def __call__(self, a, b=None):
         """
         return the affine vector at point (a,b).
@@ -260,14 +276,74 @@ class VectorFieldGraph(ObjectGraph, GeometricVectorField):
         self.vector_field = F
         self.F = self.vector_field
         self.draw_points = draw_points
+        # See `normalize`.
+        self.arrow_length = None
+        self.proportional_arrows = False
+
+    def normalize(self, length=1, proportional=False):
+        """
+        Rescale the drawn vectors.
+
+        - If `proportional` is False, all the vectors get the
+          length `length`.
+        - If `proportional` is True, the vectors are all multiplied
+          by the same factor, such that the longest one gets the
+          length `length`.
+
+        The vanishing vectors are not modified.
+        """
+        self.arrow_length = length
+        self.proportional_arrows = proportional
+        # The vectors computed before are not valid anymore.
+        self.__dict__.pop("draw_vectors", None)
+
+    @lazy_attribute
+    def field_values(self):
+        """
+        The arrays `(xs, ys, vx, vy)` of the initial points of the
+        vectors and of the values of the field at these points.
+
+        The field is evaluated on all the points at once.
+        """
+        x, y = var('x,y')
+        xs = numpy.array([float(P.x) for P in self.draw_points], dtype=float)
+        ys = numpy.array([float(P.y) for P in self.draw_points], dtype=float)
+        vx = two_variables_values(self.fx(x, y), x, y, xs, ys)
+        vy = two_variables_values(self.fy(x, y), x, y, xs, ys)
+        return xs, ys, vx, vy
+
+    def vector_arrays(self):
+        """
+        Return the arrays `(xs, ys, vx, vy)` of the vectors to be drawn,
+        taking `normalize` into account.
+
+        The vectors that cannot be computed are removed.
+        """
+        xs, ys, vx, vy = self.field_values
+        finite = numpy.isfinite(vx) & numpy.isfinite(vy)
+        xs, ys, vx, vy = xs[finite], ys[finite], vx[finite], vy[finite]
+        if self.arrow_length is not None and len(vx) > 0:
+            norms = numpy.hypot(vx, vy)
+            if self.proportional_arrows:
+                factor = numpy.full_like(norms, self.arrow_length/norms.max()
+                                         if norms.max() > 0 else 1)
+            else:
+                factor = numpy.ones_like(norms)
+                nonzero = norms > 0
+                factor[nonzero] = self.arrow_length/norms[nonzero]
+            vx = vx*factor
+            vy = vy*factor
+        return xs, ys, vx, vy
 
     @lazy_attribute
     def draw_vectors(self):
         """
         the list of vectors to be drawn
         """
-        l = []
-        return [self(P) for P in self.draw_points]
+        from yanntricks.src.affine_vector import AffineVector
+        xs, ys, vx, vy = self.vector_arrays()
+        return [AffineVector(Point(a, b), Point(a+u, b+v))
+                for a, b, u, v in zip(xs, ys, vx, vy)]
 
     @lazy_attribute
     def pos_x(self):
@@ -334,16 +410,39 @@ class VectorFieldGraph(ObjectGraph, GeometricVectorField):
     def _bounding_box(self, pspict=None):
         from yanntricks.src.BoundingBox import BoundingBox
         bb = BoundingBox()
-        for v in self.draw_vectors:
-            bb.append(v, pspict)
+        xs, ys, vx, vy = self.vector_arrays()
+        if len(xs) > 0:
+            ends_x = xs+vx
+            ends_y = ys+vy
+            bb.AddBB(BoundingBox(xmin=float(min(xs.min(), ends_x.min())),
+                                 xmax=float(max(xs.max(), ends_x.max())),
+                                 ymin=float(min(ys.min(), ends_y.min())),
+                                 ymax=float(max(ys.max(), ends_y.max()))))
         return bb
 
     def latex_code(self, language=None, pspict=None):
-        code = []
-        for v in self.draw_vectors:
-            v.parameters = self.parameters.copy()
-            code.append(v.latex_code(language=language, pspict=pspict))
-        return "\n".join(code)
+        """
+        Return the code of all the vectors in one '\\draw'.
+
+        Each vector is an 'edge' of the path, so that each one gets
+        its arrow tip.
+        """
+        from yanntricks.src.affine_vector import AffineVector
+        from yanntricks.src.points_array import PointsArray
+        if self.parameters.style == "none":
+            return ""
+        xs, ys, vx, vy = self.vector_arrays()
+        if len(xs) == 0:
+            return ""
+        # The options are the ones of a vector with the parameters
+        # of the field.
+        prototype = AffineVector(Point(0, 0), Point(1, 1))
+        prototype.parameters = self.parameters.copy()
+        params = prototype.params(language="tikz")+",->,>=latex"
+        starts = PointsArray(xs, ys).coordinates(digits=5, pspict=pspict)
+        ends = PointsArray(xs+vx, ys+vy).coordinates(digits=5, pspict=pspict)
+        path = " ".join(f"{c1} edge {c2}" for c1, c2 in zip(starts, ends))
+        return "\\draw [{}] {};".format(params, path)
 
 
 def draw_to_fill(text):
@@ -19,13 +19,41 @@
 # email: laurent@claessens-donadello.eu
 
 from yanntricks.src.ObjectGraph import ObjectGraph
-from yanntricks.src.Utilities import check_too_large
+from yanntricks.src.Exceptions import TooLargeBBException
 from yanntricks.src.Exceptions import MissingPictureException
 from yanntricks.src.Exceptions import NoMathBoundingBox
 
 
 dprint = print
 
+
+def _to_float(x):
+    """
+    Return the float value of `x`.
+
+    This is the only place where a (possibly symbolic) coordinate
+    is converted; the bounding box then only compares floats.
+    """
+    try:
+        return float(x)
+    except TypeError:
+        from yanntricks.src.Numerical import numerical_approx
+        return float(numerical_approx(x))
+
+
+def _float_property(name):
+    """A coordinate of the bounding box, stored as a float."""
+    attr = "_" + name
+
+    def getter(self):
+        return getattr(self, attr)
+
+    def setter(self, value):
+        setattr(self, attr, _to_float(value))
+
+    return property(getter, setter)
+
+
 class BoundingBox(ObjectGraph):
     r"""
     Represent the bounding box of something.
@@ -48,7 +76,15 @@ class BoundingBox(ObjectGraph):
     parameters `xunit`/`yunit` that are not yet fixed at the time of `DrawGraph`.
 
     If 'is_math' is True, it always tries to include 'math_bounding_box' instead of 'bounding_box'
+
+    The coordinates are stored as floats: they are converted when they
+    are set, so that merging two bounding boxes only compares floats.
     """
+    xmin = _float_property("xmin")
+    xmax = _float_property("xmax")
+    ymin = _float_property("ymin")
+    ymax = _float_property("ymax")
+
     def __init__(self, P1=None, P2=None, xmin=1000, xmax=-1000, ymin=1000, ymax=-1000, parent=None, mother=None, is_math=False):
         self.xmin = xmin
         self.xmax = xmax
@@ -80,8 +116,9 @@ class BoundingBox(ObjectGraph):
                 raise NoMathBoundingBox(obj, fun)
         else:
             if check_too_large:
-                bb.check_too_large(pspict)
-            self.AddBB(bb)
+                self.AddBB(bb, pspict=pspict, obj=bb)
+            else:
+                self.AddBB(bb)
 
     def add_math_object(self, obj, pspict=None, check_too_large=True):
         try:
@@ -92,11 +129,36 @@ class BoundingBox(ObjectGraph):
             print("Object", obj)
             print("of type", type(obj))
 
-    def check_too_large(self, pspict=None):
+    def check_too_large(self, pspict=None, obj=None):
         """
-        Raise a ValueError if the bounding box is too large.
+        Raise a TooLargeBBException if the bounding box is too large.
+
+        The bounds are compared with the acceptable ones of `pspict`
+        (`mx_acceptable_BB`, ...). Nothing is checked without `pspict`.
+
+        - `obj` : the object reported in the exception. By default,
+            the bounding box itself.
         """
-        check_too_large(self, pspict=pspict)
+        if not pspict:
+            return
+        if obj is None:
+            obj = self
+        if self._xmin < pspict.mx_acceptable_BB:
+            raise TooLargeBBException(obj=obj, faulty="xmin",
+                                      acceptable=pspict.mx_acceptable_BB,
+                                      got=self._xmin)
+        if self._ymin < pspict.my_acceptable_BB:
+            raise TooLargeBBException(obj=obj, faulty="ymin",
+                                      acceptable=pspict.my_acceptable_BB,
+                                      got=self._ymin)
+        if self._xmax > pspict.Mx_acceptable_BB:
+            raise TooLargeBBException(obj=obj, faulty="xmax",
+                                      acceptable=pspict.Mx_acceptable_BB,
+                                      got=self._xmax)
+        if self._ymax > pspict.My_acceptable_BB:
+            raise TooLargeBBException(obj=obj, faulty="ymax",
+                                      acceptable=pspict.My_acceptable_BB,
+                                      got=self._ymax)
 
     def getEdge(self, pos):
         from yanntricks.src.segment import Segment
@@ -151,20 +213,31 @@ class BoundingBox(ObjectGraph):
         self.extraX_right(l)
 
     def addX(self, x):
-        self.xmin = min(self.xmin, x)
-        self.xmax = max(self.xmax, x)
+        x = _to_float(x)
+        self._xmin = min(self._xmin, x)
+        self._xmax = max(self._xmax, x)
 
     def addY(self, y):
-        self.ymin = min(self.ymin, y)
-        self.ymax = max(self.ymax, y)
+        y = _to_float(y)
+        self._ymin = min(self._ymin, y)
+        self._ymax = max(self._ymax, y)
 
-    def AddBB(self, bb):
-        from yanntricks.src.Numerical import numerical_min
-        from yanntricks.src.Numerical import numerical_max
-        self.xmin = numerical_min(self.xmin, bb.xmin)
-        self.ymin = numerical_min(self.ymin, bb.ymin)
-        self.xmax = numerical_max(self.xmax, bb.xmax)
-        self.ymax = numerical_max(self.ymax, bb.ymax)
+    def AddBB(self, bb, pspict=None, obj=None):
+        """
+        Enlarge the bounding box in order to contain `bb`.
+
+        If `pspict` is given, first check that `bb` fits in the
+        acceptable bounds of `pspict` (see `check_too_large`).
+        """
+        if not isinstance(bb, BoundingBox):
+            bb = BoundingBox(xmin=bb.xmin, xmax=bb.xmax,
+                             ymin=bb.ymin, ymax=bb.ymax)
+        if pspict:
+            bb.check_too_large(pspict, obj=obj)
+        self._xmin = min(self._xmin, bb._xmin)
+        self._ymin = min(self._ymin, bb._ymin)
+        self._xmax = max(self._xmax, bb._xmax)
+        self._ymax = max(self._ymax, bb._ymax)
 
     def append(self, graph, pspict=None):
         if isinstance(graph, list):
@@ -173,10 +246,8 @@ class BoundingBox(ObjectGraph):
             raise MissingPictureException(
                 "You should provide a pspict in order to add this object to a bounding box.")
         if self.is_math:
-            bb = graph.math_bounding_box(pspict=pspict)
             self.AddBB(graph.math_bounding_box(pspict=pspict))
         else:
-            bb = graph.bounding_box(pspict=pspict)
             self.AddBB(graph.bounding_box(pspict=pspict))
 
     def add_math_graph(self, graphe, pspict=None):
@@ -208,6 +279,9 @@ class BoundingBox(ObjectGraph):
     def math_bounding_box(self, pspict=None):
         return self.bounding_box(pspict)
 
+    def forget_bounding_boxes(self):
+        """A bounding box is its own bounding box : nothing to forget."""
+
     def copy(self):
         return BoundingBox(xmin=self.xmin, ymin=self.ymin, xmax=self.xmax, ymax=self.ymax)
 
@@ -10,6 +10,7 @@ from sage.all import pi, PolynomialRing, QQ, symbolic_expression
 from yanntricks.src.radian_unit import radian
 from yanntricks.src.degree_unit import degree
 from yanntricks.src.point import Point
+from yanntricks.src.point import numeric_points
 from yanntricks.src.AxesGraph import Axes
 from yanntricks.src.Utilities import Intersection
 from yanntricks.src.GridGraph import Grid
@@ -1035,12 +1036,12 @@ def ImplicitCurve(f, xrange, yrange, plot_points=100):
     <BoundingBox mx=-1.414,Mx=1.414; my=-1.414,My=1.414>
 
 
-    Using Sage's implicit_curve and matplotlib, a list of points "contained" in the curve is created. The bounding_box is calculated from that list. The pstricsk code generated will be an interpolation curve passing trough all these points.
+    The function is evaluated on a grid and the marching squares give lists of points "contained" in the curve. The bounding_box is calculated from these lists. The tikz code generated will be an interpolation curve passing trough all these points.
     """
     from yanntricks.src.ImplicitCurve import GeometricImplicitCurve
     return GeometricImplicitCurve(f).graph(xrange,
                                            yrange,
-                                           plot_points=100)
+                                           plot_points=plot_points)
 
 
 class ObliqueProjection:
@@ -1165,6 +1166,42 @@ def VectorField(fx, fy, xvalues=None, yvalues=None, draw_points=None):
     return GeometricVectorField(fx, fy).graph(xvalues, yvalues, draw_points)
 
 
+def Streamlines(fx, fy, xrange, yrange, seeds=None, density=5, step=None,
+                max_steps=1000, both_directions=True):
+    """
+    return the streamlines of the vector field (fx, fy).
+
+    INPUT:
+
+    - ``fx,fy`` - two functions
+
+    - ``xrange``, ``yrange`` - the ranges as `(x, -5, 5)`; the
+                    streamlines stop when they leave this rectangle.
+
+    OPTIONAL :
+
+    - ``seeds`` - the list of the points from which the streamlines
+                    start. By default a grid of `density` x `density`
+                    points in the rectangle.
+
+    See :class:`StreamlinesGraph` for the other arguments.
+
+    EXAMPLES::
+
+        sage: from yanntricks import *
+        sage: x,y=var('x,y')
+        sage: F=Streamlines(-y,x,(x,-2,2),(y,-2,2),density=3)
+        sage: len(F.paths)
+        8
+
+    The ninth seed is the origin, where the field vanishes.
+    """
+    from yanntricks.src.BasicGeometricObjects import GeometricVectorField
+    return GeometricVectorField(fx, fy).streamlines(
+        xrange, yrange, seeds=seeds, density=density, step=step,
+        max_steps=max_steps, both_directions=both_directions)
+
+
 def Vector(A, B=None):
     """
     Return an affine vector from (0,0) to the given point.
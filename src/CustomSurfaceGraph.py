@@ -73,10 +73,15 @@ class CustomSurface(ObjectGraph):
             color = self.parameters.hatch.color
         if self.parameters._filled or self.parameters._hatched:
             l = []
+            from yanntricks.src.points_array import PointsArray
             for obj in self.graphList:
                 try:
-                    l.extend([p.coordinates(digits=5, pspict=pspict)
-                              for p in obj.representative_points()])
+                    points = obj.representative_points()
+                    if isinstance(points, PointsArray):
+                        l.extend(points.coordinates(digits=5, pspict=pspict))
+                    else:
+                        l.extend([p.coordinates(digits=5, pspict=pspict)
+                                  for p in points])
                 except AttributeError:
                     print("The object "+obj +
                           " seems to have no 'representative_points' method")
@@ -23,6 +23,28 @@
 LINEAR_PLOTPOINTS = 100
 CURVATURE_PLOTPOINTS = 0
 
+# Adaptive sampling of the curves (see GenericCurve.adaptive_sampling).
+# The tolerance is the maximal distance, in centimetres, between the
+# curve and the drawn polyline. With None, the curves are sampled with
+# LINEAR_PLOTPOINTS regularly spaced points.
+ADAPTIVE_TOLERANCE = None
+ADAPTIVE_INITIAL_PLOTPOINTS = 17
+ADAPTIVE_MAX_PLOTPOINTS = 2000
+
+# Number of panels of the tables of integrals used to place regularly
+# spaced points (arc length, curvature) on the curves.
+INTEGRAL_TABLE_PANELS = 1000
+
+# The lists of points of the curves are simplified before being written
+# in the tikz code : the removed points are at most at this distance
+# (in centimetres) of the drawn line. None means no simplification.
+# See Picture.simplification_tolerance.
+SIMPLIFICATION_TOLERANCE = None
+
+# Number of points where a function is first evaluated when searching
+# all its roots on an interval (see SmallComputations.find_roots).
+ROOT_FINDING_SAMPLES = 1000
+
 CIRCLE_LINEAR_PLOTPOINTS = 50
 CIRCLE3D_LINEAR_PLOTPOINTS = 50
 
@@ -34,3 +56,16 @@ MATRIX_ELEMENT_SECOND_BOX_Y_BORDER = 0.05
 
 # Files
 LOGGING_FILENAME = "yanntricks.log"
+
+# The database of box sizes shared by all the pictures living
+# in the main LaTeX directory, for example
+# "yanntricks.box_metrics.sqlite". None (the default) disables it.
+BOX_METRICS_FILENAME = None
+
+# The record of the figures produced by `FigureGenerationSuite`, allowing
+# to skip the unchanged ones. Set to None in order to disable it.
+FIGURE_CACHE_FILENAME = "yanntricks.figures_cache.json"
+
+# If True, the points hold floats instead of symbolic expressions.
+# See `point.numeric_points`.
+NUMERIC_POINTS = False
@@ -36,8 +36,10 @@ from yanntricks.src.Utilities import latinize
 from yanntricks.src.latex_to_be import pseudo_caption
 from yanntricks.src.Utilities import add_latex_line_entete
 from yanntricks.src.Utilities import init_figure_separator_list
+from yanntricks.src.separator_list import collapse_double_newlines
 from yanntricks.src.Exceptions import PhystricksNoError
 from yanntricks.src.paths_keeper import PathsKeeper
+from yanntricks.src.instrumentation import write_instrumentation
 
 
 dprint = print  #pylint: disable=invalid-name
@@ -63,6 +65,11 @@ class Figure:
             The name of the file in which the data will be written.
     """
 
+    # Set to True by `FigureGenerationSuite`. This has to be a class
+    # attribute: the suite does not see the figures before they are
+    # created by the figure functions.
+    send_noerror = False
+
     def __init__(self, caption, name, filename, script_filename):
         self.script_filename = script_filename
         self.caption = caption
@@ -75,10 +82,10 @@ class Figure:
         self.record_subfigure = []
         self.record_pspicture = []
         self.child_pspictures = []
-        self.contenu = None
+        # The pieces of the LaTeX code, see `conclude`.
+        self.contenu_chunks = None
         self.rotation_angle = None
 
-        self.send_noerror = False
         self.language = "tikz"
 
         self.specific_needs = ""
@@ -103,6 +110,10 @@ class Figure:
         # comment of the pspict(s) for the sake of tests.
         self.comment_filename = self.filename.abs_path\
                                 .with_suffix(".comment")
+        # The timers of the instrumented pictures, see
+        # `Picture.enable_instrumentation`.
+        self.instrumentation_filename = self.filename.abs_path\
+                                .with_suffix(".instrumentation.json")
 
         # The order of declaration is important, because it
         # is recorded in the Separator.number attribute.
@@ -165,6 +176,14 @@ class Figure:
         pspict.figure_mother = self
         self.record_pspicture.append(pspict)
 
+    def all_pspictures(self):
+        """Iterate over the pictures of self and of its subfigures."""
+        for pspict in self.record_pspicture:
+            yield pspict
+        for ssfig in self.record_subfigure:
+            for pspict in ssfig.record_pspicture:
+                yield pspict
+
     def comments(self):
         a = []
         for pspict in self.child_pspictures:
@@ -209,7 +228,7 @@ class Figure:
 
             pspict.add_latex_line(
                 pspict.auxiliary_file.open_latex_code(), "OPEN_WRITE_AND_LABEL")
-            self.add_latex_line(pspict.latex_code(), "PSPICTURE")
+            self.add_latex_line(pspict.latex_separator_list(), "PSPICTURE")
 
             # For the following big stuff, see the position 170321508
             def_length_tex = r"""                 \makeatletter
@@ -265,10 +284,21 @@ class Figure:
             """ % (self.caption, self.name)
         self.add_latex_line(after_all, "AFTER ALL")
         if self.figure_environment:
-            self.contenu = self.separator_list.code().replace("\n\n", "\n")
+            self.contenu_chunks = self.separator_list.chunks()
         else:
-            self.contenu = self.separator_list.code(
-                not_to_be_used=["BEFORE SUBFIGURES", "AFTER ALL"]).replace("\n\n", "\n")
+            self.contenu_chunks = self.separator_list.chunks(
+                not_to_be_used=["BEFORE SUBFIGURES", "AFTER ALL"])
+
+    @property
+    def contenu(self):
+        """
+        The LaTeX code of the figure, once concluded.
+
+        Prefer `contenu_chunks` : the text is built here.
+        """
+        if self.contenu_chunks is None:
+            return None
+        return "".join(collapse_double_newlines(self.contenu_chunks))
 
     def write_the_file(self):
         """
@@ -276,11 +306,16 @@ class Figure:
 
         Do not write if we are testing.
         It also remove the tikz externalize file.
+
+        The auxiliary files of the pictures are cleaned here, once
+        for all. See `AuxFile.id_values_dict`.
         """
-        # self.contenu is created in self.conclude
-        to_be_written = self.contenu
+        for pspict in self.all_pspictures():
+            pspict.auxiliary_file.write_id_values()
+
+        # self.contenu_chunks is created in self.conclude
         with open(self.filename.abs_path, "w") as f:
-            f.write(to_be_written)
+            f.writelines(collapse_double_newlines(self.contenu_chunks))
         print("--------------- For your LaTeX file ---------------")
         print(self.LaTeX_lines())
         print("---------------------------------------------------")
@@ -289,6 +324,8 @@ class Figure:
 
         with open(self.comment_filename, "w") as f:
             f.write(self.comments())
+        write_instrumentation(self.instrumentation_filename,
+                              self.all_pspictures())
 
         if self.send_noerror:
             raise PhystricksNoError(self)
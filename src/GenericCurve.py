@@ -19,10 +19,45 @@
 # email: laurent@claessens-donadello.eu
 
 import numpy
-from sage.all import RR, numerical_integral, numerical_approx, var
+from sage.all import RR, numerical_integral, numerical_approx
 
 import yanntricks.src.Defaults as Defaults
-from yanntricks.src.Exceptions import ShouldNotHappenException
+
+
+def _chord_error(xs, ys, mxs, mys):
+    """
+    Return the distances between the points (mxs, mys) and the
+    segments joining the consecutive points of (xs, ys).
+
+    The distance is NaN when one of the points is not finite.
+    """
+    ax, ay = xs[:-1], ys[:-1]
+    dx, dy = xs[1:]-ax, ys[1:]-ay
+    px, py = mxs-ax, mys-ay
+    length = numpy.hypot(dx, dy)
+    with numpy.errstate(all="ignore"):
+        error = numpy.where(length > 0,
+                            numpy.abs(dx*py-dy*px)/length,
+                            numpy.hypot(px, py))
+    return error
+
+
+def _numpy_values(fun, values):
+    """
+    Return the array of the values of the function `fun` (of one
+    variable) on the array `values`. NaN where it cannot be computed.
+    """
+    from yanntricks.src.Constructors import phyFunction
+    f = phyFunction(fun)
+    if f.numpy_function is not None:
+        return numpy.array(f.numpy_function(values), dtype=float)
+    result = numpy.full(len(values), numpy.nan)
+    for i, t in enumerate(values):
+        try:
+            result[i] = float(numerical_approx(f(t)))
+        except (TypeError, ValueError, ZeroDivisionError):
+            pass
+    return result
 
 
 class GenericCurve(object):
@@ -35,14 +70,52 @@ class GenericCurve(object):
         self.linear_plotpoints = Defaults.LINEAR_PLOTPOINTS
         self.curvature_plotpoints = Defaults.CURVATURE_PLOTPOINTS
         self.added_plotpoints = []
+        self.adaptive_tolerance = Defaults.ADAPTIVE_TOLERANCE
+        self.adaptive_max_plotpoints = Defaults.ADAPTIVE_MAX_PLOTPOINTS
+        self.visual_units = (1, 1)
         self.pI = pI
         self.pF = pF
         self._representativeParameters = None
         self._representative_points = None
+        # See `cumulative_integral_table`.
+        self._integral_tables = {}
 
     def addPlotPoint(self, x):
         self.added_plotpoints.append(x)
 
+    def adaptive_sampling(self, tolerance, max_plotpoints=None):
+        """
+        Sample the curve adaptively instead of with regularly spaced points.
+
+        The parameter intervals are subdivided until the drawn polyline
+        is at most `tolerance` centimetres away from the curve (taking
+        `xunit` and `yunit` of the picture into account), or until the
+        curve has `max_plotpoints` points.
+
+        With `tolerance=None`, come back to `linear_plotpoints`
+        regularly spaced points.
+        """
+        self.adaptive_tolerance = tolerance
+        if max_plotpoints is not None:
+            self.adaptive_max_plotpoints = max_plotpoints
+        self._representativeParameters = None
+        self._representative_points = None
+
+    def set_visual_units(self, xunit, yunit):
+        """
+        Set the units of the picture in which the curve is drawn.
+
+        The adaptive sampling measures its tolerance in centimetres,
+        so the points are recomputed when the units change.
+        """
+        units = (float(xunit), float(yunit))
+        if units == self.visual_units:
+            return
+        self.visual_units = units
+        if self.adaptive_tolerance:
+            self._representativeParameters = None
+            self._representative_points = None
+
     def getFunctionIntegral(self, fun,  lmin=None, lmax=None):
         """
         Return the integral of 'fun' from 'lmin' to 'lmax'.
@@ -56,50 +129,59 @@ class GenericCurve(object):
     def total_curvature(self):
         return self.getFunctionIntegral(self.curvature)
 
+    def cumulative_integral_table(self, fun, lmin, lmax):
+        """
+        Return the arrays `(params, integrals)` where `integrals[i]` is
+        the integral of `fun` from `lmin` to `params[i]`.
+
+        The integral is computed once with a Gauss-Legendre rule on
+        `Defaults.INTEGRAL_TABLE_PANELS` panels and kept for the next
+        calls with the same `fun`, `lmin` and `lmax`. Since `fun`
+        is non negative (speed, curvature), `integrals` is increasing
+        and can be inverted by interpolation.
+
+        The panels on which `fun` is not finite at some node (like
+        a singular speed or curvature) are integrated with
+        `getFunctionIntegral` instead. A ValueError is raised if
+        that integral is not finite either.
+        """
+        key = (fun, float(lmin), float(lmax))
+        if key not in self._integral_tables:
+            a, b = float(lmin), float(lmax)
+            panels = Defaults.INTEGRAL_TABLE_PANELS
+            params = numpy.linspace(a, b, panels+1)
+            nodes, weights = numpy.polynomial.legendre.leggauss(5)
+            half = (params[1:]-params[:-1])/2
+            centers = (params[1:]+params[:-1])/2
+            t = (centers[:, None]+half[:, None]*nodes[None, :]).ravel()
+            values = _numpy_values(fun, t).reshape(panels, len(nodes))
+            with numpy.errstate(invalid="ignore"):
+                pieces = half*(values*weights[None, :]).sum(axis=1)
+            for i in numpy.flatnonzero(~numpy.isfinite(values).all(axis=1)):
+                pieces[i] = float(self.getFunctionIntegral(
+                    fun, params[i], params[i+1]))
+                if not numpy.isfinite(pieces[i]):
+                    raise ValueError(f"The integral of {fun} between "
+                                     f"{params[i]} and {params[i+1]} "
+                                     f"is not finite.")
+            integrals = numpy.concatenate(([0], numpy.cumsum(pieces)))
+            self._integral_tables[key] = (params, integrals)
+        return self._integral_tables[key]
+
     def getNextRegularFunctionParameters(self, lmin, lmax, fun, df, xunit=1, yunit=1):
         """
         Return a value 'nl' of the parameter such that the integral of 'fun' from 'lmin' to 'nl' is 'df'.
 
         `lmax` - is the maximal value of the parameter. If the interval [lmin,lmax]  reveals to be too small, return 'None'
 
+        `xunit`, `yunit` - deprecated and ignored.
         """
-        # Vcurve is the curve as visually seen taking the dilatation
-        # into account.
-        from yanntricks.src.Constructors import phyFunction
-        from yanntricks.src.Constructors import ParametricCurve
-        x = var('x')
-        Vf1 = phyFunction(self.f1(xunit*x))
-        Vf2 = phyFunction(self.f2(yunit*x))
-        Vcurve = ParametricCurve(Vf1, Vf2)
-
-        prop_precision = float(df)/100      # precision of the interval
-        if prop_precision == 0:
+        if float(df) == 0:
             raise ValueError("prop_precision is zero.")
-
-        # We'll perform a dichotomy method.
-        # 'too_large' is a value of the parameter we know to be too large
-        # 'too_small' is a value of the parameter we know to be too small
-        # 'ell' is the median value on which the condition is tested.
-        # The dichotomy method consist to make 'too_large' or 'too_small' become 'ell' and to recalculate a new 'ell'
-
-        too_small = lmin
-        too_large = lmax
-        if Vcurve.getFunctionIntegral(fun, too_small, too_large) < df:
+        params, integrals = self.cumulative_integral_table(fun, lmin, lmax)
+        if integrals[-1] < df:
             return None
-
-        max_iter = 100
-        done_iter = 0
-        while done_iter < max_iter:
-            ell = (too_large+too_small)/2
-            done_iter += 1
-            integral = Vcurve.getFunctionIntegral(fun, lmin, ell)
-            if abs(integral-df) < prop_precision:
-                return ell
-            if integral > df:
-                too_large = ell
-            if integral < df:
-                too_small = ell
-        raise ShouldNotHappenException("I give up with this dichotomy")
+        return RR(numpy.interp(float(df), integrals, params))
 
     def getRegularFunctionParameters(self, lmin, lmax, fun, df, initial_point=False, final_point=False, xunit=1, yunit=1, numerical=True):
         """
@@ -107,32 +189,34 @@ class GenericCurve(object):
 
         We return a list of points  x_i on the curve such that the integral of 'fun' from x_i to x_{i+1} is df.
 
-        This is a visual function in the sense that the curve is first transformed in order to take the dilatation into account.
+        The values are obtained by inverting the table of
+        `cumulative_integral_table`, so that asking the parameters
+        for several `df` only integrates `fun` once.
 
         EXAMPLE :
 
         Taking as 'fun' the norm of the tangent vector, one consider the arc length
+
+        `xunit`, `yunit` - deprecated and ignored.
         """
-        prop_precision = float(df)/100      # precision of the interval
-        if prop_precision == 0:
+        df = float(df)
+        if df == 0:
             raise ValueError("prop_precision is zero.")
-
-        # Vcurve is the curve as visually seen taking the dilatation into account.
-        Vcurve = self.visualParametricCurve(xunit, yunit)
+        params, integrals = self.cumulative_integral_table(fun, lmin, lmax)
 
         PIs = []            # The list of selected values of the parameter
         if initial_point:
             PIs.append(lmin)
         if final_point:
             PIs.append(lmax)
-        ll = lmin
-        while ll is not None:
-            ll = Vcurve.getNextRegularFunctionParameters(
-                ll, lmax, fun, df, xunit=1, yunit=1)
-            if ll is not None:
-                if numerical:
-                    ll = numerical_approx(ll)
-                PIs.append(ll)
+        # The small margin avoids to lose the last point because
+        # of rounding when the total is a multiple of df.
+        n = int(numpy.floor(integrals[-1]/df+1e-9))
+        targets = df*numpy.arange(1, n+1)
+        for ll in numpy.interp(targets, integrals, params):
+            if numerical:
+                ll = RR(ll)
+            PIs.append(ll)
         return PIs
 
     def getRegularLengthParameters(self, mll, Mll, dl, initial_point=False, final_point=False, xunit=1, yunit=1, numerical=True):
@@ -151,14 +235,15 @@ class GenericCurve(object):
 
         - ``final_point`` - (default=False) it True, return also the final parameter (i.e. Mll)
 
+        - ``xunit``, ``yunit`` - deprecated and ignored.
         """
-        return self.getRegularFunctionParameters(mll, Mll, self.speed, dl, initial_point=initial_point, final_point=final_point, xunit=xunit, yunit=yunit)
+        return self.getRegularFunctionParameters(mll, Mll, self.speed, dl, initial_point=initial_point, final_point=final_point)
 
     def getRegularCurvatureParameter(self, mll, Mll, dl, initial_point=False, final_point=False, xunit=1, yunit=1):
         """ 
         Same thing as `getRegularLengthParameters`, but with the curvature instead of the arc length.
         """
-        return self.getRegularFunctionParameters(mll, Mll, self.curvature, dl, initial_point=initial_point, final_point=final_point, xunit=xunit, yunit=yunit)
+        return self.getRegularFunctionParameters(mll, Mll, self.curvature, dl, initial_point=initial_point, final_point=final_point)
 
     def representativeParameters(self):
         if self._representativeParameters:
@@ -187,8 +272,11 @@ class GenericCurve(object):
             # fake imaginary part. It happens for the function
             # sqrt(cos(x)) with x=3*pi/2.
 
-            linear_Llam = [RR(s) for s in numpy.linspace(
-                initial, final, self.linear_plotpoints)]
+            if self.adaptive_tolerance:
+                linear = self.adaptiveParameters(initial, final)
+            else:
+                linear = numpy.linspace(initial, final, self.linear_plotpoints)
+            linear_Llam = [RR(s) for s in linear]
         Llam = []
         Llam.extend(self.added_plotpoints)
         Llam.extend(linear_Llam)
@@ -202,12 +290,122 @@ class GenericCurve(object):
         self._representativeParameters = Llam
         return Llam
 
+    def adaptiveParameters(self, initial, final):
+        """
+        Return the values of the parameter chosen by the adaptive sampling.
+
+        Starting from `ADAPTIVE_INITIAL_PLOTPOINTS` regularly spaced
+        values, each interval whose midpoint is farther than
+        `adaptive_tolerance` from the chord is cut in two. When there
+        are more such intervals than allowed by
+        `adaptive_max_plotpoints`, the ones with the largest error are
+        cut first.
+
+        The distances are visual: the coordinates are multiplied by
+        `visual_units` (see `set_visual_units`).
+        """
+        tolerance = float(self.adaptive_tolerance)
+        max_points = max(int(self.adaptive_max_plotpoints), 2)
+        n = min(Defaults.ADAPTIVE_INITIAL_PLOTPOINTS, max_points)
+        ts = numpy.linspace(float(initial), float(final), n)
+        xs, ys = self._visual_coordinates(ts)
+        min_width = abs(float(final)-float(initial))*1e-12
+        while len(ts) < max_points:
+            mid = (ts[:-1]+ts[1:])/2
+            mxs, mys = self._visual_coordinates(mid)
+            error = _chord_error(xs, ys, mxs, mys)
+            error[(ts[1:]-ts[:-1]) <= min_width] = 0
+            to_cut = numpy.flatnonzero(error > tolerance)
+            if len(to_cut) == 0:
+                break
+            room = max_points-len(ts)
+            if len(to_cut) > room:
+                to_cut = numpy.sort(
+                    to_cut[numpy.argsort(-error[to_cut])[:room]])
+            ts = numpy.insert(ts, to_cut+1, mid[to_cut])
+            xs = numpy.insert(xs, to_cut+1, mxs[to_cut])
+            ys = numpy.insert(ys, to_cut+1, mys[to_cut])
+        return ts
+
+    def _visual_coordinates(self, params):
+        """
+        Return the arrays of the visual coordinates of the points
+        for the given array of parameters.
+
+        The points which cannot be evaluated get NaN coordinates.
+        """
+        xunit, yunit = self.visual_units
+        functions = self.numpy_functions()
+        if functions is not None:
+            xs = numpy.array(functions[0](params), dtype=float)
+            ys = numpy.array(functions[1](params), dtype=float)
+        else:
+            xs = numpy.full(len(params), numpy.nan)
+            ys = numpy.full(len(params), numpy.nan)
+            for i, llam in enumerate(params):
+                P = self.get_point(llam, advised=False)
+                try:
+                    xs[i] = float(numerical_approx(P.x))
+                    ys[i] = float(numerical_approx(P.y))
+                except TypeError:
+                    pass
+        return xs*xunit, ys*yunit
+
+    def numpy_functions(self):
+        """
+        Return the functions giving the coordinates of the points of
+        the curve from a numpy array of values of the parameter.
+
+        Return None when the curve cannot be evaluated numerically;
+        then the points are computed one by one with `get_point`.
+        """
+        return None
+
     def representative_points(self):
-        from  yanntricks.src.Utilities import test_imaginary_part_point
+        """
+        Return the points of the curve for the parameters given by
+        `representativeParameters`.
+
+        When the curve can be evaluated numerically, the result is a
+        `PointsArray`; all the parameters are evaluated in one call.
+        """
         if self._representative_points is not None:
             return self._representative_points
 
         rp = self.representativeParameters()
+        functions = self.numpy_functions()
+        pl = None
+        if functions is not None:
+            pl = self._numpy_representative_points(rp, functions)
+        if pl is None:
+            pl = self._symbolic_representative_points(rp)
+        self._representative_points = pl
+        return pl
+
+    def _numpy_representative_points(self, rp, functions):
+        """
+        Return the `PointsArray` of the points for the parameters `rp`.
+
+        The points on which the numerical evaluation fails (NaN, as an
+        example when a small imaginary part appears) are computed with
+        `get_point`. Return None if one of them is not real.
+        """
+        from yanntricks.src.Utilities import test_imaginary_part_point
+        from yanntricks.src.points_array import PointsArray
+        params = numpy.array([float(s) for s in rp])
+        xs = numpy.array(functions[0](params), dtype=float)
+        ys = numpy.array(functions[1](params), dtype=float)
+        for i in numpy.flatnonzero(~(numpy.isfinite(xs)&numpy.isfinite(ys))):
+            isreal, Q = test_imaginary_part_point(
+                self.get_point(rp[i], advised=False))
+            if not isreal:
+                return None
+            xs[i] = float(Q.x)
+            ys[i] = float(Q.y)
+        return PointsArray(xs, ys)
+
+    def _symbolic_representative_points(self, rp):
+        from yanntricks.src.Utilities import test_imaginary_part_point
         pts = [self.get_point(x, advised=False) for x in rp]
 
         pl = []
@@ -217,7 +415,6 @@ class GenericCurve(object):
                 print(
                     "There is a not so small imaginary part ... Prepare to crash or something")
             pl.append(Q)
-        self._representative_points = pl
         return pl
 
     def get_minmax_data(self, start=None, end=None):
@@ -233,10 +430,12 @@ class GenericCurve(object):
 
         A dictionary
         """
-        x_list = [numerical_approx(P.x, prec=30)
-                  for P in self.representative_points()]
-        y_list = [numerical_approx(P.y, prec=30)
-                  for P in self.representative_points()]
+        from yanntricks.src.points_array import PointsArray
+        points = self.representative_points()
+        if isinstance(points, PointsArray):
+            return points.minmax_data()
+        x_list = [numerical_approx(P.x, prec=30) for P in points]
+        y_list = [numerical_approx(P.y, prec=30) for P in points]
         d = {}
         d['xmin'] = min(x_list)
         d['xmax'] = max(x_list)
@@ -16,6 +16,8 @@
 # copyright (c) Laurent Claessens, 2009-2017, 2019
 # email: laurent@claessens-donadello.eu
 
+import numpy
+
 from yanntricks.src.ObjectGraph import ObjectGraph
 from yanntricks.src.segment import Segment
 from yanntricks.src.point import Point
@@ -83,6 +85,8 @@ class Grid(ObjectGraph):
         self.border = Segment(Point(0, 1), Point(1, 1))
         self.border.parameters.color = "gray"
         self.border.parameters.style = "dotted"
+        # The lines computed when the grid is drawn, see `action_on_pspict`.
+        self._drawn_line_groups = None
 
     # This method is for the sake of "Special cases aren't special enough to break the rules."
     def _bounding_box(self, pspict=None):
@@ -101,58 +105,105 @@ class Grid(ObjectGraph):
     def optionsParams(self):
         return self.options.sousOptions(["Dx", "Dy"])
 
-    def action_on_pspict(self, pspict):
+    def line_groups(self):
+        """
+        Return the lines of the grid, grouped by style.
+
+        A list of pairs `(archetype, lines)` in the drawing order : the
+        border, the main and sub vertical lines, the sub and main
+        horizontal lines. `archetype` is the segment whose parameters
+        give the style (`self.main_vertical`, ...) and `lines` is an
+        array of shape (n, 4) : the lines from (x1, y1) to (x2, y2).
+        """
         from yanntricks.src.SmallComputations import MainGridArray
         from yanntricks.src.SmallComputations import SubGridArray
-        a = []
-        # ++++++++++++ Border ++++++++
+        xmin, xmax = self.BB.xmin, self.BB.xmax
+        ymin, ymax = self.BB.ymin, self.BB.ymax
+
+        def vertical(xs):
+            xs = numpy.asarray(xs, dtype=float)
+            ones = numpy.ones_like(xs)
+            return numpy.column_stack((xs, ymin*ones, xs, ymax*ones))
+
+        def horizontal(ys):
+            ys = numpy.asarray(ys, dtype=float)
+            ones = numpy.ones_like(ys)
+            return numpy.column_stack((xmin*ones, ys, xmax*ones, ys))
+
+        groups = []
         if self.draw_border:
-            # Right border
-            if self.draw_vertical_grid:
-                if self.BB.xmax != int(self.BB.xmax):
-                    S = self.BB.east_segment()
-                    S.merge_options(self.border)
-                    a.append(S)
-            # Left border
+            border = []
             if self.draw_vertical_grid:
-                if self.BB.xmin != int(self.BB.xmin):
-                    S = self.BB.west_segment()
-                    S.merge_options(self.border)
-                    a.append(S)
-            # Upper border
+                # Right and left borders
+                if xmax != int(xmax):
+                    border.append((xmax, ymax, xmax, ymin))
+                if xmin != int(xmin):
+                    border.append((xmin, ymax, xmin, ymin))
             if self.draw_horizontal_grid:
-                if self.BB.ymax != int(self.BB.ymax):
-                    S = self.BB.north_segment()
-                    S.merge_options(self.border)
-                    a.append(S)
-            # Lower border
-            if self.draw_horizontal_grid:
-                if self.BB.ymin != int(self.BB.ymin):
-                    S = self.BB.south_segment()
-                    S.merge_options(self.border)
-                    a.append(S)
+                # Upper and lower borders
+                if ymax != int(ymax):
+                    border.append((xmin, ymax, xmax, ymax))
+                if ymin != int(ymin):
+                    border.append((xmin, ymin, xmax, ymin))
+            groups.append((self.border,
+                           numpy.array(border, dtype=float).reshape(-1, 4)))
         if self.draw_vertical_grid:
-            # ++++++++++++ Principal vertical lines ++++++++
-            for x in MainGridArray(self.BB.xmin, self.BB.xmax, self.Dx):
-                S = Segment(Point(x, self.BB.ymin), Point(x, self.BB.ymax))
-                S.merge_options(self.main_vertical)
-                a.append(S)
-            # ++++++++++++ The vertical sub grid ++++++++
+            groups.append((self.main_vertical,
+                           vertical(MainGridArray(xmin, xmax, self.Dx))))
             if self.num_subX != 0:
-                for x in SubGridArray(self.BB.xmin, self.BB.xmax, self.Dx, self.num_subX):
-                    S = Segment(Point(x, self.BB.ymin), Point(x, self.BB.ymax))
-                    S.merge_options(self.sub_vertical)
-                    a.append(S)
+                groups.append((self.sub_vertical,
+                               vertical(SubGridArray(xmin, xmax, self.Dx,
+                                                     self.num_subX))))
         if self.draw_horizontal_grid:
-            # ++++++++++++ The horizontal sub grid ++++++++
             if self.num_subY != 0:
-                for y in SubGridArray(self.BB.ymin, self.BB.ymax, self.Dy, self.num_subY):
-                    S = Segment(Point(self.BB.xmin, y), Point(self.BB.xmax, y))
-                    S.merge_options(self.sub_horizontal)
-                    a.append(S)
-            # ++++++++++++ Principal horizontal lines ++++++++
-            for y in MainGridArray(self.BB.ymin, self.BB.ymax, self.Dy):
-                S = Segment(Point(self.BB.xmin, y), Point(self.BB.xmax, y))
-                S.merge_options(self.main_horizontal)
+                groups.append((self.sub_horizontal,
+                               horizontal(SubGridArray(ymin, ymax, self.Dy,
+                                                       self.num_subY))))
+            groups.append((self.main_horizontal,
+                           horizontal(MainGridArray(ymin, ymax, self.Dy))))
+        return [(archetype, lines) for archetype, lines in groups
+                if len(lines) > 0]
+
+    def action_on_pspict(self, pspict):
+        """
+        Draw the wavy lines, if any, as separate segments.
+
+        The other lines are written by `latex_code`, one path by style.
+        They are computed here : `self.BB` can be the math bounding box
+        of the picture, which is still enlarged by the objects drawn
+        after the grid (the axes, as an example).
+        """
+        self._drawn_line_groups = self.line_groups()
+        a = []
+        for archetype, lines in self._drawn_line_groups:
+            if not archetype.wavy:
+                continue
+            for x1, y1, x2, y2 in lines:
+                S = Segment(Point(x1, y1), Point(x2, y2))
+                S.merge_options(archetype)
                 a.append(S)
         pspict.DrawGraphs(a, separator_name=self.separator_name)
+
+    def latex_code(self, language=None, pspict=None):
+        """
+        Return one '\\draw' by style, containing all its lines.
+
+        A path made of several segments looks the same as the separate
+        segments: the dash pattern restarts at each segment.
+        """
+        from yanntricks.src.points_array import PointsArray
+        groups = self._drawn_line_groups
+        if groups is None:
+            groups = self.line_groups()
+        a = []
+        for archetype, lines in groups:
+            if archetype.wavy or archetype.parameters.style == "none":
+                continue
+            starts = PointsArray(lines[:, 0], lines[:, 1]).coordinates(
+                digits=5, pspict=pspict)
+            ends = PointsArray(lines[:, 2], lines[:, 3]).coordinates(
+                digits=5, pspict=pspict)
+            path = " ".join(f"{c1} -- {c2}" for c1, c2 in zip(starts, ends))
+            a.append("\\draw [{}] {};".format(
+                archetype.params(language="tikz"), path))
+        return "\n".join(a)
@@ -19,100 +19,64 @@
 # email: laurent@claessens-donadello.eu
 
 
-from sage.all import operator,implicit_plot
+import numpy
+from sage.all import operator
 
 from yanntricks.src.ObjectGraph import ObjectGraph
 from yanntricks.src.Constructors import *
 from yanntricks.src.parameters.Parameters import Parameters
+from yanntricks.src.marching_squares import contour_paths
+from yanntricks.src.points_array import PointsArray
 
-def get_paths_from_plot(p):
+
+def grid_values(f, x, y, xs, ys):
     """
-    return the paths (in the sense of matplotlib) contained in the plot object p.
+    Return the array of the values of `f` on the grid `xs` x `ys`.
 
-    The paths here are paths in the sense of matplotlib; the elements are vertices.
-    Not to be confused with get_paths_from_implicit_plot in which the basic elements
-    are points.
+    `values[j, i]` is the value of `f` at `x=xs[i]`, `y=ys[j]`.
+    The values that cannot be computed or are not real (up to 0.0001)
+    are NaN.
+    """
+    from yanntricks.src.Utilities import two_variables_values
+    X, Y = numpy.meshgrid(xs, ys)
+    return two_variables_values(f, x, y, X, Y)
 
-    INPUT:
-    - ``p`` - a plot object
 
-    EXAMPLES:
-    sage: from yanntricks import *
-    sage: from yanntricks.BasicGeometricObjects import *
-    sage: x,y=var('x,y')
-    sage: F=implicit_plot(x**2+y**2==2,(x,-5,5),(y,-5,5))
-    sage: g=get_paths_from_plot(F)
-    sage: print type(g[0])
-    <class 'matplotlib.path.Path'>
-
-    NOTE:
-    The first version of the function is due to the DSM here:
-    http://ask.sagemath.org/question/359/get_minmax_data-on-implicit_plot
+def get_paths_from_implicit_curve(f, xrange, yrange, plot_points):
     """
-    import matplotlib.path
-    m = p.matplotlib()
-    sp = m.get_children()[1]
-    ll=[]
-    for c in sp.get_children():
-        # not sure if I need to test for both or not? don't understand
-        # matplotlib internals well enough to know if every Line2D
-        # will be in some LineCollection and so this is pure duplication (probably)
-        if isinstance(c, matplotlib.lines.Line2D):
-            ll.append(c.get_path())
-        elif isinstance(c, matplotlib.collections.LineCollection):
-            for path in c.get_paths():
-                ll.append(path)
-    return ll
-
-def get_paths_from_implicit_plot(p):
-    """
-    Return a list of list of points from an implicit plot.
-
-    Each list correspond to a path.
+    Return the paths on which `f` vanishes.
 
     INPUT:
 
-    - ``p`` an implicit plot.
+    - ``f`` - an expression of two variables.
+
+    - ``xrange``, ``yrange`` - the ranges as `(x, -5, 5)`.
+
+    - ``plot_points`` - the number of points of the grid in each
+                        direction.
 
     OUTPUT:
 
-    A list of lists of points. Each list corresponds to a path (see matplotlib), but the components are converted into points in the sens of yanntricks (instead of matplotlib's vertices).
+    A list of `PointsArray`. Each one corresponds to a connected
+    component of the curve (in the grid).
 
     EXAMPLES:
 
-    The length of the list can be quite long::
-
         sage: from yanntricks import *
-        sage: from yanntricks.BasicGeometricObjects import *
+        sage: from yanntricks.src.ImplicitCurve import *
         sage: x,y=var('x,y')
-        sage: F=implicit_plot(x**2+y**2==2,(x,-5,5),(y,-5,5))
-        sage: len(get_paths_from_implicit_plot(F)[0])
-        169
-
-    When you have more than one connected component, you see it ::
-
-        sage: F=implicit_plot(x**2-y**2==2,(x,-5,5),(y,-5,5))
-        sage: paths=get_paths_from_implicit_plot(F)
+        sage: paths=get_paths_from_implicit_curve(x**2-y**2-2,(x,-5,5),(y,-5,5),100)
         sage: len(paths)
-        4
-        sage: type(paths[0][1])
-        <class 'yanntricks.BasicGeometricObjects.Point'>
-        sage: print paths[0][3]
-        <Point(4.87405534614323,-4.6644295302013425)>
-        sage: print paths[1][3]
-        <Point(4.87405534614323,-4.6644295302013425)>
-        sage: print paths[2][3]
-        <Point(4.87405534614323,-4.6644295302013425)>
-        sage: print paths[3][3]
-        <Point(4.87405534614323,-4.6644295302013425)>
+        2
     """
-    l=[]
-    for path in get_paths_from_plot(p):
-        pp=[]
-        for vertice in path.vertices:
-            pp.append(Point(vertice[0],vertice[1]))
-        l.append(pp)
-    return l
+    x, xmin, xmax = xrange
+    y, ymin, ymax = yrange
+    xs = numpy.linspace(float(xmin), float(xmax), int(plot_points))
+    ys = numpy.linspace(float(ymin), float(ymax), int(plot_points))
+    values = grid_values(f, x, y, xs, ys)
+    return [PointsArray(path[:, 0], path[:, 1])
+            for path in contour_paths(values, xs, ys)]
+
 
 class GeometricImplicitCurve(object):
     """
@@ -198,9 +162,10 @@ class ImplicitCurveGraph(ObjectGraph,GeometricImplicitCurve):
 
     ATTRIBUTES:
 
-    - ``self.path`` this is a list of lists of points. Each list correspond to a path
-                    in the sense of matplotlib. Notice that here the points are given as
-                    instances of Point; not as list [x,y] as matplotlib does.
+    - ``self.paths`` this is a list of `PointsArray`. Each one is a
+                    connected component of the curve, computed by the
+                    marching squares on a grid of `plot_points` x
+                    `plot_points` points.
     
     EXAMPLES::
 
@@ -217,11 +182,10 @@ class ImplicitCurveGraph(ObjectGraph,GeometricImplicitCurve):
         ObjectGraph.__init__(self,implicit_curve)
         GeometricImplicitCurve.__init__(self,implicit_curve.f)
         self.implicit_curve=implicit_curve
-        self.implicit_plot=implicit_plot(self.f,xrange,yrange)
         self.xrange=xrange
         self.yrange=yrange
         self.plot_points=plot_points
-        self.paths=get_paths_from_implicit_plot(self.implicit_plot)
+        self.paths=get_paths_from_implicit_curve(self.f,xrange,yrange,plot_points)
         self.parameters.color="blue"
     def get_minmax_data(self,decimals=3,dict=True):
         """
@@ -243,15 +207,12 @@ class ImplicitCurveGraph(ObjectGraph,GeometricImplicitCurve):
             {'xmin': -1.189, 'ymin': -1.188, 'ymax': 1.188, 'xmax': 1.189}
 
         """
-        tot_points=[]
-        for path in self.paths :
-            tot_points.extend(path)
-        xx=[P.x for P in tot_points]
-        yy=[P.y for P in tot_points]
-        xmin=min(xx)
-        xmax=max(xx)
-        ymin=min(yy)
-        ymax=max(yy)
+        xx=numpy.concatenate([path.xs for path in self.paths])
+        yy=numpy.concatenate([path.ys for path in self.paths])
+        xmin=float(xx.min())
+        xmax=float(xx.max())
+        ymin=float(yy.min())
+        ymax=float(yy.max())
         if dict:
             return {str('xmin'):xmin, str('xmax'):xmax,str('ymin'):ymin, str('ymax'):ymax}
         else:
@@ -28,7 +28,7 @@ So you can safely import from here.
 import codecs
 import hashlib
 
-from yanntricks.src.Defaults import LOGGING_FILENAME
+import yanntricks.src.Defaults as Defaults
 
 dprint = print
 
@@ -45,6 +45,21 @@ def text_to_hexdigest(text):
     return h.hexdigest()
 
 
+def file_to_hexdigest(filename):
+    """
+    Return the sha1 hexdigest of the content of a file.
+
+    Return None if the file does not exist.
+    """
+    h = hashlib.new("sha1")
+    try:
+        with open(filename, "rb") as f:
+            h.update(f.read())
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
+
+
 def first_bracket(text):
     """
     return the first bracket in the string 'text'  
@@ -61,5 +76,5 @@ def logging(text, pspict=None):
     if pspict:
         text = "in "+pspict.name+" : "+text
     print(text)
-    with codecs.open(LOGGING_FILENAME, "a", encoding="utf8") as f:
+    with codecs.open(Defaults.LOGGING_FILENAME, "a", encoding="utf8") as f:
         f.write(text+"\n")
@@ -287,6 +287,16 @@ class ObjectGraph:
         for obj in self.added_objects[pspict]:
             pspict.DrawGraphs(obj)
 
+    def forget_bounding_boxes(self):
+        """
+        Forget the computed bounding boxes.
+
+        To be used when the geometry of the object is modified after
+        their computation. See `Picture.invalidate_math_bounding_box`.
+        """
+        self.already_computed_BB.clear()
+        self.already_computed_math_BB.clear()
+
     # We could be tempted to furnish here a default
     # '_bounding_box(self,pspict)'
     # Indeed, some are uniquely build from 'action_on_pspict', so that the
@@ -20,6 +20,8 @@
 
 """Describe a parametric curve of which we know an analytic expression."""
 
+import math
+
 from sage.all import lazy_attribute, var, sqrt, sin, cos, atan
 from sage.all import numerical_integral
 
@@ -28,6 +30,7 @@ from yanntricks.src.Exceptions import ShouldNotHappenException
 from yanntricks.src.GenericCurve import GenericCurve
 from yanntricks.src.point import Point
 from yanntricks.src.Utilities import Intersection, inner_product
+from yanntricks.src.Utilities import is_float_value, numeric_values
 
 dprint = print
 
@@ -208,6 +211,58 @@ class ParametricCurveGraph(GenericCurve, ObjectGraph):
         """
         l = self.arc_length()
 
+    def numpy_functions(self):
+        f1 = getattr(self.f1, "numpy_function", None)
+        f2 = getattr(self.f2, "numpy_function", None)
+        if f1 is None or f2 is None:
+            return None
+        return (f1, f2)
+
+    @lazy_attribute
+    def numeric_derivatives(self):
+        """
+        The numpy functions giving x', y', x'' and y'', compiled once.
+
+        They are shared by `get_point` (advised mark angle),
+        `get_tangent_vector` and `get_normal_vector`.
+        None if one of them cannot be compiled.
+        """
+        d1 = self.derivative()
+        d2 = self.derivative(2)
+        functions = tuple(getattr(f, "numpy_function", None)
+                          for f in (d1.f1, d1.f2, d2.f1, d2.f2))
+        if None in functions:
+            return None
+        return functions
+
+    def _numeric_derivatives_at(self, llam):
+        """
+        Return the floats x', y', x'', y'' at `llam`.
+
+        None when `llam` is not a float (an exact answer is expected
+        then) or when the compiled derivatives cannot be used.
+        """
+        if not is_float_value(llam):
+            return None
+        return numeric_values(self.numeric_derivatives, llam)
+
+    def _normal_angle_at(self, llam):
+        """
+        Return the angle of the exterior normal vector at `llam`.
+
+        This is `self.get_normal_vector(llam).angle()`, computed with
+        the compiled derivatives when `llam` is a float.
+        """
+        from yanntricks.src.AngleMeasure import AngleMeasure
+        values = self._numeric_derivatives_at(llam)
+        if values is None:
+            return self.get_normal_vector(llam).angle()
+        dx, dy, ddx, ddy = values
+        nx, ny = -dy, dx
+        if nx*ddx+ny*ddy >= 0:
+            nx, ny = -nx, -ny
+        return AngleMeasure(value_degree=math.degrees(math.atan2(ny, nx)) % 360)
+
     def get_point(self, llam, advised=True):
         """
         Return the point on the curve for the value llam of the parameter.
@@ -231,7 +286,7 @@ class ParametricCurveGraph(GenericCurve, ObjectGraph):
             llam = llam.radian
         P = Point(self.f1(llam), self.f2(llam))
         if advised:
-            P._advised_mark_angle = self.get_normal_vector(llam).angle()
+            P._advised_mark_angle = self._normal_angle_at(llam)
         return P
 
     def get_tangent_vector(self, llam, advised=False):
@@ -258,6 +313,9 @@ class ParametricCurveGraph(GenericCurve, ObjectGraph):
         """
         from yanntricks.src.Constructors import AffineVector
         initial = self.get_point(llam, advised)
+        values = self._numeric_derivatives_at(llam)
+        if values is not None:
+            return AffineVector(initial, Point(initial.x+values[0], initial.y+values[1])).normalize()
         return AffineVector(initial, Point(initial.x+self.derivative().f1(llam), initial.y+self.derivative().f2(llam))).normalize()
 
     def get_normal_vector(self, llam, advised=False, normalize=True, Green_convention=False):
@@ -305,10 +363,15 @@ class ParametricCurveGraph(GenericCurve, ObjectGraph):
         if Green_convention:
             return N
         # The delicate part is to decide if we want to return N or -N. We select the angle which is on the same side of the curve than the second derivative.  If v is the second derivative, either N or -N has positive inner product with v. We select the one with negative inner product since the second derivative vector is inner.
-        second = self.get_second_derivative_vector(llam)
-        # If there is an error here, we were returning N before.
+        values = self._numeric_derivatives_at(llam)
+        if values is not None:
+            inner = N.Dx*values[2]+N.Dy*values[3]
+        else:
+            second = self.get_second_derivative_vector(llam)
+            # If there is an error here, we were returning N before.
+            inner = inner_product(N, second, numerical=True)
 
-        if inner_product(N, second, numerical=True) >= 0:
+        if inner >= 0:
             v = -N
         else:
             v = N
@@ -525,8 +588,9 @@ class ParametricCurveGraph(GenericCurve, ObjectGraph):
 
             pspict.DrawGraphs(interpolation)
         else:
+            self.set_visual_units(pspict.xunit, pspict.yunit)
             points_list = self.representative_points()
-            curve = InterpolationCurve(points_list)
+            curve = InterpolationCurve(points_list, context_object=self)
             curve.parameters = self.parameters.copy()
             curve.mode = "trivial"
             pspict.DrawGraphs(curve)
@@ -16,6 +16,7 @@ from sage.all import numerical_approx   # pylint:disable=import-error
 
 from yanntricks.src.draw_element import DrawElement
 from yanntricks.src.point import Point
+from yanntricks.src.point import numeric_points
 from yanntricks.src.AuxFile import AuxFile
 from yanntricks.src.BoundingBox import BoundingBox
 from yanntricks.src.phyFunctionGraph import phyFunctionGraph
@@ -25,6 +26,10 @@ from yanntricks.src.Utilities import init_picture_separator_list
 from yanntricks.src.Exceptions import ShouldNotHappenException
 from yanntricks.src.Utilities import add_latex_line_entete
 from yanntricks.src.paths_keeper import PathsKeeper
+from yanntricks.src.instrumentation import Instrumentation
+from yanntricks.src.instrumentation import NO_INSTRUMENTATION
+from yanntricks.src.instrumentation import instrumentation_from_environment
+import yanntricks.src.Defaults as Defaults
 
 
 dprint = print
@@ -83,6 +88,18 @@ class Picture:
         self.record_draw_graph = []
         self.record_draw_bb = []
         self.record_force_math_bounding_box = []
+        # Incremented each time an object is registered. The bounding
+        # box is only recomputed when this changed since the last call,
+        # or when the math bounding box grew (the default axes follow it).
+        self._registration_count = 0
+        self._BB_registration_count = None
+        self._BB_math_extent = None
+        # The math bounding box is updated when objects are registered.
+        # The forced objects wait in `_math_BB_pending` until the next
+        # `math_bounding_box`. When `_math_BB_valid` is False, all the
+        # objects are merged again; see `invalidate_math_bounding_box`.
+        self._math_BB_pending = []
+        self._math_BB_valid = True
         # self.record_math_BB=[]
         # self.record_BB=[]
         self.counterDone = False
@@ -93,6 +110,20 @@ class Picture:
         self.xsize = None
         self.ysize = None
         self.rotation_angle = None
+        # If True, the points created while drawing the objects and
+        # writing the code are numeric, and the coordinates of all the
+        # points are written using floats. See `numeric_context`.
+        self.numeric_points = False
+        # If not None, the lists of points of the curves are simplified
+        # up to this distance (in centimetres) before being written.
+        # See `simplification_report`.
+        self.simplification_tolerance = Defaults.SIMPLIFICATION_TOLERANCE
+        self.simplification_record = {}
+        # The timers and counters of the phases of the creation
+        # of the picture. See `enable_instrumentation`.
+        self.instrumentation = NO_INSTRUMENTATION
+        if instrumentation_from_environment():
+            self.enable_instrumentation()
         self.LabelSep = 1
         self.BB = BoundingBox(mother=self)
         self.math_BB = BoundingBox(is_math=True)
@@ -124,7 +155,16 @@ class Picture:
         """
         It also remove the tikz externalize file.
         """
-        self.create_latex_code(language="tikz", pspict=self)
+        return self.tikz_separator_list().code()
+
+    def tikz_separator_list(self):
+        """
+        Create the tikz code and return the separator list containing it.
+
+        See `tikz_code`.
+        """
+        with self.instrumentation.phase("create_latex_code"):
+            self.create_latex_code(language="tikz", pspict=self)
         add_latex_line_entete(self)
         self.add_latex_line("\\tikzsetnextfilename{{{0}}}".format(
             self.tikzfile.from_sage()), "BEGIN PSPICTURE")
@@ -135,7 +175,7 @@ class Picture:
 
         self.xsize = self.bounding_box(pspict=self).xsize()
         self.ysize = self.bounding_box(pspict=self).ysize()
-        return self.separator_list.code()
+        return self.separator_list
 
     def visual_xsize(self):
         return numerical_approx(self.xsize*self.xunit)
@@ -164,10 +204,12 @@ class Picture:
         list_to_be_drawn = [a for a in self.record_draw_graph if a.take_graph]
 
         list_used_separators = []
+        instrumentation = self.instrumentation
 
         # STEP : update the bounding box
         for x in list_to_be_drawn:
-            self.BB.append(x.graph, self)
+            with instrumentation.phase("BB.append", x.graph):
+                self.BB.append(x.graph, self)
 
             # The math_BB is updated in DrawGraph    February 21, 2015
             # This allow to enlarge the BB by hand with something like
@@ -189,10 +231,10 @@ class Picture:
                     graph = graph.mother.bounding_box(self)
             separator_name = x.separator_name
             try:
-                self.add_latex_line(ligne=graph.latex_code(
-                    language=self.language,
-                    pspict=self),
-                    separator_name=separator_name)
+                with instrumentation.phase("latex_code", graph):
+                    code = graph.latex_code(language=self.language,
+                                            pspict=self)
+                self.add_latex_line(ligne=code, separator_name=separator_name)
                 list_used_separators.append(separator_name)
             except AttributeError:
                 if "latex_code" not in dir(graph):
@@ -235,12 +277,29 @@ class Picture:
     def math_bounding_box(self, pspict=None):
         """
         Update and return the math bounding box of the picture.
+
+        The drawn objects are merged in `self.math_BB` when they are
+        registered (`_DrawGraph`); only the forced objects registered
+        since the previous call are merged here. Everything is merged
+        again after `invalidate_math_bounding_box` or when `pspict`
+        is another picture.
         """
         pspict = pspict or self
+        if pspict is self and self._math_BB_valid:
+            pending = self._math_BB_pending
+            self._math_BB_pending = []
+            with self.instrumentation.phase("math_bounding_box pending"):
+                for a in [g for g in pending if g.take_math_BB]:
+                    self.math_BB.AddBB(a.math_bounding_box(pspict=pspict))
+            return self.math_BB
         math_list = [x.graph for x in self.record_draw_graph]
         math_list.extend(self.record_force_math_bounding_box)
-        for a in [g for g in math_list if g.take_math_BB]:
-            self.math_BB.AddBB(a.math_bounding_box(pspict=pspict))
+        if pspict is self:
+            self._math_BB_pending = []
+            self._math_BB_valid = True
+        with self.instrumentation.phase("math_bounding_box"):
+            for a in [g for g in math_list if g.take_math_BB]:
+                self.math_BB.AddBB(a.math_bounding_box(pspict=pspict))
         return self.math_BB
 
     def bounding_box(self, pspict=None):
@@ -250,6 +309,19 @@ class Picture:
         # to be taken into account in the bounding box of the picture.
         pspict = pspict or self
 
+        if pspict is self and \
+                self._BB_registration_count == self._registration_count \
+                and self._BB_math_extent == self._math_extent():
+            # Nothing was registered since the last call and the math
+            # bounding box did not change.
+            self.instrumentation.count("bounding_box cache hits")
+            return self.BB
+
+        with self.instrumentation.phase("bounding_box"):
+            return self._compute_bounding_box(pspict)
+
+    def _compute_bounding_box(self, pspict):
+        """Merge the bounding boxes of all the registered objects."""
         self.BB.append(self.math_bounding_box(), pspict=pspict)
 
         def condition(x):
@@ -261,8 +333,19 @@ class Picture:
 
         for element in sublist(self.record_draw_graph, condition):
             self.add_in_bb(element, pspict)
+        if pspict is self:
+            self._BB_registration_count = self._registration_count
+            self._BB_math_extent = self._math_extent()
         return self.BB
 
+    def _math_extent(self):
+        """
+        Return the extent of the math bounding box, including the
+        enlargements by hand like `pspict.math_BB.xmax += 1`.
+        """
+        bb = self.math_bounding_box()
+        return (bb.xmin, bb.xmax, bb.ymin, bb.ymax)
+
     def add_in_bb(self, element, pspict):
         """Append the given graph in self's bounding box."""
         self.BB.AddBB(element.graph.bounding_box(pspict=pspict))
@@ -295,6 +378,21 @@ class Picture:
         self._DrawGraph(gr, separator_name=separator_name)
         return None
 
+    def numeric_context(self):
+        """
+        Return the context in which the picture draws its objects
+        and writes its code.
+
+        If `self.numeric_points` is True, the points created in this
+        context are numeric (see `numeric_points`). The points created
+        by the user before drawing them keep their own type; create
+        them inside `with numeric_points():` in order to have
+        numeric points everywhere.
+        """
+        if self.numeric_points:
+            return numeric_points()
+        return contextlib.nullcontext()
+
     def DrawGraphs(self, *args, **arg):
         """
         The function DrawGraphs basically takes a list of objects
@@ -352,6 +450,9 @@ class Picture:
                 separator_name = "DEFAULT"
         x = DrawElement(graph, separator_name)
         self.record_draw_graph.append(x)
+        self._registration_count += 1
+        instrumentation = self.instrumentation
+        instrumentation.count("DrawGraph calls")
 
         # If an object has a mark, it the latter is already
         # in the 'added_objects' list and the mark is already passed
@@ -361,10 +462,16 @@ class Picture:
         # Augustus 8, 2016
         # See position 3598-30738
 
-        graph.conclude(self)
-        self.math_BB.append(graph, self)
-        graph._draw_added_objects(self)  # pylint:disable=protected-access
-        graph.action_on_pspict(pspict=self)
+        with instrumentation.phase("DrawGraph", graph), \
+                self.numeric_context():
+            with instrumentation.phase("conclude", graph):
+                graph.conclude(self)
+            with instrumentation.phase("math_BB.append", graph):
+                self.math_BB.append(graph, self)
+            with instrumentation.phase("added_objects", graph):
+                graph._draw_added_objects(self)  # pylint:disable=protected-access
+            with instrumentation.phase("action_on_pspict", graph):
+                graph.action_on_pspict(pspict=self)
 
     def DrawDefaultAxes(self):
         """
@@ -412,6 +519,46 @@ class Picture:
         self.separator_list[separator_name].add_latex_line(
             ligne, add_line_jump=add_line_jump)
 
+    def record_simplification(self, obj, before, after):
+        """
+        Remember that the list of points of `obj` was simplified
+        from `before` points to `after` points.
+
+        An object drawn as several curves (like an implicit curve
+        with several components) is recorded once, with the sums.
+        """
+        name, old_before, old_after = self.simplification_record.get(
+            id(obj), (str(type(obj).__name__), 0, 0))
+        self.simplification_record[id(obj)] = (name, old_before+before,
+                                                old_after+after)
+
+    def simplification_report(self):
+        """Return the number of removed points of each object, as text."""
+        a = [f"Simplification of the curves of {self.name} "
+             f"(tolerance {self.simplification_tolerance}) :"]
+        total_before = 0
+        total_after = 0
+        for name, before, after in self.simplification_record.values():
+            a.append(f"   {name} : {before-after} points removed "
+                     f"out of {before}")
+            total_before += before
+            total_after += after
+        a.append(f"   total : {total_before-total_after} points removed "
+                 f"out of {total_before}")
+        return "\n".join(a)
+
+    def enable_instrumentation(self):
+        """
+        Record the time spent in each phase of the creation of the
+        picture, and by each class of object.
+
+        The results are written by `Figure.write_the_file` next to the
+        '.comment' file. See :class:`Instrumentation`.
+        """
+        if not self.instrumentation.enabled:
+            self.instrumentation = Instrumentation()
+        return self.instrumentation
+
     def force_math_bounding_box(self, g):
         """
         Add an object to the math bounding box of the pspicture.
@@ -420,6 +567,26 @@ class Picture:
         will take it into account.
         """
         self.record_force_math_bounding_box.append(g)
+        self._math_BB_pending.append(g)
+        self._registration_count += 1
+
+    def invalidate_math_bounding_box(self, graph=None):
+        """
+        Tell the picture that the geometry of `graph` changed after
+        it was drawn or forced in the math bounding box.
+
+        The bounding boxes computed by `graph` are forgotten and the
+        next `math_bounding_box` merges again all the objects of the
+        picture. Without `graph`, only the merge is done again.
+
+        The math bounding box only grows : the old extent of a
+        modified object is not removed, as well as the enlargements
+        made by hand like `pspict.math_BB.ymax += 1`.
+        """
+        if graph is not None:
+            graph.forget_bounding_boxes()
+        self._math_BB_valid = False
+        self._registration_count += 1
 
     def test_if_test_file_is_present(self):
         from yanntricks.src.SmallComputations import Fichier
@@ -429,6 +596,17 @@ class Picture:
 
     def latex_code(self):
         """Return the LaTeX code of the pspicture"""
+        return self.latex_separator_list().code()
+
+    def latex_separator_list(self):
+        """
+        Return the separator list containing the LaTeX code of
+        the pspicture.
+        """
+        with self.numeric_context():
+            return self._latex_separator_list()
+
+    def _latex_separator_list(self):
         self.add_latex_line(
             self.auxiliary_file.open_latex_code(), "OPEN_WRITE_AND_LABEL")
         self.add_latex_line(
@@ -436,6 +614,6 @@ class Picture:
         self.add_latex_line(
             self.auxiliary_file.close_latex_code(), "CLOSE_WRITE_AND_LABEL")
         if self.language == "tikz":
-            return self.tikz_code()
+            return self.tikz_separator_list()
         raise NameError(f"Unknown language {self.language}."
                         f" tikz is the only one.")
@@ -27,14 +27,26 @@ class Separator(object):
         self.add_latex_line("%"+self.title)
 
     def add_latex_line(self, line, add_line_jump=True):
-        if isinstance(line, Separator):
-            text = line.code()
+        """
+        Add code to the separator.
+
+        `line` is a string, a list of strings, a `Separator` or a
+        `SeparatorList`. The code of the separators is not copied : we
+        only keep references to their pieces of code.
+        """
+        if isinstance(line, str):
+            self.latex_code.append(line)
+        elif hasattr(line, "chunks"):
+            self.latex_code.extend(line.chunks())
         else:
-            text = "".join(line)
-        self.latex_code.append(text)
+            self.latex_code.extend(line)
         if add_line_jump:
             self.latex_code.append(u"\n")
 
+    def chunks(self):
+        """Return the list of the pieces of code of the separator."""
+        return self.latex_code
+
     def code(self):
         lc = self.latex_code
         return "".join(lc)
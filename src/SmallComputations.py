@@ -518,6 +518,159 @@ def split_list(starting_list, fun, cut_ymin, cut_ymax):
     return s
 
 
+def brent_root(fun, a, b, fa=None, fb=None, tol=1e-12, max_iter=200):
+    """
+    Return a root of the function `fun` between `a` and `b` by
+    the Brent's method.
+
+    `fun(a)` and `fun(b)` (given as `fa` and `fb` when already known)
+    must have opposite signs.
+    """
+    fa = fun(a) if fa is None else fa
+    fb = fun(b) if fb is None else fb
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if fa*fb > 0:
+        raise ValueError("The function has the same sign at both ends.")
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+    c, fc = a, fa
+    d = e = b-a
+    for _ in range(max_iter):
+        if fb == 0:
+            return b
+        if fa*fb > 0:
+            a, fa = c, fc
+            d = e = b-c
+        if abs(fa) < abs(fb):
+            c, fc = b, fb
+            b, fb = a, fa
+            a, fa = c, fc
+        m = (a-b)/2
+        tol1 = 2*2.2e-16*abs(b)+tol/2
+        if abs(m) <= tol1:
+            return b
+        if abs(e) >= tol1 and abs(fc) > abs(fb):
+            # Interpolation (secant or inverse quadratic)
+            s = fb/fc
+            if c == a:
+                p = 2*m*s
+                q = 1-s
+            else:
+                q = fc/fa
+                r = fb/fa
+                p = s*(2*m*q*(q-r)-(b-c)*(r-1))
+                q = (q-1)*(r-1)*(s-1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2*p < min(3*m*q-abs(tol1*q), abs(e*q)):
+                e, d = d, p/q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        c, fc = b, fb
+        b = b+d if abs(d) > tol1 else b+(tol1 if m > 0 else -tol1)
+        fb = fun(b)
+    return b
+
+
+def _minimum_abs(fun, a, b, tol=1e-12, max_iter=200):
+    """
+    Return the point of [a, b] where `|fun|` is minimal, by golden
+    section search.
+    """
+    ratio = (5**0.5-1)/2
+    c = b-ratio*(b-a)
+    d = a+ratio*(b-a)
+    fc, fd = abs(fun(c)), abs(fun(d))
+    for _ in range(max_iter):
+        if abs(b-a) <= tol:
+            break
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b-ratio*(b-a)
+            fc = abs(fun(c))
+        else:
+            a, c, fc = c, d, fd
+            d = a+ratio*(b-a)
+            fd = abs(fun(d))
+    return (a+b)/2
+
+
+def find_roots(fun, a, b, samples=None, tol=1e-12):
+    """
+    Return the sorted list of the roots of `fun` between `a` and `b`.
+
+    INPUT:
+
+    - ``fun`` - a function evaluating an array of floats (as
+                `phyFunctionGraph.numpy_function`).
+
+    - ``samples`` - the number of points where `fun` is first
+                    evaluated (default: `Defaults.ROOT_FINDING_SAMPLES`).
+
+    The function is evaluated on a regular grid. Every sign change
+    gives a bracket, refined by the Brent's method. A local minimum of
+    `|fun|` without sign change is a candidate for a tangency; it is a
+    root if `|fun|` reaches zero (up to `tol` times the scale of
+    the sampled values).
+
+    Two roots closer than the step of the grid can be missed, as well
+    as pairs of roots between two consecutive samples.
+    """
+    import numpy
+    import yanntricks.src.Defaults as Defaults
+    if samples is None:
+        samples = Defaults.ROOT_FINDING_SAMPLES
+    a, b = float(a), float(b)
+    xs = numpy.linspace(a, b, int(samples))
+    with numpy.errstate(all="ignore"):
+        ys = numpy.asarray(fun(xs), dtype=float)
+    finite = numpy.isfinite(ys)
+
+    def scalar(t):
+        with numpy.errstate(all="ignore"):
+            return float(fun(numpy.array([t]))[0])
+
+    roots = [float(x) for x in xs[finite & (ys == 0)]]
+    both = finite[:-1] & finite[1:]
+    brackets = numpy.flatnonzero(both & (ys[:-1]*ys[1:] < 0))
+
+    scale = float(numpy.abs(ys[finite]).max()) if finite.any() else 1
+    mag = numpy.where(finite, numpy.abs(ys), numpy.inf)
+    inner = numpy.arange(1, len(xs)-1)
+    tangencies = inner[(mag[inner] < mag[inner-1])
+                       & (mag[inner] <= mag[inner+1])
+                       & (ys[inner-1]*ys[inner] > 0)
+                       & (ys[inner]*ys[inner+1] > 0)]
+
+    def refine_bracket(i):
+        return brent_root(scalar, xs[i], xs[i+1], ys[i], ys[i+1], tol=tol)
+
+    def refine_tangency(i):
+        x = _minimum_abs(scalar, xs[i-1], xs[i+1], tol=tol)
+        if abs(scalar(x)) <= max(scale, 1)*1e-10:
+            return x
+        return None
+
+    found = [refine_bracket(i) for i in brackets]
+    found.extend(refine_tangency(i) for i in tangencies)
+    roots.extend(float(x) for x in found if x is not None)
+    roots.sort()
+
+    # The same root can be found from a zero sample and a bracket.
+    result = []
+    for x in roots:
+        if not result or x-result[-1] > 2*tol:
+            result.append(x)
+    return result
+
+
 def find_roots_recursive(f, a, b, tol=0.000000000001):
     """
     Return the roots of the function 'f' between 'a' and 'b' as a list.
@@ -28,6 +28,7 @@
 # pylint: disable=too-many-public-methods
 # pylint: disable=fixme
 
+import numpy
 from sage.all import sqrt, numerical_approx  # pylint:disable = import-error
 from sage.all import var, solve, atan, pi  # pylint:disable = import-error
 from sage.rings.real_mpfr import RealNumber  # pylint:disable = import-error
@@ -228,6 +229,7 @@ def Intersection(f, g, a=None, b=None, numerical=False):
     In this case an interval is required.
     """
     from yanntricks.src.affine_vector import AffineVector
+    from yanntricks.src.SmallComputations import find_roots
     from yanntricks.src.SmallComputations import find_roots_recursive
     from yanntricks.src.point import Point
 
@@ -238,7 +240,10 @@ def Intersection(f, g, a=None, b=None, numerical=False):
 
     if numerical and "sage" in dir(f):
         k = f-g
-        xx = find_roots_recursive(k.sage, a, b)
+        if k.numpy_function is not None:
+            xx = find_roots(k.numpy_function, a, b)
+        else:
+            xx = find_roots_recursive(k.sage, a, b)
         pts = [Point(x, f(x)) for x in xx]
         return pts
 
@@ -348,41 +353,102 @@ def EnsureParametricCurve(curve):
     return curve
 
 
-def check_too_large(obj, pspict=None):
+def is_float_value(x):
+    """
+    Return True if `x` is a floating point number (float, numpy or
+    Sage's real number), that is a value for which an exact result
+    is not expected.
+    """
+    return isinstance(x, (float, numpy.floating, RealNumber))
+
+
+def numeric_values(functions, x):
+    """
+    Return the list of the values of the numpy functions
+    `functions` at `x`, as floats.
+
+    Return None if `functions` is None or if one of the values
+    is not finite.
+    """
+    if functions is None:
+        return None
     try:
-        bb = obj.bounding_box(pspict)
-        mx = bb.xmin
-        my = bb.ymin
-        Mx = bb.xmax
-        My = bb.ymax
+        t = numpy.array([float(x)])
+    except TypeError:
+        return None
+    values = []
+    with numpy.errstate(all="ignore"):
+        for f in functions:
+            value = float(f(t)[0])
+            if not numpy.isfinite(value):
+                return None
+            values.append(value)
+    return values
+
+
+def two_variables_function(f, x, y):
+    """
+    Return a function computing the expression `f` of the variables
+    `x`, `y` on numpy arrays.
+
+    The returned function takes two arrays `X`, `Y` of the same shape
+    and returns the array of the values of `f` at the points
+    (X[k], Y[k]). The expression is compiled to numpy once; when it
+    cannot be, it is evaluated point by point.
+    The values that cannot be computed or are not real (up to 0.0001)
+    are NaN.
+    """
+    import sympy
+    try:
+        vectorized = sympy.lambdify((x._sympy_(), y._sympy_()),
+                                    f._sympy_(), "numpy")
+    except (TypeError, ValueError, AttributeError, NameError,
+            NotImplementedError, sympy.SympifyError):
+        vectorized = None
+    # The pointwise function, compiled on first use.
+    compiled = []
+
+    def pointwise(X, Y):
+        if not compiled:
+            from sage.all import fast_callable  # pylint:disable=import-error
+            compiled.append(fast_callable(f, vars=[x, y], domain=complex))
+        ff = compiled[0]
+        values = numpy.full(X.shape, numpy.nan, dtype=complex)
+        for index, a in numpy.ndenumerate(X):
+            try:
+                values[index] = ff(a, Y[index])
+            except (ValueError, ZeroDivisionError, OverflowError):
+                pass
+        return values
+
+    def values_function(X, Y):
+        X = numpy.asarray(X, dtype=float)
+        Y = numpy.asarray(Y, dtype=float)
+        values = None
+        if vectorized is not None:
+            try:
+                with numpy.errstate(all="ignore"):
+                    values = numpy.asarray(vectorized(X, Y))
+            except (TypeError, ValueError, AttributeError, NameError,
+                    NotImplementedError, ZeroDivisionError):
+                values = None
+        if values is None:
+            values = pointwise(X, Y)
+        if numpy.iscomplexobj(values):
+            values = numpy.where(abs(values.imag) < 0.0001,
+                                 values.real, numpy.nan)
+        return numpy.broadcast_to(values, X.shape).astype(float)
+    return values_function
+
+
+def two_variables_values(f, x, y, X, Y):
+    """
+    Return the array of the values of the expression `f` of the
+    variables `x`, `y` at the points (X[k], Y[k]).
 
-    except AttributeError:
-        print("Object {0} has no method bounding_box.".format(obj))
-        mx = obj.mx
-        my = obj.my
-        Mx = obj.Mx
-        My = obj.My
-    if pspict:
-        from yanntricks.src.Exceptions import TooLargeBBException
-        # In some circumstances, the comparison
-        # mx<pspict.mx_acceptable_BB
-        # provokes a MemoryError.
-        n_Mx = numerical_approx(Mx)
-        n_mx = numerical_approx(mx)
-        n_My = numerical_approx(My)
-        n_my = numerical_approx(my)
-        if n_mx < pspict.mx_acceptable_BB:
-            raise TooLargeBBException(
-                obj=obj, faulty="xmin", acceptable=pspict.mx_acceptable_BB, got=n_mx)
-        if n_my < pspict.my_acceptable_BB:
-            raise TooLargeBBException(
-                obj=obj, faulty="ymin", acceptable=pspict.my_acceptable_BB, got=n_my)
-        if n_Mx > pspict.Mx_acceptable_BB:
-            raise TooLargeBBException(
-                obj=obj, faulty="xmax", acceptable=pspict.Mx_acceptable_BB, got=n_Mx)
-        if n_My > pspict.My_acceptable_BB:
-            raise TooLargeBBException(
-                obj=obj, faulty="ymax", acceptable=pspict.My_acceptable_BB, got=n_My)
+    See `two_variables_function`.
+    """
+    return two_variables_function(f, x, y)(X, Y)
 
 
 def general_function_get_point(fun, x, advised=True):
@@ -406,6 +472,19 @@ def general_function_get_point(fun, x, advised=True):
     from yanntricks.src.point import Point
     P = Point(float(x), fun(x))
     if advised:
+        values = None
+        if is_float_value(x):
+            # An exact answer is expected for exact values of `x`.
+            values = numeric_values(getattr(fun, "numeric_derivatives",
+                                            None), x)
+        if values is not None:
+            # Same as below, with the compiled derivatives.
+            import math
+            angle_n = math.degrees(math.atan(values[0])+math.pi/2)
+            if values[1] > 0:
+                angle_n = angle_n+180
+            P._advised_mark_angle = angle_n  # pylint:disable=protected-access
+            return P
         try:
             ca = fun.derivative()(x)
         except TypeError:    # Sage cannot derivate the function
@@ -601,3 +680,77 @@ def number_to_string(x, digits):
         sx = sx[:-1]
 
     return sx
+
+
+def numbers_to_strings(values, digits):
+    """
+    Return the list `[number_to_string(x, digits) for x in values]`.
+
+    - `values` : a numpy array of floats.
+
+    `number_to_string` cuts the string of Sage's numerical
+    approximation, which has 15 significant digits. We build that
+    string from Python's formatting with the same rounding. Outside of
+    [0.001, 1e6), where Sage can use the scientific notation, and for
+    the non finite values, we use `number_to_string`.
+    """
+    values = numpy.asarray(values, dtype=float)
+    if len(values) == 0:
+        return []
+    if digits == 1:
+        zero = "0"
+    else:
+        zero = "0."+"0"*(digits-1)
+    absolute = numpy.abs(values)
+    almost_zero = absolute < 0.001
+    fallback = ~numpy.isfinite(values) | (absolute >= 1e6)
+    # The 15 significant digits of Sage and the exponent.
+    scientific = numpy.char.mod("%.14e", absolute)
+
+    strings = []
+    for x, sci, small, other in zip(values.tolist(), scientific.tolist(),
+                                    almost_zero.tolist(), fallback.tolist()):
+        if small:
+            strings.append(zero)
+            continue
+        if other:
+            strings.append(number_to_string(x, digits=digits))
+            continue
+        mantissa = sci[0]+sci[2:16]
+        exponent = int(sci[17:])
+        if exponent >= 0:
+            sx = mantissa[:exponent+1]+"."+mantissa[exponent+1:]
+        else:
+            sx = "0."+"0"*(-exponent-1)+mantissa
+        sx = sx+"0"*(digits+1)  # be sure not to lack digits
+        if x < 0:
+            sx = "-"+sx[0:digits+1]
+        else:
+            sx = sx[0:digits+1]
+        if sx.endswith("."):
+            sx = sx[:-1]
+        strings.append(sx)
+    return strings
+
+
+def format_coordinates(xy, digits=5, xunit=1, yunit=1, rotation_angle=None):
+    """
+    Return the list of the tikz coordinates "(x,y)" of the given points.
+
+    - `xy` : a (N,2) array of floats.
+    - `xunit`, `yunit`, `rotation_angle` : the transformation of the
+      picture, as in `Point.coordinates`.
+
+    The strings are the ones of `Point.coordinates`, see
+    `numbers_to_strings`.
+    """
+    xy = numpy.asarray(xy, dtype=float).reshape(-1, 2)
+    xs = xy[:, 0]*float(xunit)
+    ys = xy[:, 1]*float(yunit)
+    if rotation_angle is not None:
+        ang = numpy.radians(float(rotation_angle))
+        xs, ys = xs*numpy.cos(ang)+ys*numpy.sin(ang), \
+            -xs*numpy.sin(ang)+ys*numpy.cos(ang)
+    sxs = numbers_to_strings(xs, digits)
+    sys_ = numbers_to_strings(ys, digits)
+    return ["("+sx+","+sy+")" for sx, sy in zip(sxs, sys_)]
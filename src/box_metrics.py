@@ -0,0 +1,139 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+# pylint: disable=invalid-name
+
+"""
+A database of the box sizes that LaTeX already measured.
+
+The box sizes are asked to LaTeX through the auxiliary file of each
+picture (see `AuxFile`). Here we keep them in a single SQLite file
+shared by all the pictures of all the documents living in the same
+main LaTeX directory. A new picture using an already measured
+text (like "$x$" or "$O$") then does not need a new LaTeX compilation.
+
+The measures are keyed by
+- a fingerprint of the font in which LaTeX measured the box,
+- the identifier used in the auxiliary file, which contains the
+  hash of the tex expression.
+"""
+
+import os
+
+import yanntricks.src.Defaults as Defaults
+
+
+class BoxMetricsCache:
+    """
+    The database of the box sizes.
+
+    Use `box_metrics_cache` instead of creating a new one.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._connection = None
+        self._pid = None
+        self._to_be_committed = False
+
+    def connection(self):
+        """
+        Return the connection to the database.
+
+        The connection is not inherited by child processes: each process
+        opens its own.
+        """
+        if self._connection is None or self._pid != os.getpid():
+            import sqlite3
+            self._connection = sqlite3.connect(str(self.filename),
+                                               timeout=30)
+            self._pid = os.getpid()
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS box_metrics "
+                "(fingerprint TEXT, interId TEXT, value TEXT, "
+                "PRIMARY KEY (fingerprint, interId))")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents "
+                "(document TEXT PRIMARY KEY, fingerprint TEXT)")
+        return self._connection
+
+    def get(self, fingerprint, interId):
+        """Return the stored value or None."""
+        row = self.connection().execute(
+            "SELECT value FROM box_metrics "
+            "WHERE fingerprint=? AND interId=?",
+            (fingerprint, interId)).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def store(self, fingerprint, interId, value):
+        """Record a value read in an auxiliary file."""
+        self.connection().execute(
+            "INSERT OR REPLACE INTO box_metrics VALUES (?,?,?)",
+            (fingerprint, interId, value))
+        self._to_be_committed = True
+
+    def document_fingerprint(self, document):
+        """
+        Return the last font fingerprint seen for the document.
+
+        This fingerprint may come from an earlier compilation with
+        another font. It is only used to read the database, never
+        to store values in it.
+        """
+        row = self.connection().execute(
+            "SELECT fingerprint FROM documents WHERE document=?",
+            (document,)).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def set_document_fingerprint(self, document, fingerprint):
+        self.connection().execute(
+            "INSERT OR REPLACE INTO documents VALUES (?,?)",
+            (document, fingerprint))
+        self._to_be_committed = True
+
+    def commit(self):
+        """Write the new values on the disk."""
+        if self._to_be_committed:
+            self.connection().commit()
+            self._to_be_committed = False
+
+
+_box_metrics_caches = {}
+
+
+def box_metrics_cache(paths):
+    """
+    Return the box metrics database of the main LaTeX directory.
+
+    @param {PathsKeeper} `paths`
+
+    Return None when the database is disabled, that is when
+    `Defaults.BOX_METRICS_FILENAME` is None.
+    """
+    if Defaults.BOX_METRICS_FILENAME is None:
+        return None
+    filename = paths["main_tex"] / Defaults.BOX_METRICS_FILENAME
+    if filename not in _box_metrics_caches:
+        _box_metrics_caches[filename] = BoxMetricsCache(filename)
+    return _box_metrics_caches[filename]
@@ -0,0 +1,188 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+"""
+A cache allowing `FigureGenerationSuite` to skip the unchanged figures.
+
+A figure function has to be executed again when one of the following
+changed since its last execution:
+- the source file of the figure function,
+- the source of yanntricks itself,
+- the paths read in `Directories.py`,
+- the project modules imported when the function was executed (the
+  helper modules living next to the source file of the function),
+- the auxiliary files of its pictures (LaTeX wrote new box sizes),
+- the produced files (someone removed or modified them).
+
+The first three are combined in a key. The last three are recorded
+as hashes of the files.
+"""
+
+import sys
+import json
+import inspect
+from pathlib import Path
+
+from yanntricks.src.paths_keeper import PathsKeeper
+from yanntricks.src.NoMathUtilities import text_to_hexdigest
+from yanntricks.src.NoMathUtilities import file_to_hexdigest
+
+
+def yanntricks_hexdigest():
+    """Return a hash of the source of yanntricks."""
+    src_dir = Path(__file__).resolve().parent
+    digests = [file_to_hexdigest(filename)
+               for filename in sorted(src_dir.glob("**/*.py"))]
+    return text_to_hexdigest("".join(digests))
+
+
+def _digests(filenames):
+    """Return the dictionary filename -> hash of the files."""
+    return {filename: file_to_hexdigest(filename) for filename in filenames}
+
+
+class FigureCache:
+    """
+    Remember what the figure functions produced.
+
+    - `filename` : the JSON file in which the cache is saved.
+    """
+
+    def __init__(self, filename):
+        self.filename = Path(filename)
+        self.entries = {}
+        self.hits = []
+        self.misses = []
+        self._yanntricks_hexdigest = None
+        try:
+            with open(self.filename, "r") as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            pass
+
+    @staticmethod
+    def function_name(fun):
+        return f"{fun.__module__}.{fun.__name__}"
+
+    def figure_key(self, fun):
+        """
+        Return the key of the figure function.
+
+        It depends on the source file of the function, on the version
+        of yanntricks and on the paths of `Directories.py`.
+        """
+        if self._yanntricks_hexdigest is None:
+            self._yanntricks_hexdigest = yanntricks_hexdigest()
+        try:
+            source = file_to_hexdigest(inspect.getsourcefile(fun))
+        except TypeError:
+            # No source file : such a function is never up to date.
+            return None
+        paths = {k: str(v) for k, v in PathsKeeper().paths.items()}
+        return text_to_hexdigest(json.dumps(
+            [source, self._yanntricks_hexdigest, paths], sort_keys=True))
+
+    @staticmethod
+    def project_modules(fun):
+        """
+        Return the list of the source files of the imported modules
+        belonging to the project of the figure function.
+
+        These are the modules living in the directory of the source file
+        of `fun` (or below), yanntricks excepted.
+        """
+        try:
+            directory = Path(inspect.getsourcefile(fun)).resolve().parent
+        except TypeError:
+            return []
+        src_dir = Path(__file__).resolve().parent
+        filenames = set()
+        for module in list(sys.modules.values()):
+            filename = getattr(module, "__file__", None)
+            if filename is None or not filename.endswith(".py"):
+                continue
+            path = Path(filename).resolve()
+            if directory in path.parents and src_dir not in path.parents:
+                filenames.add(str(path))
+        return sorted(filenames)
+
+    def is_up_to_date(self, fun):
+        """
+        Say if the previous output of the figure function can be reused.
+
+        Record the answer for the final report.
+        """
+        name = self.function_name(fun)
+        entry = self.entries.get(name)
+        up_to_date = entry is not None \
+            and entry["key"] is not None \
+            and "modules" in entry \
+            and entry["key"] == self.figure_key(fun) \
+            and entry["modules"] == _digests(entry["modules"]) \
+            and entry["files"] == _digests(entry["files"])
+        if up_to_date:
+            self.hits.append(name)
+        else:
+            self.misses.append(name)
+        return up_to_date
+
+    @staticmethod
+    def produced_files(figure):
+        """Return the list of the files to be checked for the figure."""
+        filenames = [figure.filename.abs_path, figure.comment_filename]
+        for pspict in figure.all_pspictures():
+            filenames.append(pspict.auxiliary_file.interWriteFile.abs_path)
+        return [str(filename) for filename in filenames]
+
+    def record(self, fun, figure):
+        """Record the files produced by the figure function."""
+        self.record_files(fun, self.produced_files(figure))
+
+    def record_files(self, fun, filenames, modules=None):
+        """
+        Record the files produced by the figure function.
+
+        `modules` is the list of the project modules imported by the
+        function (see `project_modules`). By default, the ones imported
+        in the current process.
+        """
+        if modules is None:
+            modules = self.project_modules(fun)
+        self.entries[self.function_name(fun)] = {
+            "key": self.figure_key(fun),
+            "modules": _digests(modules),
+            "files": _digests(filenames)}
+
+    def forget(self, fun):
+        """Remove the figure function from the cache."""
+        self.entries.pop(self.function_name(fun), None)
+
+    def write(self):
+        with open(self.filename, "w") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+
+    def report(self):
+        """Return a summary of the skipped and regenerated figures."""
+        a = []
+        a.append(f"Figure cache: {len(self.hits)} skipped, "
+                 f"{len(self.misses)} generated.")
+        for name in self.hits:
+            a.append(f"   skipped (unchanged): {name}")
+        return "\n".join(a)
@@ -1,8 +1,50 @@
+import io
+import os
+import contextlib
 
 from yanntricks.src.Figure import Figure
 from yanntricks.src.Exceptions import PhystricksTestError
 from yanntricks.src.Exceptions import PhystricksNoError
 from yanntricks.src.main import function_list_to_figures_list
+import yanntricks.src.Defaults as Defaults
+
+
+def _generate_in_worker(fun, log_filename):
+    """
+    Execute the figure function `fun` in a worker process.
+
+    The log is written in `log_filename` and the standard output is
+    captured; both are given back to the main process which prints them
+    in the order of the figures list.
+
+    Return a dictionary describing the outcome. The exceptions themselves
+    are not sent back because the pictures they contain are not picklable.
+    """
+    from yanntricks.src.figure_cache import FigureCache
+    Figure.send_noerror = True
+    Defaults.LOGGING_FILENAME = log_filename
+    open(log_filename, "w").close()
+    outcome = {"status": "done", "files": None}
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        try:
+            try:
+                fun()
+            except PhystricksTestError as e:
+                print("The test of pspicture %s failed. %s" %
+                      (fun, e.justification))
+                print(e)
+                outcome = {"status": "failed", "code": e.code,
+                           "pspict": getattr(e.pspict, "name", None)}
+        except PhystricksNoError as e:
+            outcome["files"] = FigureCache.produced_files(e.figure)
+            outcome["modules"] = FigureCache.project_modules(fun)
+    with open(log_filename, "r", encoding="utf8") as f:
+        outcome["log"] = f.read()
+    os.remove(log_filename)
+    outcome["stdout"] = stdout.getvalue()
+    return outcome
+
 
 class FigureGenerationSuite:
     """
@@ -14,23 +56,42 @@ class FigureGenerationSuite:
 
     - ``first`` - the position in `test_list` at which we begin the tests
 
+    - ``use_cache`` - (default True) do not execute again the functions
+                      whose figures are unchanged since the previous
+                      generation. See :class:`FigureCache`.
+
+    - ``processes`` - the number of worker processes. When larger than 1,
+                      the figure functions are executed in a process pool.
+                      `None` means the number of CPUs. Default is 1.
+
     ATTRIBUTES:
 
-    - ``failed_list`` - a list of tuple `(function,pspict)` where 
-                        `function` is a function that produced a 
+    - ``failed_list`` - a list of tuple `(function,pspict)` where
+                        `function` is a function that produced a
                         :class:`PhystricksTestError` and
                         pspict is the produced pspicture.
+                        When using a process pool, `pspict` is the
+                        name of the pspicture.
 
     """
 
-    def __init__(self, test_list, first=0, title="My beautiful document"):
+    def __init__(self, test_list, first=0, title="My beautiful document",
+                 use_cache=True, processes=1):
         from yanntricks.src.Defaults import LOGGING_FILENAME
+        from yanntricks.src.Defaults import FIGURE_CACHE_FILENAME
+        from yanntricks.src.figure_cache import FigureCache
         self.test_list = test_list
         self.first = first
         self.title = title
+        self.processes = processes
+        if self.processes is None:
+            self.processes = os.cpu_count() or 1
         self.failed_list = []
         self.documentation_list = []
         self.to_be_recompiled_list = []
+        self.cache = None
+        if use_cache and FIGURE_CACHE_FILENAME is not None:
+            self.cache = FigureCache(FIGURE_CACHE_FILENAME)
         open(LOGGING_FILENAME, "w").close()
 
     def generate(self):
@@ -42,10 +103,28 @@ class FigureGenerationSuite:
         print("*  for %s" % self.title)
         print("********************************************")
         print("")
+        if self.processes > 1:
+            self._generate_parallel()
+        else:
+            self._generate_sequential()
+        if self.cache is not None:
+            self.cache.write()
+
+    def _print_header(self, i):
+        print("--------------------------- %s : figure %s/%s (failed: %s) -------------------------------------" %
+              (self.title, str(i+1), str(len(self.test_list)), str(len(self.failed_list))))
+        print(" ============= %s =============" % str(self.test_list[i]))
+
+    def _is_up_to_date(self, i):
+        return self.cache is not None \
+            and self.cache.is_up_to_date(self.test_list[i])
+
+    def _generate_sequential(self):
         for i in range(self.first, len(self.test_list)):
-            print("--------------------------- %s : figure %s/%s (failed: %s) -------------------------------------" %
-                  (self.title, str(i+1), str(len(self.test_list)), str(len(self.failed_list))))
-            print(" ============= %s =============" % str(self.test_list[i]))
+            self._print_header(i)
+            if self._is_up_to_date(i):
+                print("Unchanged since the previous generation. Skipped.")
+                continue
             try:
                 try:
                     self.test_list[i]()
@@ -54,19 +133,62 @@ class FigureGenerationSuite:
                           (self.test_list[i], e.justification))
                     print(e)
                     self.failed_list.append((self.test_list[i], e.pspict))
+                    if self.cache is not None:
+                        self.cache.forget(self.test_list[i])
                     if e.code == 2:
                         self.to_be_recompiled_list.append(
                             (self.test_list[i], e.pspict))
             except PhystricksNoError as e:
-                pass
+                if self.cache is not None:
+                    self.cache.record(self.test_list[i], e.figure)
+
+    def _generate_parallel(self):
+        """
+        Execute the figure functions in a pool of `self.processes` workers.
+
+        The outputs and the logs of the figures are merged in the order of
+        `test_list`, whatever the order in which the workers finish.
+        """
+        indices = []
+        for i in range(self.first, len(self.test_list)):
+            if self._is_up_to_date(i):
+                self._print_header(i)
+                print("Unchanged since the previous generation. Skipped.")
+            else:
+                indices.append(i)
+        log_filenames = ["{}.{}".format(Defaults.LOGGING_FILENAME, i)
+                         for i in indices]
+        import concurrent.futures
+        with concurrent.futures.ProcessPoolExecutor(self.processes) as executor:
+            outcomes = executor.map(_generate_in_worker,
+                                    [self.test_list[i] for i in indices],
+                                    log_filenames)
+            for i, outcome in zip(indices, outcomes):
+                fun = self.test_list[i]
+                self._print_header(i)
+                print(outcome["stdout"], end="")
+                with open(Defaults.LOGGING_FILENAME, "a", encoding="utf8") as f:
+                    f.write(outcome["log"])
+                if outcome["status"] == "failed":
+                    self.failed_list.append((fun, outcome["pspict"]))
+                    if self.cache is not None:
+                        self.cache.forget(fun)
+                    if outcome["code"] == 2:
+                        self.to_be_recompiled_list.append(
+                            (fun, outcome["pspict"]))
+                elif outcome["files"] is not None and self.cache is not None:
+                    self.cache.record_files(fun, outcome["files"],
+                                            outcome["modules"])
 
     def summary(self):
         """
-        Print the list of failed tests and try to give the 
+        Print the list of failed tests and try to give the
         lines to be included in the LaTeX file in order to
         visualize them.
         """
         all_tests_passed = True
+        if self.cache is not None:
+            print(self.cache.report())
         if len(self.failed_list) != 0:
             print("The list of function to visually checked :")
             print(function_list_to_figures_list(self.failed_list))
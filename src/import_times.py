@@ -0,0 +1,131 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+"""
+Measure the time spent importing each part of yanntricks.
+
+When the environment variable `YANNTRICKS_IMPORT_TIMES` is set, the
+import of each yanntricks module, of `sage.all` and of each top-level
+package is timed, and the times are printed at the end of the program.
+
+The time of a module does not include the modules it imports which
+are timed too. So a large time for `yanntricks.src.Foo` means that
+`Foo` itself (or a non-timed module it imports) is slow to import.
+
+The modules which are only needed by some figures (like
+`concurrent.futures` for the parallel generation or `sqlite3` for the
+box metrics database) are imported on first use; their time is then
+recorded when they are used.
+"""
+
+import os
+import sys
+import time
+import atexit
+
+
+# The time (in seconds) spent importing each timed module, without
+# the timed modules it imports. See `enable_import_times`.
+IMPORT_TIMES = {}
+
+# The stack of the imports being timed : the name and the time
+# of the timed sub-imports.
+_import_stack = []
+
+
+def _is_timed(module_name):
+    return (module_name.startswith("yanntricks")
+            or module_name == "sage.all"
+            or "." not in module_name)
+
+
+class _TimedLoader:
+    """
+    A loader which delegates everything to `loader` and records
+    the time taken by `exec_module`.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        _import_stack.append([module.__name__, 0])
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            duration = time.perf_counter() - start
+            name, children = _import_stack.pop()
+            IMPORT_TIMES[name] = duration - children
+            if _import_stack:
+                _import_stack[-1][1] += duration
+
+
+class _TimingFinder:
+    """
+    A meta path finder which finds the modules with the other finders
+    and wraps the loader of the timed ones in a `_TimedLoader`.
+    """
+
+    def find_spec(self, fullname, path, target=None):
+        if not _is_timed(fullname):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None \
+                        and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader)
+                return spec
+        return None
+
+
+def enable_import_times():
+    """
+    Start timing the imports and print the report at exit.
+
+    Only the modules imported after this call are timed.
+    """
+    if any(isinstance(f, _TimingFinder) for f in sys.meta_path):
+        return
+    sys.meta_path.insert(0, _TimingFinder())
+    atexit.register(lambda: print(import_times_report()))
+
+
+def import_times_report(number=30):
+    """Return the `number` largest import times as a text."""
+    a = ["Import times (without the timed sub-imports) :"]
+    for module_name, duration in sorted(IMPORT_TIMES.items(),
+                                        key=lambda x: -x[1])[:number]:
+        a.append(f"   {duration:8.3f} s  {module_name}")
+    a.append(f"   {sum(IMPORT_TIMES.values()):8.3f} s  total")
+    return "\n".join(a)
+
+
+if os.environ.get("YANNTRICKS_IMPORT_TIMES"):
+    enable_import_times()
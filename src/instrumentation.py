@@ -0,0 +1,147 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+"""
+Measure where the time goes during the creation of a picture.
+
+An `Instrumentation` records nested timers (the phases) and counters.
+Each phase can be attributed to the class of an object, so that the
+time spent by each kind of graph is available too.
+
+The instrumentation of a picture is enabled by
+`Picture.enable_instrumentation` or, for all the pictures, by
+setting the environment variable `YANNTRICKS_INSTRUMENTATION`.
+The results are written by `Figure.write_the_file` in a JSON file
+next to the '.comment' file.
+
+When disabled, the picture holds `NO_INSTRUMENTATION`, whose methods
+do nothing.
+"""
+
+import os
+import time
+import contextlib
+
+
+def instrumentation_from_environment():
+    """Return True if the environment asks for the instrumentation."""
+    return os.environ.get("YANNTRICKS_INSTRUMENTATION", "") not in ("", "0")
+
+
+def _new_node():
+    return {"time": 0.0, "calls": 0, "children": {}}
+
+
+class Instrumentation:
+    """
+    Nested timers and counters.
+
+    - `phases` : the tree of the phases. Each node is a dictionary
+        with the total time (seconds), the number of calls and the
+        children phases, that is the phases started inside it.
+    - `by_class` : for each class name, the time and the number of
+        calls of each phase attributed to an object of that class.
+        The times are inclusive : the time of a graph includes the
+        time of the graphs it draws itself (its marks, for example).
+    - `counters` : named integers.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.phases = _new_node()
+        self.by_class = {}
+        self.counters = {}
+        self._stack = [self.phases]
+
+    @contextlib.contextmanager
+    def phase(self, name, obj=None):
+        """
+        Time the block as the phase `name`, inside the current phase.
+
+        If `obj` is given, the time is also attributed to its class.
+        """
+        node = self._stack[-1]["children"].setdefault(name, _new_node())
+        self._stack.append(node)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            node["time"] += elapsed
+            node["calls"] += 1
+            if obj is not None:
+                per_phase = self.by_class.setdefault(type(obj).__name__, {})
+                record = per_phase.setdefault(name, {"time": 0.0, "calls": 0})
+                record["time"] += elapsed
+                record["calls"] += 1
+
+    def count(self, name, n=1):
+        """Add `n` to the counter `name`."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def as_dict(self):
+        """Return the recorded data as a JSON-compatible dictionary."""
+        return {"phases": self.phases["children"],
+                "by_class": self.by_class,
+                "counters": self.counters}
+
+    def report(self):
+        """Return the phases of each class, the slowest first, as text."""
+        a = ["Time by object class and phase :"]
+        records = [(r["time"], r["calls"], name, phase)
+                   for name, phases in self.by_class.items()
+                   for phase, r in phases.items()]
+        for duration, calls, name, phase in sorted(records, reverse=True):
+            a.append(f"   {duration:8.3f} s  {calls:6d}  {name} {phase}")
+        return "\n".join(a)
+
+
+class _NoInstrumentation:
+    """The instrumentation that does nothing."""
+
+    enabled = False
+    _null = contextlib.nullcontext()
+
+    def phase(self, name, obj=None):     # pylint:disable=unused-argument
+        return self._null
+
+    def count(self, name, n=1):
+        pass
+
+
+NO_INSTRUMENTATION = _NoInstrumentation()
+
+
+def write_instrumentation(filename, pictures):
+    """
+    Write the instrumentation of the enabled pictures in `filename`
+    (JSON), indexed by the picture names.
+
+    Nothing is written when no picture is instrumented.
+    """
+    data = {p.name: p.instrumentation.as_dict() for p in pictures
+            if p.instrumentation.enabled}
+    if not data:
+        return
+    import json
+    with open(filename, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
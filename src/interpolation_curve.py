@@ -99,6 +99,9 @@ class InterpolationCurve(ObjectGraph):
                      for i in range(n)]).get_minmax_data()
         {'xmax': 1.0, 'xmin': -1.0, 'ymax': 1.0, 'ymin': -1.0}
         """
+        from yanntricks.src.points_array import PointsArray
+        if isinstance(self.points_list, PointsArray):
+            return self.points_list.minmax_data()
         xmin = min([P.x for P in self.points_list])
         xmax = max([P.x for P in self.points_list])
         ymin = min([P.y for P in self.points_list])
@@ -163,6 +166,34 @@ class InterpolationCurve(ObjectGraph):
         """
         return self.bounding_box(pspict)
 
+    def simplified_points(self, pspict=None):
+        """
+        Return the list of points simplified up to the
+        `simplification_tolerance` of `pspict`.
+
+        The distances are measured in the picture, that is after
+        `xunit` and `yunit`. The number of removed points is recorded
+        in `pspict` (see `Picture.simplification_report`).
+        """
+        from yanntricks.src.points_array import PointsArray
+        from yanntricks.src.points_array import simplified_indices
+        pl = self.points_list
+        tolerance = getattr(pspict, "simplification_tolerance", None)
+        if not tolerance or len(pl) < 3:
+            return pl
+        if isinstance(pl, PointsArray):
+            xs, ys = pl.xs, pl.ys
+        else:
+            xs = numpy.array([float(P.x) for P in pl])
+            ys = numpy.array([float(P.y) for P in pl])
+        kept = simplified_indices(xs*float(pspict.xunit),
+                                  ys*float(pspict.yunit), float(tolerance))
+        pspict.record_simplification(self.context_object or self,
+                                     len(pl), len(kept))
+        if isinstance(pl, PointsArray):
+            return pl[kept]
+        return [pl[i] for i in kept]
+
     def tikz_code(self, pspict=None):
         from yanntricks.src.Constructors import LagrangePolynomial
         # LaTeX cannot parse too long lines (few thousand of letters). But
@@ -170,25 +201,29 @@ class InterpolationCurve(ObjectGraph):
         # we easily break that limit of line length.
         # Thus we only ask for 3 digits after the point.
         pl = self.points_list
+        if self.mode == "trivial" or self.mode is None:
+            # The other modes need all the points.
+            pl = self.simplified_points(pspict)
         if self.mode == "trivial":
             # One cannot draw each segment separately :
             # this causes the parameters.style='dashed'
             # to not work for example.
+            from yanntricks.src.points_array import PointsArray
             a = []
             sublen = max(len(pl)/500, 1)   # We draw packs of 100 points
-            list_of_list = numpy.array_split(pl, sublen)
-            for spl in list_of_list:
-                l = [abs(P.x) for P in spl]
-                l.extend([abs(P.y) for P in spl])
-                namax = max(l)  # Largest coordinate present in the curve.
-
-                # The absolute value is for the case where the whole
-                # curve is in the ball of radius 0.001 for example.
-
-                # digits=3+abs(ceil(  log(namax,10) ))
+            # Split the indices rather than the list : `pl` can be
+            # a `PointsArray`.
+            list_of_indices = numpy.array_split(numpy.arange(len(pl)), sublen)
+            for indices in list_of_indices:
+                spl = pl[indices[0]:indices[-1]+1]
                 digits = 5
                 params = self.params(language="tikz")
-                str_path = "--".join([x.coordinates(digits=digits, pspict=pspict) for x in spl])
+                if isinstance(spl, PointsArray):
+                    coordinates = spl.coordinates(digits=digits, pspict=pspict)
+                else:
+                    coordinates = [x.coordinates(digits=digits, pspict=pspict)
+                                   for x in spl]
+                str_path = "--".join(coordinates)
                 a.append(f"\\draw [{params}] {str_path};")
             return "\n".join(a)
         elif self.mode == "quadratic":
@@ -0,0 +1,139 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+"""
+The zero level set of a function given on a grid (marching squares).
+
+The function is given by its values on a rectangular grid. In each
+cell, the sign of the four corners gives the edges crossed by the
+curve; the crossing points are obtained by linear interpolation along
+the edges. The segments of the cells are then joined into paths.
+"""
+
+import numpy
+
+
+# The edges of a cell : 0 bottom, 1 right, 2 top, 3 left.
+# The corners : 0 bottom-left, 1 bottom-right, 2 top-right, 3 top-left.
+# The case of a cell is the sum of 2**k for the positive corners k.
+# For each case, the segments as pairs of edges.
+_SEGMENTS = {1: [(3, 0)], 2: [(0, 1)], 3: [(3, 1)], 4: [(1, 2)],
+             6: [(0, 2)], 7: [(3, 2)], 8: [(2, 3)], 9: [(0, 2)],
+             11: [(1, 2)], 12: [(1, 3)], 13: [(0, 1)], 14: [(3, 0)]}
+
+# The saddle cases depend on the sign of the center of the cell
+# (mean of the corners).
+_SADDLE_SEGMENTS = {(5, True): [(0, 1), (2, 3)],
+                    (5, False): [(3, 0), (1, 2)],
+                    (10, True): [(3, 0), (1, 2)],
+                    (10, False): [(0, 1), (2, 3)]}
+
+
+def contour_paths(values, xs, ys):
+    """
+    Return the paths on which the function vanishes.
+
+    INPUT:
+
+    - ``values`` - the array of the values of the function;
+        `values[j, i]` is the value at the point `(xs[i], ys[j])`.
+        The cells with a non finite corner are ignored.
+
+    - ``xs``, ``ys`` - the coordinates of the grid.
+
+    OUTPUT:
+
+    A list of arrays of shape (n, 2); each array is the list of the
+    points of a path. The closed paths end with their first point.
+    """
+    values = numpy.asarray(values, dtype=float)
+    xs = numpy.asarray(xs, dtype=float)
+    ys = numpy.asarray(ys, dtype=float)
+    ny, nx = values.shape
+    if nx < 2 or ny < 2:
+        return []
+
+    positive = values > 0
+    case = (positive[:-1, :-1].astype(int)
+            + 2*positive[:-1, 1:]
+            + 4*positive[1:, 1:]
+            + 8*positive[1:, :-1])
+    finite = numpy.isfinite(values)
+    valid = (finite[:-1, :-1] & finite[:-1, 1:]
+             & finite[1:, 1:] & finite[1:, :-1])
+    cells = numpy.argwhere(valid & (case != 0) & (case != 15))
+
+    # The horizontal edge from (j, i) to (j, i+1) has the number
+    # j*nx+i; the vertical edge from (j, i) to (j+1, i) has the
+    # number nx*ny+j*nx+i.
+    shift = nx*ny
+    neighbours = {}
+    for j, i in cells:
+        c = case[j, i]
+        if c in (5, 10):
+            center = (values[j, i]+values[j, i+1]
+                      + values[j+1, i+1]+values[j+1, i])/4
+            segments = _SADDLE_SEGMENTS[(c, bool(center > 0))]
+        else:
+            segments = _SEGMENTS[c]
+        edges = (j*nx+i, shift+j*nx+i+1, (j+1)*nx+i, shift+j*nx+i)
+        for a, b in segments:
+            neighbours.setdefault(edges[a], []).append(edges[b])
+            neighbours.setdefault(edges[b], []).append(edges[a])
+
+    def crossing(edge):
+        """The point where the function vanishes on the edge."""
+        if edge < shift:
+            j, i = divmod(edge, nx)
+            a, b = values[j, i], values[j, i+1]
+            t = a/(a-b)
+            return (xs[i]+t*(xs[i+1]-xs[i]), ys[j])
+        j, i = divmod(edge-shift, nx)
+        a, b = values[j, i], values[j+1, i]
+        t = a/(a-b)
+        return (xs[i], ys[j]+t*(ys[j+1]-ys[j]))
+
+    visited = set()
+
+    def walk(start):
+        chain = [start]
+        visited.add(start)
+        current = start
+        while True:
+            following = [e for e in neighbours[current] if e not in visited]
+            if not following:
+                break
+            current = following[0]
+            visited.add(current)
+            chain.append(current)
+        if len(chain) > 2 and start in neighbours[current]:
+            chain.append(start)
+        return chain
+
+    chains = []
+    # First the open paths, which start on an edge of degree one ...
+    for edge in sorted(neighbours):
+        if edge not in visited and len(neighbours[edge]) == 1:
+            chains.append(walk(edge))
+    # ... then the closed ones.
+    for edge in sorted(neighbours):
+        if edge not in visited:
+            chains.append(walk(edge))
+    return [numpy.array([crossing(e) for e in chain]) for chain in chains]
@@ -1,5 +1,6 @@
 """PathsKeeper is a class which keeps the filesnames conventions."""
 
+import os
 import importlib.util
 from pathlib import Path
 
@@ -9,6 +10,70 @@ from yanntricks.src.relative_file import RelativeFile
 dprint = print  #pylint: disable=invalid-name
 
 
+def resolved_directory(path):
+    """
+    Return the resolved path.
+
+    Raise `ValueError` if the directory does not exist.
+    """
+    abs_path = Path('.') / path
+    if not abs_path.exists():
+        raise ValueError(f"The directory {abs_path} does not exist.")
+    return Path(path).resolve()
+
+
+def read_paths():
+    """
+    Return the paths dictionary: some defaults or what we find
+    in `Directories.py`.
+    """
+    paths = {}
+    paths["main_tex"] = resolved_directory('.')
+    paths["pictures_tizk"] = resolved_directory('.')
+    paths["pictures_tex"] = resolved_directory('.')
+    paths["sage_dir"] = resolved_directory('.')
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "Directories", "Directories.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except FileNotFoundError:
+        # In this case we are left with the defaults
+        return paths
+
+    paths["pictures_tex"] = resolved_directory(module.PICTURES_TEX)
+    paths["pictures_src"] = resolved_directory(module.PICTURES_SRC)
+    paths["pictures_tikz"] = resolved_directory(module.PICTURES_TIKZ)
+    paths["main_tex"] = resolved_directory(module.MAIN_TEX)
+    paths["sage_dir"] = resolved_directory(module.SAGE_DIR)
+    return paths
+
+
+# The paths read for each working directory, with the modification
+# time of `Directories.py` at the time it was read.
+_paths_registry = {}
+
+
+def shared_paths():
+    """
+    Return the paths dictionary of the current working directory.
+
+    `Directories.py` is executed once per process and then again only
+    when its modification time changes. The returned dictionary is
+    shared: do not modify it.
+    """
+    cwd = os.getcwd()
+    try:
+        mtime = os.stat("Directories.py").st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    cached = _paths_registry.get(cwd)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, read_paths())
+        _paths_registry[cwd] = cached
+    return cached[1]
+
+
 class PathsKeeper:
     """
     An object of this class keeps the paths.
@@ -17,37 +82,30 @@ class PathsKeeper:
     which the tex files have to be put.
     In all cases if the file "Directories.py" is not found,
     everything will return the unmodified filename.
+
+    The paths are not read at creation, but when they are used for
+    the first time, from the registry shared by the whole process
+    (see `shared_paths`).
     """
 
     def __init__(self):
         """
         Initialize with some defaults or what we find in `Defaults.py`.
         """
-        self.paths = {}
-        self.initialize()
+        self._paths = None
+
+    @property
+    def paths(self):
+        """The dictionary of the paths."""
+        if self._paths is None:
+            self._paths = shared_paths()
+        return self._paths
 
     def initialize(self):
         """
         Provide some defaults paths, or read in `Directory.py`.
         """
-        self["main_tex"] = Path('.')
-        self["pictures_tizk"] = Path('.')
-        self["pictures_tex"] = Path('.')
-        self["sage_dir"] = Path('.')
-        try:
-            spec = importlib.util.spec_from_file_location(
-                "Directories", "Directories.py")
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-        except FileNotFoundError:
-            # In this case we are left with the defaults
-            return
-
-        self["pictures_tex"] = module.PICTURES_TEX
-        self["pictures_src"] = module.PICTURES_SRC
-        self["pictures_tikz"] = module.PICTURES_TIKZ
-        self["main_tex"] = module.MAIN_TEX
-        self["sage_dir"] = module.SAGE_DIR
+        self._paths = shared_paths()
 
     def create(self, key, path):
         """Return the `RelativeFile` corresponding to the given path."""
@@ -58,12 +116,12 @@ class PathsKeeper:
         """
         Add a path to self's path dictionary.
 
-        The path is resolved.
+        The path is resolved. The shared dictionary is copied before
+        being modified.
         """
-        abs_path = Path('.') / path
-        if not abs_path.exists():
-            raise ValueError(f"The directory {abs_path} does not exist.")
-        self.paths[key] = Path(path).resolve()
+        paths = dict(self.paths)
+        paths[key] = resolved_directory(path)
+        self._paths = paths
 
     def __getitem__(self, key):
         """Return the saved path under the given key."""
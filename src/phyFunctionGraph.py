@@ -19,6 +19,7 @@
 # email: laurent@claessens-donadello.eu
 
 
+import numpy
 from sage.all import lazy_attribute, var, numerical_approx, sqrt
 
 from yanntricks.src.ObjectGraph import ObjectGraph
@@ -122,6 +123,8 @@ class phyFunctionGraph(GenericCurve, ObjectGraph):
         curve.linear_plotpoints = self.linear_plotpoints
         curve.curvature_plotpoints = self.curvature_plotpoints
         curve.added_plotpoints = self.added_plotpoints
+        curve.adaptive_tolerance = self.adaptive_tolerance
+        curve.adaptive_max_plotpoints = self.adaptive_max_plotpoints
 
         curve._representativeParameters = self._representativeParameters
         self._parametric_curve = curve
@@ -182,6 +185,31 @@ class phyFunctionGraph(GenericCurve, ObjectGraph):
         else:
             return self.derivative(n-1).derivative()
 
+    @lazy_attribute
+    def numeric_derivatives(self):
+        """
+        The numpy functions of the first and second derivatives,
+        compiled once for the advised mark angles.
+
+        None if one of them cannot be compiled.
+        """
+        functions = (self.derivative().numpy_function,
+                     self.derivative(2).numpy_function)
+        if None in functions:
+            return None
+        return functions
+
+    @lazy_attribute
+    def _graph_curve(self):
+        """
+        The curve x -> (x, f(x)), which gives the normal vectors.
+
+        It is kept in order to compile its derivatives only once.
+        """
+        from yanntricks.src.Constructors import ParametricCurve
+        x = var('x')
+        return ParametricCurve(x, self)
+
     def get_point(self, x, advised=True):
         from yanntricks.src.Utilities import general_function_get_point
         return general_function_get_point(self, x, advised)
@@ -205,10 +233,7 @@ class phyFunctionGraph(GenericCurve, ObjectGraph):
         sage: print f.get_normal_vector(0)
         <vector I=<Point(0,0)> F=<Point(0,-1)>>
         """
-        from yanntricks.src.Constructors import ParametricCurve
-        x = var('x')
-        F = ParametricCurve(x, self)
-        return F.get_normal_vector(xx)
+        return self._graph_curve.get_normal_vector(xx)
 
     def get_tangent_vector(self, x, advised=False, numerical=False):
         """Return a tangent vector at the point (x,f(x))."""
@@ -301,6 +326,43 @@ class phyFunctionGraph(GenericCurve, ObjectGraph):
     def curvature(self):
         return self.parametric_curve().curvature()
 
+    @lazy_attribute
+    def numpy_function(self):
+        """
+        The function evaluating `self` on a numpy array of floats.
+
+        The values at which the function is not defined or not
+        real (up to 0.0001) are NaN.
+
+        None if the function cannot be compiled. This happens when
+        the function is not symbolic or has free variables.
+        """
+        import sympy
+        x = var('x')
+        try:
+            lambdified = sympy.lambdify(sympy.Symbol('x'),
+                                        self(x)._sympy_(), "numpy")
+        except (TypeError, ValueError, AttributeError,
+                NotImplementedError, sympy.SympifyError):
+            return None
+
+        def numpy_function(values):
+            with numpy.errstate(all="ignore"):
+                y = numpy.asarray(lambdified(values))
+            if numpy.iscomplexobj(y):
+                y = numpy.where(abs(y.imag) < 0.0001, y.real, numpy.nan)
+            return numpy.broadcast_to(y, numpy.shape(values)).astype(float)
+        try:
+            numpy_function(numpy.array([float(self.mx or 0)]))
+        except (TypeError, ValueError, NameError, ZeroDivisionError):
+            return None
+        return numpy_function
+
+    def numpy_functions(self):
+        if self.numpy_function is None:
+            return None
+        return (lambda values: values, self.numpy_function)
+
     def get_wavy_points(self, mx, Mx, dx, dy):
         curve = self.parametric_curve()
         return curve.get_wavy_points(mx, Mx, dx, dy)
@@ -348,6 +410,17 @@ class phyFunctionGraph(GenericCurve, ObjectGraph):
         minmax['xmax'] = Mx
         ymin = 1000
         ymax = -1000
+        if self.numpy_function is not None:
+            params = numpy.array([float(x)
+                                  for x in self.representativeParameters()])
+            y = self.numpy_function(params)
+            y = y[numpy.isfinite(y)]
+            if len(y) > 0:
+                ymax = max(ymax, float(y.max()))
+                ymin = min(ymin, float(y.min()))
+            minmax['ymax'] = ymax
+            minmax['ymin'] = ymin
+            return minmax
         for x in self.representativeParameters():
             valid = True
             try:
@@ -2,24 +2,75 @@
 # email: laurent@claessens-donadello.eu
 
 
+import math
+import contextlib
+
 from sage.all import lazy_attribute, numerical_approx
 from sage.all import cos, sin, SR, pi, var
 
+import yanntricks.src.Defaults as Defaults
 from yanntricks.src.ObjectGraph import ObjectGraph
 
 
 dprint = print
 
 
+@contextlib.contextmanager
+def numeric_points(numeric=True):
+    """
+    Create float-native points inside the `with` block.
+
+    EXAMPLES::
+
+        sage: from yanntricks import *
+        sage: with numeric_points():
+        ....:     P = Point(1, 2)+Point(pi, 0)
+        sage: print(P)
+        <Point(4.141592653589793,2.0)>
+    """
+    previous = Defaults.NUMERIC_POINTS
+    Defaults.NUMERIC_POINTS = numeric
+    try:
+        yield
+    finally:
+        Defaults.NUMERIC_POINTS = previous
+
+
 class Point(ObjectGraph):
-    def __init__(self, a, b):
-        self.x = SR(a)
-        self.y = SR(b)
+    """
+    A point in the plane.
+
+    - `a`, `b` : the coordinates.
+    - `numeric` : if True, the coordinates are stored as floats and
+                  the points derived from this one (sums, translations,
+                  ...) are numeric too. This is much faster than
+                  the symbolic computations, but exact values are lost.
+                  Default is `Defaults.NUMERIC_POINTS`, see also
+                  `numeric_points`.
+    """
+
+    def __init__(self, a, b, numeric=None):
+        if numeric is None:
+            numeric = Defaults.NUMERIC_POINTS
+        self.numeric = numeric
+        if numeric:
+            self.x = float(a)
+            self.y = float(b)
+        else:
+            self.x = SR(a)
+            self.y = SR(b)
         ObjectGraph.__init__(self, self)
         self.point = self.obj
         self.add_option("PointSymbol=*")
         self._advised_mark_angle = None
 
+        if numeric:
+            if abs(self.x) < 0.00001:
+                self.x = 0.0
+            if abs(self.y) < 0.00001:
+                self.y = 0.0
+            return
+
         try:
             ax = abs(numerical_approx(self.x))
             if ax < 0.00001 and ax > 0:
@@ -35,8 +86,13 @@ class Point(ObjectGraph):
             self._advised_mark_angle = self.angle()
         return self._advised_mark_angle
 
+    def derived_point(self, a, b):
+        """Return the point (a,b), numeric if `self` is numeric."""
+        return Point(a, b, numeric=self.numeric)
+
     def numerical_approx(self):
-        return Point(numerical_approx(self.x), numerical_approx(self.y))
+        return self.derived_point(numerical_approx(self.x),
+                                  numerical_approx(self.y))
 
     def projection(self, seg, direction=None, advised=False):
         """
@@ -118,13 +174,20 @@ class Point(ObjectGraph):
             alpha = theta.radian
         else:
             alpha = radian(theta, number=True)
+        if self.numeric:
+            alpha = float(alpha)
+            cos_alpha = math.cos(alpha)
+            sin_alpha = math.sin(alpha)
+        else:
+            cos_alpha = cos(alpha)
+            sin_alpha = sin(alpha)
         if pspict:
             A = pspict.xunit
             B = pspict.yunit
-            xP = r*cos(alpha)/A
-            yP = r*sin(alpha)/B
+            xP = r*cos_alpha/A
+            yP = r*sin_alpha/B
             return self.translate(Vector(xP, yP))
-        return Point(self.x+r*cos(alpha), self.y+r*sin(alpha))
+        return self.derived_point(self.x+r*cos_alpha, self.y+r*sin_alpha)
 
     def get_polar_point(self, r, theta, pspict=None):
         return self.getPolarPoint(r, theta, pspict)
@@ -195,12 +258,11 @@ class Point(ObjectGraph):
     #        - either one vector
     #        - either two numbers
     def translate(self, a, b=None):
-        from yanntricks.src.affine_vector import AffineVector
         if b is None:
-            v = a
-        else:
-            v = AffineVector(Point(0, 0), Point(a, b))
-        return Point(self.x+v.Dx, self.y+v.Dy)
+            return self.derived_point(self.x+a.Dx, self.y+a.Dy)
+        # As for the vector, the displacements smaller than 1e-5 are zero.
+        v = self.derived_point(a, b)
+        return self.derived_point(self.x+v.x, self.y+v.y)
 
     def origin(self, P):
         """
@@ -333,7 +395,17 @@ class Point(ObjectGraph):
         x = self.x
         y = self.y
 
-        if pspict:
+        if self.numeric or (pspict is not None and pspict.numeric_points):
+            x = float(x)
+            y = float(y)
+            if pspict:
+                x = x*float(pspict.xunit)
+                y = y*float(pspict.yunit)
+                if pspict.rotation_angle is not None:
+                    ang = math.radians(float(pspict.rotation_angle))
+                    x, y = x*math.cos(ang)+y*math.sin(ang), \
+                        -x*math.sin(ang)+y*math.cos(ang)
+        elif pspict:
             x = x*pspict.xunit
             y = y*pspict.yunit
             if pspict.rotation_angle is not None:
@@ -349,7 +421,7 @@ class Point(ObjectGraph):
         return str("("+sx+","+sy+")")
 
     def copy(self):
-        return Point(self.x, self.y)
+        return self.derived_point(self.x, self.y)
 
     def mark_point(self, pspict=None):
         return self
@@ -376,8 +448,8 @@ class Point(ObjectGraph):
             yunit = pspict.yunit
         Xradius = 0.1/xunit
         Yradius = 0.1/yunit
-        bb = BoundingBox(Point(self.x-Xradius, self.y-Yradius),
-                         Point(self.x+Xradius, self.y+Yradius))
+        bb = BoundingBox(self.derived_point(self.x-Xradius, self.y-Yradius),
+                         self.derived_point(self.x+Xradius, self.y+Yradius))
         for obj in self.added_objects[pspict]:
             bb.append(obj, pspict)
         return bb
@@ -500,7 +572,7 @@ class Point(ObjectGraph):
                                 "something which is not a Point "
                                 " neither a Vector. Sorry, "
                                 f" but I'm going to crash : {v},{type(v)}")
-        return Point(self.x+dx, self.y+dy)
+        return self.derived_point(self.x+dx, self.y+dy)
 
     def __add__(self, other):
         """Addition of coordinates."""
@@ -510,7 +582,7 @@ class Point(ObjectGraph):
         else:
             Dx = other.x
             Dy = other.y
-        return Point(self.x+Dx, self.y+Dy)
+        return self.derived_point(self.x+Dx, self.y+Dy)
 
 # Subtract coordinatewise two points.
 #
@@ -526,16 +598,16 @@ class Point(ObjectGraph):
         else:
             Dx = other.x
             Dy = other.y
-        return Point(self.x-Dx, self.y-Dy)
+        return self.derived_point(self.x-Dx, self.y-Dy)
 
     def __neg__(self):
-        return Point(-self.x, -self.y)
+        return self.derived_point(-self.x, -self.y)
 
     def __mul__(self, r):
-        return Point(r*self.x, r*self.y)
+        return self.derived_point(r*self.x, r*self.y)
 
     def __div__(self, r):
-        return Point(self.x/r, self.y/r)
+        return self.derived_point(self.x/r, self.y/r)
 
     def __truediv__(self, r):
         return self.__div__(r)
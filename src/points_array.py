@@ -0,0 +1,116 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+"""A list of points stored as two numpy arrays of coordinates."""
+
+import numpy
+
+
+def simplified_indices(xs, ys, tolerance):
+    """
+    Return the indices of the points kept by the Ramer-Douglas-Peucker
+    simplification of the polyline (xs, ys).
+
+    The removed points are at most at distance `tolerance` of the
+    simplified polyline. The first and last points are always kept,
+    as well as the points with non finite coordinates.
+    """
+    xs = numpy.asarray(xs, dtype=float)
+    ys = numpy.asarray(ys, dtype=float)
+    n = len(xs)
+    keep = numpy.zeros(n, dtype=bool)
+    if n == 0:
+        return numpy.flatnonzero(keep)
+    keep[0] = keep[-1] = True
+    stack = [(0, n-1)]
+    while stack:
+        i, j = stack.pop()
+        if j <= i+1:
+            continue
+        ax, ay = xs[i], ys[i]
+        dx, dy = xs[j]-ax, ys[j]-ay
+        px, py = xs[i+1:j]-ax, ys[i+1:j]-ay
+        length2 = dx*dx+dy*dy
+        with numpy.errstate(all="ignore"):
+            if length2 > 0:
+                # distance to the segment, not to the line: the
+                # polyline can go back.
+                t = numpy.clip((px*dx+py*dy)/length2, 0, 1)
+                dist = numpy.hypot(px-t*dx, py-t*dy)
+            else:
+                dist = numpy.hypot(px, py)
+        dist = numpy.nan_to_num(dist, nan=numpy.inf)
+        k = int(numpy.argmax(dist))
+        if dist[k] > tolerance:
+            k = i+1+k
+            keep[k] = True
+            stack.append((i, k))
+            stack.append((k, j))
+    return numpy.flatnonzero(keep)
+
+
+class PointsArray:
+    """
+    A list of points stored as two arrays of floats.
+
+    It behaves like a list of `Point`: the points are only created
+    when they are asked one by one. The operations on the whole list
+    (min and max, tikz coordinates) work on the arrays.
+
+    - `xs`, `ys` : the coordinates, as numpy arrays of floats.
+    """
+
+    def __init__(self, xs, ys):
+        self.xs = numpy.asarray(xs, dtype=float)
+        self.ys = numpy.asarray(ys, dtype=float)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __getitem__(self, i):
+        from yanntricks.src.point import Point
+        if isinstance(i, (slice, list, numpy.ndarray)):
+            return PointsArray(self.xs[i], self.ys[i])
+        return Point(self.xs[i], self.ys[i], numeric=True)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def minmax_data(self):
+        """Return the dictionary of the extremal coordinates."""
+        return {'xmin': float(self.xs.min()), 'xmax': float(self.xs.max()),
+                'ymin': float(self.ys.min()), 'ymax': float(self.ys.max())}
+
+    def coordinates(self, digits=5, pspict=None):
+        """
+        Return the list of the coordinates of the points as strings.
+
+        This is the same as
+            [P.coordinates(digits, pspict) for P in self]
+        without creating the points.
+        """
+        from yanntricks.src.Utilities import format_coordinates
+        xy = numpy.column_stack((self.xs, self.ys))
+        if pspict:
+            return format_coordinates(xy, digits=digits, xunit=pspict.xunit,
+                                      yunit=pspict.yunit,
+                                      rotation_angle=pspict.rotation_angle)
+        return format_coordinates(xy, digits=digits)
@@ -2,6 +2,34 @@
 
 from yanntricks.src.Separator import Separator
 
+
+def collapse_double_newlines(chunks):
+    """
+    Iterate over the pieces of `"".join(chunks).replace("\\n\\n", "\\n")`
+    without building the whole text.
+
+    A newline at the end of a piece can be the first of a pair whose
+    second one is at the beginning of the next piece: it is kept
+    aside until we know.
+    """
+    carry = ""
+    for chunk in chunks:
+        text = carry+chunk
+        if not text:
+            continue
+        # In a run of newlines, the pairs are replaced from the start.
+        # If the final run has an odd length, its last newline is free.
+        run = len(text)-len(text.rstrip("\n"))
+        if run % 2 == 1:
+            carry = "\n"
+            text = text[:-1]
+        else:
+            carry = ""
+        yield text.replace("\n\n", "\n")
+    if carry:
+        yield carry
+
+
 class SeparatorList(object):
     """Represent a dictionary of :class:`Separator`"""
 
@@ -22,9 +50,17 @@ class SeparatorList(object):
         else:
             self.separator_list.append(separator)
 
+    def chunks(self, not_to_be_used=[]):
+        """Return the list of the pieces of code of the separators."""
+        chunks = []
+        for separator in self.separator_list:
+            if separator.title not in not_to_be_used:
+                chunks.extend(separator.chunks())
+        return chunks
+
     def code(self, not_to_be_used=[]):
 
-        return "".join(separator.code() for separator in self.separator_list if separator.title not in not_to_be_used)
+        return "".join(self.chunks(not_to_be_used))
 
     def fusion(self, title_list, new_title):
         """
@@ -75,17 +111,17 @@ class SeparatorList(object):
             return self.title_list().index(title)
         short_list = sorted(short_list, key=separator_sort_function)
 
-        new_code = ""
+        new_chunks = []
         new_place = len(self.separator_list)
         concerned_separators = []
         for title in short_list:
             separator = self[title]
             concerned_separators.append(separator)
-            new_code = new_code+separator.code()
+            new_chunks.extend(separator.chunks())
             new_place = min(new_place, self.separator_list.index(separator))
 
         self.new_separator(new_title, new_place)
-        self[new_title].add_latex_line(new_code)
+        self[new_title].add_latex_line(new_chunks)
         for sep in concerned_separators:
             self.separator_list.remove(sep)
 
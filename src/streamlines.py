@@ -0,0 +1,254 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+"""
+The streamlines of a vector field.
+
+A streamline is a curve which is tangent to the vector field at each
+of its points. They are computed by a Runge-Kutta (order 4) integration
+of the normalized field, for all the initial points at once.
+"""
+
+import numpy
+from sage.all import lazy_attribute, var  # pylint:disable=import-error
+
+from yanntricks.src.ObjectGraph import ObjectGraph
+from yanntricks.src.points_array import PointsArray
+
+
+def integrate_streamlines(field, xs, ys, bounds, step, max_steps,
+                          stagnation=1e-6):
+    """
+    Integrate the streamlines of `field` starting at the points
+    (xs[k], ys[k]).
+
+    INPUT:
+
+    - ``field`` - a function which takes two arrays `X`, `Y` and
+        returns the arrays of the components of the field at the
+        points (X[k], Y[k]).
+
+    - ``xs``, ``ys`` - the coordinates of the initial points.
+
+    - ``bounds`` - the tuple (xmin, xmax, ymin, ymax) out of which
+        the integration stops.
+
+    - ``step`` - the length of a step. A negative step integrates
+        in the direction opposite to the field.
+
+    - ``max_steps`` - the maximal number of steps of each streamline.
+
+    - ``stagnation`` - the integration stops where the norm of the
+        field is smaller than `stagnation`.
+
+    The field is normalized, so that the points of a streamline are
+    regularly spaced. The integration of a streamline also stops
+    - where the field cannot be computed,
+    - when a step is shorter than half the asked one: the stages of
+      the Runge-Kutta step do not agree on the direction, which
+      happens close to a stagnation point,
+    - when it comes back at less than one step of its initial point
+      (closed streamline).
+
+    OUTPUT:
+
+    The list of the pairs of arrays `(xs, ys)` of the streamlines,
+    beginning with the initial points.
+    """
+    xmin, xmax, ymin, ymax = bounds
+    x = numpy.array(xs, dtype=float)
+    y = numpy.array(ys, dtype=float)
+    x0 = x.copy()
+    y0 = y.copy()
+    n = len(x)
+    path_x = numpy.full((max_steps+1, n), numpy.nan)
+    path_y = numpy.full((max_steps+1, n), numpy.nan)
+    path_x[0] = x
+    path_y[0] = y
+    lengths = numpy.ones(n, dtype=int)
+    active = numpy.flatnonzero((x >= xmin) & (x <= xmax)
+                               & (y >= ymin) & (y <= ymax))
+
+    def direction(X, Y):
+        """The normalized field and the mask of the valid points."""
+        vx, vy = field(X, Y)
+        vx = numpy.broadcast_to(numpy.asarray(vx, dtype=float), X.shape)
+        vy = numpy.broadcast_to(numpy.asarray(vy, dtype=float), X.shape)
+        norm = numpy.hypot(vx, vy)
+        valid = numpy.isfinite(norm) & (norm >= stagnation)
+        with numpy.errstate(all="ignore"):
+            return vx/norm, vy/norm, valid
+
+    for k in range(1, max_steps+1):
+        if len(active) == 0:
+            break
+        X = x[active]
+        Y = y[active]
+        k1x, k1y, v1 = direction(X, Y)
+        k2x, k2y, v2 = direction(X+step*k1x/2, Y+step*k1y/2)
+        k3x, k3y, v3 = direction(X+step*k2x/2, Y+step*k2y/2)
+        k4x, k4y, v4 = direction(X+step*k3x, Y+step*k3y)
+        with numpy.errstate(all="ignore"):
+            dx = step*(k1x+2*k2x+2*k3x+k4x)/6
+            dy = step*(k1y+2*k2y+2*k3y+k4y)/6
+            new_x = X+dx
+            new_y = Y+dy
+            keep = (v1 & v2 & v3 & v4
+                    & (numpy.hypot(dx, dy) >= abs(step)/2)
+                    & (new_x >= xmin) & (new_x <= xmax)
+                    & (new_y >= ymin) & (new_y <= ymax))
+        closed = keep & (k > 2) & (numpy.hypot(new_x-x0[active],
+                                                new_y-y0[active]) < abs(step))
+        active = active[keep]
+        x[active] = new_x[keep]
+        y[active] = new_y[keep]
+        path_x[k, active] = new_x[keep]
+        path_y[k, active] = new_y[keep]
+        lengths[active] += 1
+        active = active[~closed[keep]]
+    return [(path_x[:lengths[i], i], path_y[:lengths[i], i])
+            for i in range(n)]
+
+
+class StreamlinesGraph(ObjectGraph):
+    """
+    The streamlines of a vector field.
+
+    INPUT:
+
+    - ``vector_field`` - a `GeometricVectorField`.
+
+    - ``xrange``, ``yrange`` - the ranges as `(x, -5, 5)`. The
+        streamlines are stopped when they leave this rectangle.
+
+    OPTIONAL INPUT:
+
+    - ``seeds`` - the list of the points from which the streamlines
+        start. By default, a grid of `density` x `density` points
+        regularly spaced in the rectangle.
+
+    - ``density`` - (default: 5) see `seeds`.
+
+    - ``step`` - the length of the integration steps. By default, one
+        hundredth of the largest size of the rectangle.
+
+    - ``max_steps`` - (default: 1000) the maximal number of steps
+        in each direction.
+
+    - ``both_directions`` - (default: True) if True, the streamlines
+        are integrated backward and forward from the seeds. If False,
+        only forward.
+
+    ATTRIBUTES:
+
+    - ``self.paths`` - the list of the streamlines, as `PointsArray`.
+
+    EXAMPLES::
+
+        sage: from yanntricks import *
+        sage: x,y=var('x,y')
+        sage: F=Streamlines(-y,x,(x,-2,2),(y,-2,2),seeds=[Point(1,0)])
+        sage: len(F.paths)
+        1
+    """
+
+    def __init__(self, vector_field, xrange, yrange, seeds=None, density=5,
+                 step=None, max_steps=1000, both_directions=True):
+        ObjectGraph.__init__(self, vector_field)
+        self.vector_field = vector_field
+        self.bounds = (float(xrange[-2]), float(xrange[-1]),
+                       float(yrange[-2]), float(yrange[-1]))
+        xmin, xmax, ymin, ymax = self.bounds
+        if seeds is None:
+            pos_x = xmin+(numpy.arange(density)+0.5)*(xmax-xmin)/density
+            pos_y = ymin+(numpy.arange(density)+0.5)*(ymax-ymin)/density
+            X, Y = numpy.meshgrid(pos_x, pos_y)
+            self.seeds_x = X.ravel()
+            self.seeds_y = Y.ravel()
+        else:
+            self.seeds_x = numpy.array([float(P.x) for P in seeds])
+            self.seeds_y = numpy.array([float(P.y) for P in seeds])
+        if step is None:
+            step = max(xmax-xmin, ymax-ymin)/100
+        self.step = step
+        self.max_steps = max_steps
+        self.both_directions = both_directions
+
+    def field_function(self):
+        """
+        Return the function computing the field on numpy arrays.
+        See `integrate_streamlines`.
+        """
+        from yanntricks.src.Utilities import two_variables_function
+        x, y = var('x,y')
+        fx = two_variables_function(self.vector_field.fx(x, y), x, y)
+        fy = two_variables_function(self.vector_field.fy(x, y), x, y)
+        return lambda X, Y: (fx(X, Y), fy(X, Y))
+
+    @lazy_attribute
+    def paths(self):
+        """
+        The streamlines, as a list of `PointsArray`.
+        """
+        field = self.field_function()
+        forward = integrate_streamlines(field, self.seeds_x, self.seeds_y,
+                                        self.bounds, self.step,
+                                        self.max_steps)
+        if self.both_directions:
+            backward = integrate_streamlines(field, self.seeds_x,
+                                             self.seeds_y, self.bounds,
+                                             -self.step, self.max_steps)
+        else:
+            backward = [(xs[:1], ys[:1]) for xs, ys in forward]
+        paths = []
+        for (fxs, fys), (bxs, bys) in zip(forward, backward):
+            if len(fxs) > 3 and numpy.hypot(fxs[-1]-fxs[0], fys[-1]-fys[0]) \
+                    < abs(self.step):
+                # A closed streamline : it ends on its initial point.
+                paths.append(PointsArray(numpy.append(fxs, fxs[0]),
+                                         numpy.append(fys, fys[0])))
+                continue
+            xs = numpy.concatenate((bxs[::-1], fxs[1:]))
+            ys = numpy.concatenate((bys[::-1], fys[1:]))
+            if len(xs) > 1:
+                paths.append(PointsArray(xs, ys))
+        return paths
+
+    def _bounding_box(self, pspict=None):
+        from yanntricks.src.BoundingBox import BoundingBox
+        bb = BoundingBox()
+        for path in self.paths:
+            bb.AddBB(BoundingBox(**path.minmax_data()))
+        return bb
+
+    def _math_bounding_box(self, pspict=None):
+        return self.bounding_box(pspict)
+
+    def latex_code(self, language=None, pspict=None):
+        """
+        Return the code of the streamlines, one curve by streamline.
+        """
+        from yanntricks.src.interpolation_curve import InterpolationCurve
+        code = []
+        for path in self.paths:
+            curve = InterpolationCurve(path, context_object=self)
+            curve.parameters = self.parameters.copy()
+            code.append(curve.latex_code(language=language, pspict=pspict))
+        return "\n".join(code)
@@ -0,0 +1,246 @@
+#! /usr/bin/sage -python
+# -*- coding: utf8 -*-
+
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+"""
+Benchmark of the demonstration pictures.
+
+Each figure of `figures_demo.figures_list_1` is generated several times.
+For each figure, one records
+- the time of the construction (everything before `conclude`),
+  of `conclude` and of `write_the_file`,
+- the peak of the memory allocated by python (`tracemalloc`),
+- the size of the produced files.
+
+The results are written in a JSON file. When a baseline (a previous
+results file) is given, the figures which are slower or use more memory
+than `threshold` times the baseline are reported and the script exits
+with an error.
+
+Usage :
+    ./benchmark.py --repetitions=5 --output=benchmark.json
+    ./benchmark.py --baseline=benchmark.json --threshold=0.2
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import tracemalloc
+import contextlib
+
+from yanntricks.src.Figure import Figure
+
+
+class PhaseTimer:
+    """
+    Measure the time spent in `Figure.conclude` and
+    `Figure.write_the_file`, and the size of the written files.
+
+    Used as a context manager : the methods of `Figure` are wrapped
+    on entry and restored on exit.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.conclude = 0
+        self.write = 0
+        self.output_size = 0
+
+    def __enter__(self):
+        self.original_conclude = Figure.conclude
+        self.original_write = Figure.write_the_file
+        timer = self
+
+        def conclude(fig):
+            start = time.perf_counter()
+            try:
+                return timer.original_conclude(fig)
+            finally:
+                timer.conclude += time.perf_counter()-start
+
+        def write_the_file(fig):
+            start = time.perf_counter()
+            try:
+                return timer.original_write(fig)
+            finally:
+                timer.write += time.perf_counter()-start
+                for filename in [fig.filename.abs_path, fig.comment_filename]:
+                    if os.path.isfile(filename):
+                        timer.output_size += os.path.getsize(filename)
+
+        Figure.conclude = conclude
+        Figure.write_the_file = write_the_file
+        return self
+
+    def __exit__(self, *args):
+        Figure.conclude = self.original_conclude
+        Figure.write_the_file = self.original_write
+        return False
+
+
+def run_figure(fun, timer):
+    """
+    Execute the figure function `fun` once, its output being discarded.
+
+    Return the dictionary of the measures of this run.
+    """
+    timer.reset()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        fun()
+        total = time.perf_counter()-start
+    return {"total": total,
+            "construction": total-timer.conclude-timer.write,
+            "conclude": timer.conclude,
+            "write": timer.write,
+            "output_size": timer.output_size}
+
+
+def benchmark_figure(fun, repetitions, memory=True):
+    """
+    Return the measures for the figure function `fun`.
+
+    The function is executed once as warm up (some pictures need
+    a first pass to create their auxiliary file), then `repetitions`
+    times for the timings. The times are the medians over the
+    repetitions. When `memory` is True, one more run is done under
+    `tracemalloc` (which slows down the execution) for the peak memory.
+    """
+    with PhaseTimer() as timer:
+        run_figure(fun, timer)
+        runs = [run_figure(fun, timer) for _ in range(repetitions)]
+        result = {k: statistics.median([r[k] for r in runs])
+                  for k in ["total", "construction", "conclude", "write"]}
+        result["min_total"] = min(r["total"] for r in runs)
+        result["output_size"] = runs[-1]["output_size"]
+        result["repetitions"] = repetitions
+        if memory:
+            tracemalloc.start()
+            try:
+                run_figure(fun, timer)
+                result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return result
+
+
+def benchmark(figures_list, repetitions, memory=True):
+    """Return the results dictionary for the given figure functions."""
+    figures = {}
+    for fun in figures_list:
+        name = fun.__name__
+        print("Benchmark of", name, end=" ", flush=True)
+        try:
+            figures[name] = benchmark_figure(fun, repetitions, memory)
+        except Exception as e:
+            figures[name] = {"error": "{}: {}".format(type(e).__name__, e)}
+            print("failed :", figures[name]["error"])
+            continue
+        print("{:.3f}s".format(figures[name]["total"]))
+    return {"python": platform.python_version(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "repetitions": repetitions,
+            "figures": figures}
+
+
+def regressions(results, baseline, threshold):
+    """
+    Return the list of the regressions of `results` with respect to
+    `baseline`, as strings.
+
+    A figure regresses when its median time or its peak memory is more
+    than `1+threshold` times the one of the baseline. The figures
+    which are absent or failed in one of the two are not compared.
+    """
+    regressions_list = []
+    for name, new in sorted(results["figures"].items()):
+        old = baseline["figures"].get(name)
+        if old is None or "error" in old or "error" in new:
+            continue
+        for key in ["total", "peak_memory"]:
+            if key not in old or key not in new or old[key] <= 0:
+                continue
+            ratio = new[key]/old[key]
+            if ratio > 1+threshold:
+                regressions_list.append("{} : {} {} -> {} ({:+.1%})".format(
+                    name, key, old[key], new[key], ratio-1))
+    return regressions_list
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the demonstration pictures.")
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--output", default="benchmark.json",
+                        help="the JSON file in which the results are written.")
+    parser.add_argument("--baseline", default=None,
+                        help="a previous results file to compare with.")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="the accepted relative regression (0.2 is 20%%).")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="do not measure the peak memory.")
+    parser.add_argument("figures", nargs="*",
+                        help="the names of the figures (default: all).")
+    args = parser.parse_args(arguments)
+
+    from figures_demo import figures_list_1
+    figures_list = figures_list_1
+    if args.figures:
+        figures_list = [f for f in figures_list_1
+                        if f.__name__ in args.figures]
+
+    # The baseline is read first : it can be the output file.
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+
+    results = benchmark(figures_list, args.repetitions,
+                        memory=not args.no_memory)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print("Results written in", args.output)
+
+    failed = [n for n, r in results["figures"].items() if "error" in r]
+    for name in failed:
+        print("Failed :", name, results["figures"][name]["error"])
+
+    if baseline is not None:
+        regressions_list = regressions(results, baseline, args.threshold)
+        for r in regressions_list:
+            print("Regression :", r)
+        if regressions_list:
+            return 1
+    if failed:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -209,9 +209,14 @@ def AllFigures():
     if "--pass-number=3" in sys.argv:
         figures_list = figures_list_3
 
+    processes = 1
+    for arg in sys.argv:
+        if arg.startswith("--processes="):
+            processes = int(arg.split("=")[1])
+
     tests = yanntricks.FigureGenerationSuite(
         figures_list, first=0,
-        title=u"demonstration pictures")
+        title=u"demonstration pictures", processes=processes)
     tests.generate()
     tests.summary()
 
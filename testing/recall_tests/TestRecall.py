@@ -14,14 +14,56 @@
 
 import sys
 import os
+import re
+import hashlib
+import concurrent.futures
+import numpy
 from  RecallTestsExceptions import TikzDecompositionParsingException
 
+# An opening parenthesis which is not "\(". See `TikzDecomposition`.
+OPENING_PARENTHESIS=re.compile("[^\\\\]\\(")
+
 def pstricks_files_iterator(directory):
-    for f in os.listdir(directory):
+    for f in sorted(os.listdir(directory)):
         if f.endswith(".pstricks"):
             yield os.path.join(directory,f)
 
-def wrong_file_list(pstricks_directory,recall_directory):
+def recall_filename(filename,recall_directory):
+    return os.path.join(recall_directory,os.path.split(filename)[1]+".recall")
+
+## \brief return the sha1 of the file, reading it by blocks.
+def file_digest(filename,block_size=1<<20):
+    h=hashlib.sha1()
+    with open(filename,'rb') as f:
+        for block in iter(lambda: f.read(block_size),b''):
+            h.update(block)
+    return h.hexdigest()
+
+## \brief return the pair (filename,status) where status is
+# - "missing" if there is no recall file
+# - "wrong" if the recall file is not the same
+# - "ok" if both files are the same.
+def file_status(filename,recall_directory):
+    try :
+        recall_digest=file_digest(recall_filename(filename,recall_directory))
+    except FileNotFoundError:
+        return filename,"missing"
+    if file_digest(filename)!=recall_digest:
+        return filename,"wrong"
+    return filename,"ok"
+
+def _map(fun,arguments,processes):
+    """
+    Return the list of `fun(*a)` for `a` in `arguments`, computed
+    with a pool of `processes` processes (None means one by CPU).
+    """
+    arguments=list(arguments)
+    if processes==1 or len(arguments)<2:
+        return [fun(*a) for a in arguments]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(fun,*zip(*arguments),chunksize=16))
+
+def wrong_file_list(pstricks_directory,recall_directory,processes=1):
     """
     return a tuple of lists
     - the list of missing 'recall'
@@ -32,22 +74,18 @@ def wrong_file_list(pstricks_directory,recall_directory):
                         This is also the directory that we are going to parse.
 
     - `recall_directory` : the directory in which are the recall files.
+
+    - `processes` : the number of processes hashing the files.
+
+    The files are compared by their sha1, without being loaded in memory.
     """
     wfl=[]  # wrong file list
     mfl=[]  # missing file list
-    for filename in pstricks_files_iterator(pstricks_directory):
-        with open(filename,'r') as f:
-            get_text=f.read()
-        try :
-            recall_filename=os.path.join(recall_directory,
-                                os.path.split(filename)[1]+".recall")
-            with open(recall_filename,'r') as f:
-                recall_text=f.read()
-        except FileNotFoundError as err :
+    arguments=[(f,recall_directory) for f in pstricks_files_iterator(pstricks_directory)]
+    for filename,status in _map(file_status,arguments,processes):
+        if status=="missing":
             mfl.append(filename)
-            recall_text=get_text    # we do not append it to the wfl list.
-
-        if get_text != recall_text :
+        if status=="wrong":
             wfl.append(filename)
     return mfl,wfl
 
@@ -96,45 +134,53 @@ def split_for_positions(text,positions):
 #    Hypothesises 
 #    - Points coordinates are of the form (x,y)
 #    - The other open parenthesis are in the combination \(
+#
+#    The coordinates of the points are stored in the numpy arrays
+#    `xs` and `ys`; `points_list` builds the corresponding `Point`.
 class TikzDecomposition(object):
     def __init__(self,text):
-        import re
-        self.points_list=[]
         self.texts_list=[]
+        xs=[]
+        ys=[]
 
         # One cannot iter over reg.split(text) because in
         # bla (a,b)(c,d)
         # the second match  is ")(", so that the first block in the split
         # will be "a,b" without the closing parenthesis.
         # This also explains the "+1" in the definition of 'parenthesis'
-        reg=re.compile("[^\\\]\(")
-        parenthesis=[m.start()+1 for m in re.finditer(reg,text)]
-
-        bl=list(split_for_positions(text,parenthesis))
-        self.texts_list.append(bl[0])
+        parenthesis=[m.start()+1 for m in OPENING_PARENTHESIS.finditer(text)]
+        if not parenthesis:
+            self.texts_list.append(text)
+            bl=[]
+        else :
+            bl=list(split_for_positions(text,parenthesis))
+            self.texts_list.append(bl[0])
         for block in bl[1:] :
             closing=block.find(")")
             point=block[0:closing]
-            text=block[closing:]
 
-            x=None
-            y=None
+            coordinates=point.split(",",2)
             try :
-                x=float(point.split(",")[0])
-                y=float(point.split(",")[1])
-            except :
+                x=float(coordinates[0])
+                y=float(coordinates[1])
+            except (ValueError,IndexError) :
                 # Happens for this kind of lines :
                 # \setlength{\foo}{\totalheightof{$f(x)$}}% (1,1)
-                pass 
-
-            if x is not None and y is not None :
-                self.points_list.append(Point(x,y))
-                self.texts_list.append(text)
-            else :
                 self.texts_list.append(block)
+            else :
+                xs.append(x)
+                ys.append(y)
+                self.texts_list.append(block[closing:])
+        self.xs=numpy.array(xs,dtype=float)
+        self.ys=numpy.array(ys,dtype=float)
+
+    @property
+    def points_list(self):
+        return [Point(x,y) for x,y in zip(self.xs.tolist(),self.ys.tolist())]
 
 def file_to_tikz_decomposition(filename):
-    content=open(filename,'r').read()
+    with open(filename,'r') as f:
+        content=f.read()
     return TikzDecomposition(content)
 
 ## \brief contains the comparison between two 'tikz' files
@@ -178,29 +224,28 @@ def comparison(f1,f2,epsilon,verbose=False):
     except TikzDecompositionParsingException as e :
         raise TikzDecompositionParsingException(e.block,f1,f2,x=e.x,y=e.y)
     if len(d1.texts_list) != len(d2.texts_list) :
-        return TikzComparison(f1,f2,kind="Wrong texts list size",comment="")
-    if len(d1.points_list) != len(d2.points_list) :
-        return TikzComparison(f1,f2,kind="Wrong points list size",comment="")
+        return TikzComparison(f1,f2,kind="wrong texts list size",comment="")
+    if len(d1.xs) != len(d2.xs) :
+        return TikzComparison(f1,f2,kind="wrong points list size",comment="")
     for t in zip(d1.texts_list,d2.texts_list):
         if t[0] != t[1]:
             return TikzComparison(f1,f2,"text change","{} Vs {} ".format(t[0],t[1]))
-    for t in zip(d1.points_list,d2.points_list):
-        try :
-            Dx=t[1].x-t[0].x
-            Dy=t[1].y-t[0].y
-        except TypeError :
-            print("Type error for ",t[1].x,t[0].x,t[1].y,t[0].y)
-            print("In the files : ")
-            print(f1)
-            print(f2)
-            raise
-        if abs(Dx)>epsilon or abs(Dy)>epsilon :
-            return TikzComparison(f1,f2,"large point move","{} Vs {} : Dx={}, Dy={}".format(t[0],t[1],Dx,Dy))
-    for t in zip(d1.points_list,d2.points_list):
-        Dx=t[1].x-t[0].x
-        Dy=t[1].y-t[0].y
-        if abs(Dx)>0 or abs(Dy)>0 :
-            return TikzComparison(f1,f2,"small point move",comment="{} Vs {} : Dx={}, Dy={}".format(t[0],t[1],Dx,Dy))
+
+    Dx=d2.xs-d1.xs
+    Dy=d2.ys-d1.ys
+
+    def point_move(kind,moved):
+        i=moved[0]
+        P1=Point(float(d1.xs[i]),float(d1.ys[i]))
+        P2=Point(float(d2.xs[i]),float(d2.ys[i]))
+        return TikzComparison(f1,f2,kind,"{} Vs {} : Dx={}, Dy={}".format(P1,P2,Dx[i],Dy[i]))
+
+    moved=numpy.flatnonzero((numpy.abs(Dx)>epsilon)|(numpy.abs(Dy)>epsilon))
+    if len(moved)>0:
+        return point_move("large point move",moved)
+    moved=numpy.flatnonzero((Dx!=0)|(Dy!=0))
+    if len(moved)>0:
+        return point_move("small point move",moved)
 
     return TikzComparison(f1,f2,kind='none',comment="")
 
@@ -217,16 +262,19 @@ def comparison(f1,f2,epsilon,verbose=False):
 # \param epsilon is the tolerance for point move. When the coordinates of a point
 # did not change by more than `epsilon`, the files are considered as "small point
 # move".
-def check_pictures(pstricks_directory,recall_directory,verbose=True,epsilon=0.001):
-    mfl,wfl=wrong_file_list(pstricks_directory,recall_directory)
-
-    comparison_list=[]
+# \param processes the number of processes hashing and comparing the
+# files. `None` means one by CPU.
+#
+# The files whose sha1 are the same as their 'recall' are not parsed.
+#
+# \return the list of `TikzComparison`.
+def check_pictures(pstricks_directory,recall_directory,verbose=True,epsilon=0.001,processes=None):
+    mfl,wfl=wrong_file_list(pstricks_directory,recall_directory,processes=processes)
 
     for f in mfl:
         print("Missing recall file for ",f)
-    for f in wfl:
-        g=f.replace(pstricks_directory,recall_directory)+".recall"
-        comparison_list.append(comparison(f,g,epsilon=epsilon,verbose=verbose))
+    arguments=[(f,recall_filename(f,recall_directory),epsilon,verbose) for f in wfl]
+    comparison_list=_map(comparison,arguments,processes)
 
     kinds=["wrong texts list size", 
             "wrong points list size", 
@@ -237,5 +285,6 @@ def check_pictures(pstricks_directory,recall_directory,verbose=True,epsilon=0.00
 
     for k in kinds :
         print("========= ",k," ============")
-        for comp in [c for c in comparison_list if c.comment==k]:
+        for comp in [c for c in comparison_list if c.kind==k]:
             print(comp)
+    return comparison_list
@@ -38,9 +38,12 @@ def testFGetMinMaxData():
                       (y, -4, 4), plot_points=300)
     F.plot_points = 10
     d = F.get_minmax_data()
-    ans_d = {'xmax': 1.1885897706607917, 'xmin': -1.1885897706608,
-             'ymax': 1.188452472892108, 'ymin': -1.1884524728921004}
-    assert_true(d == ans_d, failure_message="get_min_max data badly computed.")
+    # The exact values are +-sqrt(sqrt(2)) = +-1.189207115...
+    ans_d = {'xmax': 1.1891077048017331, 'xmin': -1.1891077048017331,
+             'ymax': 1.1890729832857492, 'ymin': -1.1890729832857492}
+    for k in ans_d:
+        echo_single_test(k)
+        assert_almost_equal(d[k], ans_d[k], epsilon=0.001)
 
 
 from testNumericalOperations import testNumericalOperations
@@ -84,6 +87,58 @@ from testAngleMeasure import testAngleMeasure
 print("testAngleMeasure")
 testAngleMeasure()
 
+from testBoxMetrics import testBoxMetrics
+print("testBoxMetrics")
+testBoxMetrics()
+
+from testFigureCache import testFigureCache
+print("testFigureCache")
+testFigureCache()
+
+from testPointsArray import testPointsArray
+print("testPointsArray")
+testPointsArray()
+
+from testPictureBoundingBox import testPictureBoundingBox
+print("testPictureBoundingBox")
+testPictureBoundingBox()
+
+from testSimplification import testSimplification
+print("testSimplification")
+testSimplification()
+
+from testImplicitCurve import testImplicitCurve
+print("testImplicitCurve")
+testImplicitCurve()
+
+from testInstrumentation import testInstrumentation
+print("testInstrumentation")
+testInstrumentation()
+
+from testMathBoundingBox import testMathBoundingBox
+print("testMathBoundingBox")
+testMathBoundingBox()
+
+from testGrid import testGrid
+print("testGrid")
+testGrid()
+
+from testVectorField import testVectorField
+print("testVectorField")
+testVectorField()
+
+from testStreamlines import testStreamlines
+print("testStreamlines")
+testStreamlines()
+
+from testPhyFunction import testPhyFunction
+print("testPhyFunction")
+testPhyFunction()
+
+from testSeparatorList import testSeparatorList
+print("testSeparatorList")
+testSeparatorList()
+
 print("testSegment")
 testSegment()
 
@@ -0,0 +1,119 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+import os
+import tempfile
+
+from yanntricks import *
+import yanntricks.src.Defaults as Defaults
+from yanntricks.src.AuxFile import AuxFile
+from yanntricks.src.box_metrics import BoxMetricsCache
+
+from Testing import assert_true
+from Testing import assert_equal
+from Testing import echo_function
+from Testing import echo_single_test
+from Testing import SilentOutput
+
+
+def test_cache():
+    echo_function("test_cache")
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "metrics.sqlite")
+        cache = BoxMetricsCache(filename)
+
+        echo_single_test("miss")
+        assert_equal(cache.get("font1", "widthofAAA"), None)
+
+        echo_single_test("hit")
+        cache.store("font1", "widthofAAA", "3.0pt")
+        assert_equal(cache.get("font1", "widthofAAA"), "3.0pt")
+
+        echo_single_test("other fingerprint")
+        assert_equal(cache.get("font2", "widthofAAA"), None)
+
+        echo_single_test("persistence")
+        cache.commit()
+        assert_equal(BoxMetricsCache(filename).get("font1", "widthofAAA"),
+                     "3.0pt")
+
+
+def write_aux_file(pspict, text):
+    with open(pspict.auxiliary_file.interWriteFile.from_sage(), "w") as f:
+        f.write(text)
+
+
+def test_aux_file():
+    echo_function("test_aux_file")
+    old_cwd = os.getcwd()
+    old_filename = Defaults.BOX_METRICS_FILENAME
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        Defaults.BOX_METRICS_FILENAME = "metrics.sqlite"
+        try:
+            with SilentOutput():
+                pspict1, fig1 = SinglePicture("BXMEooFirstB")
+                pspict2, fig2 = SinglePicture("BXMEooSecond")
+            aux1 = pspict1.auxiliary_file
+            aux2 = pspict2.auxiliary_file
+
+            echo_single_test("the font is asked by each picture")
+            aux1.font_fingerprint()
+            aux2.font_fingerprint()
+            assert_true("FontFingerprint" in aux1.latex_code())
+            assert_true("FontFingerprint" in aux2.latex_code())
+
+            echo_single_test("hit")
+            write_aux_file(pspict1, "FontFingerprint:3pt,2pt,1pt-\n"
+                                    "widthofAAA:6.0pt-\n")
+            assert_equal(aux1.get_box_value("widthofAAA", "0pt"), "6.0pt")
+            with SilentOutput():
+                assert_equal(aux2.get_box_value("widthofAAA", "0pt"),
+                             "6.0pt")
+
+            echo_single_test("miss")
+            with SilentOutput():
+                assert_equal(aux2.get_box_value("widthofBBB", "0pt"), "0pt")
+
+            echo_single_test("no storage without the picture's fingerprint")
+            write_aux_file(pspict2, "widthofCCC:7.0pt-\n")
+            aux2 = AuxFile(pspict2.name, pspict2)
+            assert_equal(aux2.get_box_value("widthofCCC", "0pt"), "7.0pt")
+            assert_equal(aux2.font_fingerprint(), None)
+            assert_equal(aux1.box_metrics.get(aux1.font_fingerprint(),
+                                              "widthofCCC"), None)
+
+            echo_single_test("invalidation when the font changes")
+            old_fingerprint = aux1.font_fingerprint()
+            write_aux_file(pspict1, "FontFingerprint:4pt,2pt,1pt-\n")
+            aux1 = AuxFile(pspict1.name, pspict1)
+            assert_true(aux1.font_fingerprint() != old_fingerprint)
+            with SilentOutput():
+                pspict3, fig3 = SinglePicture("BXMEooThirdP")
+                assert_equal(pspict3.auxiliary_file.get_box_value(
+                    "widthofAAA", "0pt"), "0pt")
+        finally:
+            Defaults.BOX_METRICS_FILENAME = old_filename
+            os.chdir(old_cwd)
+
+
+def testBoxMetrics():
+    test_cache()
+    test_aux_file()
@@ -0,0 +1,108 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+import os
+import sys
+import tempfile
+import importlib
+
+from yanntricks import *
+from yanntricks.src.figure_cache import FigureCache
+from yanntricks.src.figure_generation_suite import FigureGenerationSuite
+from yanntricks.src.Exceptions import PhystricksTestError
+
+from Testing import assert_true
+from Testing import assert_false
+from Testing import assert_equal
+from Testing import echo_function
+from Testing import echo_single_test
+from Testing import SilentOutput
+
+
+def write_file(filename, text):
+    with open(filename, "w") as f:
+        f.write(text)
+
+
+def test_cache():
+    echo_function("test_cache")
+    with tempfile.TemporaryDirectory() as directory:
+        helper = os.path.join(directory, "fcache_helper.py")
+        output = os.path.join(directory, "output.tex")
+        write_file(helper, "RADIUS = 1\n")
+        write_file(os.path.join(directory, "fcache_figures.py"),
+                   "import fcache_helper\n"
+                   "def figure():\n"
+                   "    return fcache_helper.RADIUS\n")
+        write_file(output, "some tikz code")
+        sys.path.insert(0, directory)
+        try:
+            module = importlib.import_module("fcache_figures")
+            cache = FigureCache(os.path.join(directory, "cache.json"))
+            cache.record_files(module.figure, [output])
+
+            echo_single_test("hit")
+            assert_true(cache.is_up_to_date(module.figure))
+
+            echo_single_test("miss after a change in a helper module")
+            write_file(helper, "RADIUS = 2\n")
+            assert_false(cache.is_up_to_date(module.figure))
+            write_file(helper, "RADIUS = 1\n")
+            assert_true(cache.is_up_to_date(module.figure))
+
+            echo_single_test("miss after a change in the output")
+            write_file(output, "other tikz code")
+            assert_false(cache.is_up_to_date(module.figure))
+        finally:
+            sys.path.remove(directory)
+            sys.modules.pop("fcache_figures", None)
+            sys.modules.pop("fcache_helper", None)
+
+
+def successful_figure():
+    pass
+
+
+def failing_figure():
+    pspict, fig = SinglePicture("FGSUooFailed")
+    raise PhystricksTestError(justification="on purpose", pspict=pspict)
+
+
+def test_parallel_failures():
+    echo_function("test_parallel_failures")
+    old_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            figures_list = [successful_figure, failing_figure,
+                            successful_figure]
+            suite = FigureGenerationSuite(figures_list, use_cache=False,
+                                          processes=2)
+            with SilentOutput():
+                suite.generate()
+            assert_equal([(f.__name__, name) for f, name in suite.failed_list],
+                         [("failing_figure", "FGSUooFailed")])
+        finally:
+            os.chdir(old_cwd)
+
+
+def testFigureCache():
+    test_cache()
+    test_parallel_failures()
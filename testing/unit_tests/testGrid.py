@@ -0,0 +1,53 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+from yanntricks import *
+
+from Testing import assert_true
+from Testing import assert_equal
+from Testing import echo_function
+from Testing import echo_single_test
+from Testing import SilentOutput
+
+
+def test_grid_then_axes():
+    echo_function("test_grid_then_axes")
+    with SilentOutput():
+        pspict, fig = SinglePicture("GRIDooAxesAf")
+    pspict.DrawGraphs(Point(2.5, 3.5), Point(4.5, 5.5))
+    pspict.DrawDefaultGrid()
+    grid_code = pspict.grid.latex_code(language="tikz", pspict=pspict)
+
+    echo_single_test("the grid ends on its main subdivisions")
+    main_vertical = [lines for archetype, lines in pspict.grid.line_groups()
+                     if archetype is pspict.grid.main_vertical][0]
+    assert_equal(main_vertical[:, 0].tolist(), [2, 3, 4, 5])
+    assert_equal(set(main_vertical[:, 1]), {3})
+    assert_equal(set(main_vertical[:, 3]), {6})
+
+    echo_single_test("the axes do not resize the grid")
+    pspict.DrawDefaultAxes()
+    assert_true(pspict.math_BB.xmin <= 0)
+    assert_equal(pspict.grid.latex_code(language="tikz", pspict=pspict),
+                 grid_code)
+
+
+def testGrid():
+    test_grid_then_axes()
@@ -0,0 +1,67 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+import numpy
+
+from yanntricks import *
+from yanntricks.src.marching_squares import contour_paths
+
+from Testing import assert_true
+from Testing import assert_equal
+from Testing import echo_function
+from Testing import echo_single_test
+
+
+def grid(f):
+    xs = numpy.linspace(-3, 3, 101)
+    ys = numpy.linspace(-3, 3, 91)
+    X, Y = numpy.meshgrid(xs, ys)
+    return f(X, Y), xs, ys
+
+
+def test_contour_paths():
+    echo_function("test_contour_paths")
+
+    echo_single_test("circle")
+    paths = contour_paths(*grid(lambda X, Y: X**2+Y**2-2))
+    assert_equal(len(paths), 1)
+    circle = paths[0]
+    assert_true(numpy.allclose(circle[0], circle[-1]))
+    radius = numpy.hypot(circle[:, 0], circle[:, 1])
+    assert_true(numpy.abs(radius-numpy.sqrt(2)).max() < 0.001)
+
+    echo_single_test("hyperbola")
+    paths = contour_paths(*grid(lambda X, Y: X**2-Y**2-2))
+    assert_equal(len(paths), 2)
+    for path in paths:
+        assert_true(numpy.abs(path[:, 0]**2-path[:, 1]**2-2).max() < 0.01)
+    assert_equal(sorted(numpy.sign(path[0, 0]) for path in paths), [-1, 1])
+
+    echo_single_test("no zero")
+    assert_equal(contour_paths(*grid(lambda X, Y: X**2+Y**2+1)), [])
+
+    echo_single_test("not computable")
+    values, xs, ys = grid(lambda X, Y: X**2+Y**2-2)
+    values[:] = numpy.nan
+    assert_equal(contour_paths(values, xs, ys), [])
+
+
+def testImplicitCurve():
+    test_contour_paths()
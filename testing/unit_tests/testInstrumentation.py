@@ -0,0 +1,99 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+import os
+import json
+import tempfile
+
+from yanntricks import *
+from yanntricks.src.instrumentation import Instrumentation
+from yanntricks.src.instrumentation import write_instrumentation
+
+from Testing import assert_true
+from Testing import assert_false
+from Testing import assert_equal
+from Testing import echo_function
+from Testing import echo_single_test
+from Testing import SilentOutput
+
+
+def test_draw_graphs():
+    echo_function("test_draw_graphs")
+    with SilentOutput():
+        pspict, fig = SinglePicture("INSTooLsVfkq")
+    echo_single_test("disabled by default")
+    if not os.environ.get("YANNTRICKS_INSTRUMENTATION"):
+        assert_false(pspict.instrumentation.enabled)
+
+    instrumentation = pspict.enable_instrumentation()
+    A = Point(0, 0)
+    B = Point(1, 2)
+    pspict.DrawGraphs(A, B)
+    echo_single_test("phases and counters")
+    assert_equal(instrumentation.counters["DrawGraph calls"], 2)
+    assert_equal(instrumentation.phases["children"]["DrawGraph"]["calls"], 2)
+    assert_true("conclude" in
+                instrumentation.phases["children"]["DrawGraph"]["children"])
+    echo_single_test("by class")
+    assert_equal(instrumentation.by_class[type(A).__name__]["DrawGraph"]["calls"], 2)
+
+
+def test_nested_phases():
+    echo_function("test_nested_phases")
+    instrumentation = Instrumentation()
+    obj = Point(0, 0)
+    with instrumentation.phase("outer"):
+        with instrumentation.phase("inner", obj):
+            pass
+        with instrumentation.phase("inner", obj):
+            pass
+    outer = instrumentation.phases["children"]["outer"]
+    assert_equal(outer["calls"], 1)
+    assert_equal(outer["children"]["inner"]["calls"], 2)
+    assert_true(outer["time"] >= outer["children"]["inner"]["time"])
+    assert_equal(instrumentation.by_class["Point"]["inner"]["calls"], 2)
+    assert_true("Point inner" in instrumentation.report())
+
+
+def test_write():
+    echo_function("test_write")
+    with SilentOutput():
+        pspict1, fig1 = SinglePicture("INSTooWriteA")
+        pspict2, fig2 = SinglePicture("INSTooWriteB")
+    pspict1.enable_instrumentation()
+    pspict1.DrawGraphs(Point(1, 1))
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "instrumentation.json")
+        if not pspict2.instrumentation.enabled:
+            echo_single_test("nothing to write")
+            write_instrumentation(filename, [pspict2])
+            assert_false(os.path.exists(filename))
+        echo_single_test("instrumented picture")
+        write_instrumentation(filename, [pspict1])
+        with open(filename) as f:
+            data = json.load(f)
+        assert_equal(list(data), [pspict1.name])
+        assert_equal(data[pspict1.name]["counters"]["DrawGraph calls"], 1)
+
+
+def testInstrumentation():
+    test_draw_graphs()
+    test_nested_phases()
+    test_write()
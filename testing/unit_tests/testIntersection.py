@@ -145,7 +145,46 @@ def with_box():
         assert_equal(t[0], t[1])
 
 
+def roots_finding():
+    echo_function("roots_finding")
+    import numpy
+    from yanntricks.src.SmallComputations import find_roots
+    from yanntricks.src.SmallComputations import brent_root
+
+    echo_single_test("Brent's method")
+    assert_almost_equal(brent_root(lambda t: t**3-2, 0, 2), 2**(1/3),
+                        epsilon=1e-10)
+
+    echo_single_test("simple root")
+    roots = find_roots(lambda t: t-1, 0, 3)
+    assert_equal(len(roots), 1)
+    assert_almost_equal(roots[0], 1, epsilon=1e-10)
+
+    echo_single_test("double root")
+    for samples in [1000, 1001]:
+        roots = find_roots(lambda t: (t-1)**2, 0, 3, samples=samples)
+        assert_equal(len(roots), 1)
+        assert_almost_equal(roots[0], 1, epsilon=1e-6)
+
+    echo_single_test("no root")
+    assert_equal(find_roots(lambda t: t**2+1, -2, 2), [])
+
+    echo_single_test("dense oscillations")
+    roots = find_roots(lambda t: numpy.sin(50*t), 0, numpy.pi)
+    assert_equal(len(roots), 51)
+    for k, root in enumerate(roots):
+        assert_almost_equal(root, k*numpy.pi/50, epsilon=1e-10)
+
+    echo_single_test("tangent functions")
+    x = var('x')
+    pts = Intersection(phyFunction(x**2), phyFunction(2*x-1), 0, 3,
+                       numerical=True)
+    assert_equal(len(pts), 1)
+    assert_almost_equal(pts[0], Point(1, 1), epsilon=1e-6)
+
+
 def testIntersection():
+    roots_finding()
     with_box()
     with_lagrange()
     lines_and_functions()
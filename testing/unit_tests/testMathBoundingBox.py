@@ -0,0 +1,89 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+from yanntricks import *
+from yanntricks.src.ObjectGraph import ObjectGraph
+
+from Testing import assert_equal
+from Testing import echo_function
+from Testing import echo_single_test
+from Testing import SilentOutput
+
+
+class MovingSquare(ObjectGraph):
+    """The square [0,size]x[0,size]; `size` can change after drawing."""
+
+    def __init__(self, size):
+        ObjectGraph.__init__(self, self)
+        self.size = size
+
+    def _math_bounding_box(self, pspict=None):
+        return BoundingBox(xmin=0, ymin=0, xmax=self.size, ymax=self.size)
+
+    def _bounding_box(self, pspict=None):
+        return self._math_bounding_box(pspict)
+
+    def latex_code(self, language=None, pspict=None):
+        return ""
+
+
+def extent(bb):
+    return [bb.xmin, bb.xmax, bb.ymin, bb.ymax]
+
+
+def test_incremental_math_bounding_box():
+    echo_function("test_incremental_math_bounding_box")
+    with SilentOutput():
+        pspict, fig = SinglePicture("IMBBooRkPwqd")
+    pspict.DrawGraphs(Point(1, 1))
+    assert_equal(pspict.math_bounding_box().xmax, 1)
+
+    echo_single_test("forced and drawn objects")
+    pspict.force_math_bounding_box(Point(3, -2))
+    pspict.DrawGraphs(Point(-1, 0))
+    assert_equal(extent(pspict.math_bounding_box()), [-1, 3, -2, 1])
+
+    echo_single_test("merging again")
+    pspict.invalidate_math_bounding_box()
+    assert_equal(extent(pspict.math_bounding_box()), [-1, 3, -2, 1])
+
+
+def test_modified_graph():
+    echo_function("test_modified_graph")
+    with SilentOutput():
+        pspict, fig = SinglePicture("IMBBooMoving")
+    square = MovingSquare(2)
+    pspict.DrawGraphs(square)
+    assert_equal(extent(pspict.math_bounding_box()), [0, 2, 0, 2])
+
+    echo_single_test("the change is seen after invalidation")
+    square.size = 5
+    pspict.invalidate_math_bounding_box(square)
+    assert_equal(extent(pspict.math_bounding_box()), [0, 5, 0, 5])
+
+    echo_single_test("the math bounding box only grows")
+    square.size = 1
+    pspict.invalidate_math_bounding_box(square)
+    assert_equal(extent(pspict.math_bounding_box()), [0, 5, 0, 5])
+
+
+def testMathBoundingBox():
+    test_incremental_math_bounding_box()
+    test_modified_graph()
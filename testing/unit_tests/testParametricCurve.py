@@ -18,8 +18,9 @@
 # copyright (c) Laurent Claessens, 2017, 2019
 # email: laurent@claessens-donadello.eu
 
-from sage.all import cos, sin
+from sage.all import cos, sin, sqrt
 from yanntricks import *
+import yanntricks.src.Defaults as Defaults
 
 from Testing import assert_true
 from Testing import assert_false
@@ -65,6 +66,83 @@ def test_second_derivative_vector():
     assert_equal(v, ans)
 
 
+def test_adaptive_sampling():
+    echo_function("test_adaptive_sampling")
+    import numpy
+    x = var('x')
+    curve = ParametricCurve(x, x**4).graph(-2, 2)
+
+    echo_single_test("the tolerance is met")
+    curve.adaptive_sampling(0.01)
+    params = [float(t) for t in curve.representativeParameters()]
+    assert_true(all(a < b for a, b in zip(params, params[1:])))
+    mid = [(a+b)/2 for a, b in zip(params, params[1:])]
+    for a, m, b in zip(params, mid, params[1:]):
+        # The distance between the midpoint and the chord.
+        ya, ym, yb = a**4, m**4, b**4
+        d = abs((b-a)*(ym-ya)-(yb-ya)*(m-a))/numpy.hypot(b-a, yb-ya)
+        assert_true(d <= 0.01)
+
+    echo_single_test("the budget is respected")
+    curve.adaptive_sampling(1e-9, max_plotpoints=50)
+    assert_equal(len(curve.representativeParameters()), 50)
+
+    echo_single_test("a straight line needs few points")
+    line = ParametricCurve(x, 2*x).graph(0, 10)
+    line.adaptive_sampling(0.01)
+    assert_true(len(line.representativeParameters()) < 20)
+
+
+def test_regular_length_parameters():
+    echo_function("test_regular_length_parameters")
+    x = var('x')
+    curve = ParametricCurve(x, 2*x).graph(0, 1)
+    params = curve.getRegularLengthParameters(0, 1, sqrt(5)/4)
+    assert_equal(len(params), 4)
+    for ll, expected in zip(params, [0.25, 0.5, 0.75, 1]):
+        assert_almost_equal(ll, expected, epsilon=0.0001)
+
+    echo_single_test("integrand not finite on a node")
+    panels = Defaults.INTEGRAL_TABLE_PANELS
+    Defaults.INTEGRAL_TABLE_PANELS = 2
+    try:
+        # The center of the first panel is 0.
+        params, integrals = curve.cumulative_integral_table(
+            1/sqrt(abs(x)), -1, 3)
+        assert_almost_equal(integrals[1], 4, epsilon=0.001)
+        assert_almost_equal(integrals[2], 2+2*sqrt(3), epsilon=0.001)
+    finally:
+        Defaults.INTEGRAL_TABLE_PANELS = panels
+
+
+def test_compiled_derivatives():
+    echo_function("test_compiled_derivatives")
+    from sage.all import QQ
+    x = var('x')
+    curve = ParametricCurve(cos(x)+x/3, sin(2*x)).graph(0, 3)
+    with SilentOutput():
+        pspict, fig = SinglePicture("CDERooNormal")
+    for llam in [QQ(3)/10, QQ(17)/10, QQ(29)/10]:
+        numeric = float(llam)
+        echo_single_test(f"tangent at {llam}")
+        assert_almost_equal(curve.get_tangent_vector(numeric),
+                            curve.get_tangent_vector(llam))
+
+        echo_single_test(f"normal at {llam}")
+        assert_almost_equal(curve.get_normal_vector(numeric),
+                            curve.get_normal_vector(llam))
+
+        echo_single_test(f"advised angle at {llam}")
+        P = curve.get_point(numeric)
+        exact = curve.get_normal_vector(llam).angle().degree
+        difference = float(P.advised_mark_angle(pspict).degree-exact)
+        assert_almost_equal((difference+180) % 360-180, 0)
+        P.put_mark(0.3, text="$P$", pspict=pspict)
+
+
 def testParametricCurve():
+    test_compiled_derivatives()
+    test_regular_length_parameters()
+    test_adaptive_sampling()
     test_reverse()
     test_second_derivative_vector()
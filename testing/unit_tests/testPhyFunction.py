@@ -0,0 +1,51 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+from sage.all import atan, cos, sin
+
+from yanntricks import *
+from yanntricks.src.degree_unit import degree
+
+from Testing import assert_false
+from Testing import assert_equal
+from Testing import assert_almost_equal
+from Testing import echo_function
+from Testing import echo_single_test
+
+
+def test_advised_mark_angle():
+    echo_function("test_advised_mark_angle")
+    x = var('x')
+    f = phyFunction(sin(x))
+    for value in [pi/4, 1]:
+        exact = degree(atan(cos(value))+pi/2)
+
+        echo_single_test(f"exact angle at {value}")
+        angle = f.get_point(value).advised_mark_angle(pspict=None)
+        assert_false(isinstance(angle, float))
+        assert_equal(angle, exact)
+
+        echo_single_test(f"numerical angle at {value}")
+        angle = f.get_point(float(value)).advised_mark_angle(pspict=None)
+        assert_almost_equal(angle, float(exact))
+
+
+def testPhyFunction():
+    test_advised_mark_angle()
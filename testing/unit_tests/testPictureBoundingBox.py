@@ -0,0 +1,70 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+from yanntricks import *
+from yanntricks.src.ObjectGraph import ObjectGraph
+
+from Testing import assert_almost_equal
+from Testing import echo_function
+from Testing import echo_single_test
+from Testing import SilentOutput
+
+
+class FollowMathBB(ObjectGraph):
+    """
+    An object whose visual bounding box is the math bounding box of
+    the picture, one unit larger on the right. Like the default axes.
+    """
+
+    def __init__(self, pspict):
+        ObjectGraph.__init__(self, self)
+        self.take_math_BB = False
+        self.pspict = pspict
+
+    def bounding_box(self, pspict=None):
+        bb = self.pspict.math_BB.copy()
+        bb.xmax = bb.xmax+1
+        return bb
+
+    def latex_code(self, language=None, pspict=None):
+        return ""
+
+
+def test_bounding_box_follows_math_BB():
+    echo_function("test_bounding_box_follows_math_BB")
+    with SilentOutput():
+        pspict, fig = SinglePicture("BBFMooMathBB")
+    pspict.DrawGraphs(Point(1, 1), FollowMathBB(pspict))
+    assert_almost_equal(pspict.bounding_box().xmax, 2)
+
+    echo_single_test("enlargement by hand of the math bounding box")
+    pspict.math_BB.xmax = 5
+    assert_almost_equal(pspict.bounding_box().xmax, 6)
+
+    echo_single_test("forced object")
+    pspict.force_math_bounding_box(Point(7, 0))
+    assert_almost_equal(pspict.bounding_box().xmax, 8)
+
+    echo_single_test("nothing changed")
+    assert_almost_equal(pspict.bounding_box().xmax, 8)
+
+
+def testPictureBoundingBox():
+    test_bounding_box_follows_math_BB()
@@ -22,6 +22,7 @@ from __future__ import division
 
 from sage.all import cos, sin
 from yanntricks import *
+from yanntricks.src.ObjectGraph import ObjectGraph
 
 from Testing import assert_true
 from Testing import assert_false
@@ -81,6 +82,25 @@ def test_add_bounding_box():
     fig.conclude()
 
 
+def test_too_large_bounding_box():
+    echo_function("test_too_large_bounding_box")
+    from yanntricks.src.Exceptions import TooLargeBBException
+    with SilentOutput():
+        pspict, fig = SinglePicture("TLBBooQxWmZr")
+    bb = BoundingBox()
+    bb.add_math_object(Point(3, 4), pspict=pspict)
+    assert_equal(bb.xmax, 3)
+    raised = False
+    try:
+        bb.add_math_object(Point(300, 4), pspict=pspict)
+    except TooLargeBBException as err:
+        raised = True
+        assert_equal(err.faulty, "xmax")
+    assert_true(raised)
+    # The faulty object is not merged.
+    assert_equal(bb.xmax, 3)
+
+
 def test_vertical_horizontal():
     echo_function("test_vertical_horizontal")
 
@@ -109,9 +129,102 @@ def test_right_angle():
     pspict.DrawGraphs(rh)
 
 
+def test_batch_coordinates():
+    echo_function("test_batch_coordinates")
+    import numpy
+    from yanntricks.src.Utilities import format_coordinates
+    with SilentOutput():
+        pspict, fig = SinglePicture("BXLSooPkqTgm")
+    pspict.dilatation_X(2)
+    xy = numpy.array([[0, 0], [1, 1.9999999999999998], [-0.5, 3.25],
+                      [0.0005, -0.001], [123.456789, -98765.4321],
+                      [numpy.pi, -numpy.e]])
+    points = [Point(x, y) for x, y in xy]
+    for pspict_or_none in [None, pspict]:
+        expected = [P.coordinates(digits=5, pspict=pspict_or_none)
+                    for P in points]
+        if pspict_or_none is None:
+            obtained = format_coordinates(xy, digits=5)
+        else:
+            obtained = format_coordinates(xy, digits=5, xunit=pspict.xunit,
+                                          yunit=pspict.yunit)
+        assert_equal(obtained, expected)
+
+
+def test_numeric_points():
+    echo_function("test_numeric_points")
+    from sage.all import sqrt
+    with SilentOutput():
+        pspict, fig = SinglePicture("NUMPooQwHqzt")
+    pspict.dilatation_X(2)
+    pspict.rotation(30)
+    coordinates = [(pi, sqrt(2)), (1/3, -2/7), (0.000001, 3),
+                   (-cos(pi/7), 100*sin(1/9))]
+    for a, b in coordinates:
+        symbolic = Point(a, b)
+        numeric = Point(a, b, numeric=True)
+        echo_single_test(f"numeric point {a},{b}")
+        for pspict_or_none in [None, pspict]:
+            assert_equal(numeric.coordinates(digits=5, pspict=pspict_or_none),
+                         symbolic.coordinates(digits=5, pspict=pspict_or_none))
+
+        echo_single_test(f"numeric picture {a},{b}")
+        pspict.numeric_points = True
+        obtained = symbolic.coordinates(digits=5, pspict=pspict)
+        pspict.numeric_points = False
+        assert_equal(obtained, symbolic.coordinates(digits=5, pspict=pspict))
+
+        echo_single_test(f"translation {a},{b}")
+        for dx, dy in [(0.000001, -0.000002), (1, sqrt(3))]:
+            assert_equal(numeric.translate(dx, dy).coordinates(digits=5),
+                         symbolic.translate(dx, dy).coordinates(digits=5))
+    echo_single_test("small translations are neglected")
+    P = Point(1, 2, numeric=True).translate(0.000001, -0.000002)
+    assert_equal((P.x, P.y), (1.0, 2.0))
+
+
+class PointRecorder(ObjectGraph):
+    """Record the points created while the picture draws it."""
+
+    def __init__(self):
+        ObjectGraph.__init__(self, self)
+        self.points = []
+
+    def _math_bounding_box(self, pspict=None):
+        self.points.append(Point(pi, 1))
+        return BoundingBox(xmin=0, ymin=0, xmax=1, ymax=1)
+
+    def _bounding_box(self, pspict=None):
+        return self._math_bounding_box(pspict)
+
+    def latex_code(self, language=None, pspict=None):
+        return ""
+
+
+def test_numeric_picture():
+    echo_function("test_numeric_picture")
+    for numeric in [False, True]:
+        with SilentOutput():
+            pspict, fig = SinglePicture("NUMPooPicture")
+        pspict.numeric_points = numeric
+        recorder = PointRecorder()
+        pspict.DrawGraphs(recorder)
+        echo_single_test(f"points built while drawing, numeric={numeric}")
+        assert_true(len(recorder.points) > 0)
+        for P in recorder.points:
+            assert_equal(P.numeric, numeric)
+            assert_equal(isinstance(P.x, float), numeric)
+        echo_single_test("points built outside the picture")
+        assert_false(Point(pi, 1).numeric)
+
+
 def testPointCoordinates():
+    test_numeric_points()
+    test_numeric_picture()
+    test_batch_coordinates()
     test_right_angle()
     test_vertical_horizontal()
     test_add_bounding_box()
+    test_too_large_bounding_box()
     test_non_equalities()
     test_equalities()
@@ -0,0 +1,98 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+import numpy
+
+from sage.all import sin, sqrt, numerical_approx
+from yanntricks import *
+from yanntricks.src.points_array import PointsArray
+
+from Testing import assert_true
+from Testing import assert_equal
+from Testing import assert_almost_equal
+from Testing import echo_function
+from Testing import echo_single_test
+from Testing import SilentOutput
+
+
+def test_list_behaviour():
+    echo_function("test_list_behaviour")
+    pl = PointsArray([0, 1, 2, 3], [0, -1, 4, 9.5])
+
+    echo_single_test("length and items")
+    assert_equal(len(pl), 4)
+    assert_true(isinstance(pl[2], Point))
+    assert_equal((pl[2].x, pl[2].y), (2.0, 4.0))
+    assert_equal((pl[-1].x, pl[-1].y), (3.0, 9.5))
+
+    echo_single_test("slices")
+    sub = pl[1:3]
+    assert_true(isinstance(sub, PointsArray))
+    assert_equal([(P.x, P.y) for P in sub], [(1.0, -1.0), (2.0, 4.0)])
+    assert_equal(len(pl[[0, 3]]), 2)
+
+    echo_single_test("iteration")
+    assert_equal([P.y for P in pl], [0.0, -1.0, 4.0, 9.5])
+
+    echo_single_test("min and max")
+    assert_equal(pl.minmax_data(),
+                 {'xmin': 0.0, 'xmax': 3.0, 'ymin': -1.0, 'ymax': 9.5})
+
+
+def test_coordinates():
+    echo_function("test_coordinates")
+    with SilentOutput():
+        pspict, fig = SinglePicture("PARRooCoordi")
+    pspict.dilatation_Y(3)
+    pspict.rotation(45)
+    pl = PointsArray([0, 1.23456789, -0.0001, numpy.pi],
+                     [2, -3.5, 1000.25, numpy.e])
+    for pspict_or_none in [None, pspict]:
+        echo_single_test(f"pspict: {pspict_or_none is not None}")
+        assert_equal(pl.coordinates(digits=5, pspict=pspict_or_none),
+                     [P.coordinates(digits=5, pspict=pspict_or_none)
+                      for P in pl])
+
+
+def test_function_sampling():
+    echo_function("test_function_sampling")
+    x = var('x')
+
+    echo_single_test("the points are computed on numpy arrays")
+    f = phyFunction(sin(x)+x**2).graph(-3, 3)
+    points = f.representative_points()
+    assert_true(isinstance(points, PointsArray))
+    params = f.representativeParameters()
+    assert_equal(len(points), len(params))
+    for llam, P in zip(params, points):
+        assert_almost_equal(P.x, numerical_approx(llam))
+        assert_almost_equal(P.y, numerical_approx(sin(llam)+llam**2))
+
+    echo_single_test("NaN out of the domain")
+    g = phyFunction(sqrt(x))
+    values = g.numpy_function(numpy.array([-1.0, 0.0, 4.0]))
+    assert_true(numpy.isnan(values[0]))
+    assert_equal(list(values[1:]), [0.0, 2.0])
+
+
+def testPointsArray():
+    test_list_behaviour()
+    test_coordinates()
+    test_function_sampling()
@@ -0,0 +1,64 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+from yanntricks import *
+from yanntricks.src.separator_list import collapse_double_newlines
+
+from Testing import assert_equal
+from Testing import echo_function
+from Testing import echo_single_test
+
+
+def collapsed(chunks):
+    return "".join(collapse_double_newlines(chunks))
+
+
+def test_collapse_double_newlines():
+    echo_function("test_collapse_double_newlines")
+
+    echo_single_test("pair split between two chunks")
+    assert_equal(collapsed(["a\n", "\nb"]), "a\nb")
+
+    echo_single_test("run split across three chunks")
+    # Same as "a\n\n\nb".replace("\n\n", "\n").
+    assert_equal(collapsed(["a\n", "\n", "\nb"]), "a\n\nb")
+    assert_equal(collapsed(["\n", "\n", "\n", "\n"]), "\n\n")
+
+    echo_single_test("empty chunks")
+    assert_equal(collapsed([]), "")
+    assert_equal(collapsed(["", "", ""]), "")
+    assert_equal(collapsed(["a\n", "", "\nb"]), "a\nb")
+    assert_equal(collapsed(["", "a\n", "", "", "\n", ""]), "a\n")
+
+    echo_single_test("final newline")
+    assert_equal(collapsed(["a\n"]), "a\n")
+    assert_equal(collapsed(["a\n\n"]), "a\n")
+
+    echo_single_test("every split of a text")
+    text = "x\n\n\ny\n\nz\n\n\n\nt\n"
+    expected = text.replace("\n\n", "\n")
+    for i in range(len(text)+1):
+        for j in range(i, len(text)+1):
+            assert_equal(collapsed([text[:i], text[i:j], text[j:]]),
+                         expected)
+
+
+def testSeparatorList():
+    test_collapse_double_newlines()
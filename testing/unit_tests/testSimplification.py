@@ -0,0 +1,107 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+import numpy
+
+from yanntricks import *
+from yanntricks.src.points_array import simplified_indices
+
+from Testing import assert_true
+from Testing import assert_equal
+from Testing import echo_function
+from Testing import echo_single_test
+from Testing import SilentOutput
+
+
+def test_simplified_indices():
+    echo_function("test_simplified_indices")
+
+    echo_single_test("short lists")
+    assert_equal(list(simplified_indices([], [], 0.1)), [])
+    assert_equal(list(simplified_indices([1], [1], 0.1)), [0])
+    assert_equal(list(simplified_indices([0, 1], [0, 1], 0.1)), [0, 1])
+
+    xs = numpy.linspace(0, 1, 11)
+    signs = (-1)**numpy.arange(11)
+
+    echo_single_test("straight line")
+    assert_equal(list(simplified_indices(xs, 2*xs, 0.01)), [0, 10])
+
+    echo_single_test("oscillations below the tolerance")
+    assert_equal(list(simplified_indices(xs, 0.001*signs, 0.01)), [0, 10])
+
+    echo_single_test("oscillations above the tolerance")
+    assert_equal(list(simplified_indices(xs, 0.1*signs, 0.01)),
+                 list(range(11)))
+
+    echo_single_test("the polyline goes back")
+    assert_equal(list(simplified_indices([0, 2, 1], [0, 0, 0], 0.01)),
+                 [0, 1, 2])
+
+    echo_single_test("non finite coordinates are kept")
+    assert_equal(list(simplified_indices([0, 1, 2], [0, numpy.nan, 0],
+                                         0.01)), [0, 1, 2])
+
+
+def drawn_curves_code(pspict):
+    """Return the code of the interpolation curves drawn in `pspict`."""
+    from yanntricks.src.interpolation_curve import InterpolationCurve
+    return [x.graph.latex_code(language="tikz", pspict=pspict)
+            for x in pspict.record_draw_graph
+            if isinstance(x.graph, InterpolationCurve)]
+
+
+def test_report():
+    echo_function("test_report")
+    x, y = var('x,y')
+    with SilentOutput():
+        pspict, fig = SinglePicture("SIMPooReport")
+    pspict.simplification_tolerance = 0.001
+
+    echo_single_test("parametric curve")
+    curve = ParametricCurve(x, 2*x).graph(0, 1)
+    pspict.DrawGraphs(curve)
+    drawn_curves_code(pspict)
+    name, before, after = pspict.simplification_record[id(curve)]
+    assert_equal(name, "ParametricCurveGraph")
+    assert_equal(after, 2)
+    assert_true(before > after)
+
+    echo_single_test("implicit curve with two components")
+    hyperbola = ImplicitCurve(x**2-y**2 == 2, (x, -3, 3), (y, -3, 3))
+    hyperbola.latex_code(language="tikz", pspict=pspict)
+    name, before, after = pspict.simplification_record[id(hyperbola)]
+    assert_equal(len(hyperbola.paths), 2)
+    assert_equal(before, sum(len(path) for path in hyperbola.paths))
+    assert_true(after <= before)
+
+    echo_single_test("report")
+    report = pspict.simplification_report()
+    assert_true("ParametricCurveGraph" in report)
+    assert_true("ImplicitCurveGraph" in report)
+    total_before = sum(r[1] for r in pspict.simplification_record.values())
+    total_after = sum(r[2] for r in pspict.simplification_record.values())
+    assert_true(f"total : {total_before-total_after} points removed "
+                f"out of {total_before}" in report)
+
+
+def testSimplification():
+    test_simplified_indices()
+    test_report()
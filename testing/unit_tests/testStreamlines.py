@@ -0,0 +1,84 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+import numpy
+from sage.all import var
+
+from yanntricks import *
+from yanntricks.src.streamlines import integrate_streamlines
+
+from Testing import assert_true
+from Testing import assert_equal
+from Testing import assert_almost_equal
+from Testing import echo_function
+from Testing import echo_single_test
+
+
+def test_integrate_streamlines():
+    echo_function("test_integrate_streamlines")
+    bounds = (-2, 2, -2, 2)
+
+    def constant(X, Y):
+        return numpy.ones_like(X), numpy.zeros_like(Y)
+
+    def vanishing(X, Y):
+        return numpy.zeros_like(X), numpy.zeros_like(Y)
+
+    echo_single_test("stops at the border")
+    (xs, ys), (outside_x, outside_y) = integrate_streamlines(
+        constant, [0, 5], [0, 0], bounds, 0.1, 1000)
+    assert_true(1.8 < xs[-1] <= 2)
+    assert_equal(set(ys), {0})
+    assert_equal(len(outside_x), 1)
+
+    echo_single_test("maximal number of steps")
+    (xs, ys), = integrate_streamlines(constant, [0], [0], bounds, 0.1, 5)
+    assert_equal(len(xs), 6)
+
+    echo_single_test("backward")
+    (xs, ys), = integrate_streamlines(constant, [0], [0], bounds, -0.1, 5)
+    assert_almost_equal(xs[-1], -0.5)
+
+    echo_single_test("vanishing field")
+    (xs, ys), = integrate_streamlines(vanishing, [0], [0], bounds, 0.1, 5)
+    assert_equal(len(xs), 1)
+
+
+def test_streamlines_graph():
+    echo_function("test_streamlines_graph")
+    x, y = var('x,y')
+
+    echo_single_test("closed streamline")
+    F = Streamlines(-y, x, (x, -2, 2), (y, -2, 2), seeds=[Point(1, 0)])
+    assert_equal(len(F.paths), 1)
+    path = F.paths[0]
+    # A circle of radius 1.
+    assert_almost_equal(max(abs(path.xs**2+path.ys**2-1)), 0)
+    assert_equal([path.xs[0], path.ys[0]], [path.xs[-1], path.ys[-1]])
+
+    echo_single_test("stagnation point")
+    # The seed at the origin is a stagnation point.
+    G = Streamlines(-y, x, (x, -2, 2), (y, -2, 2), density=3)
+    assert_equal(len(G.paths), 8)
+
+
+def testStreamlines():
+    test_integrate_streamlines()
+    test_streamlines_graph()
@@ -0,0 +1,67 @@
+###########################################################################
+#   This is part of the module yanntricks
+#
+#   yanntricks is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   yanntricks is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with yanntricks.py.  If not, see <http://www.gnu.org/licenses/>.
+###########################################################################
+
+# copyright (c) Laurent Claessens, 2019
+# email: laurent@claessens-donadello.eu
+
+from sage.all import var
+
+from yanntricks import *
+
+from Testing import assert_equal
+from Testing import assert_almost_equal
+from Testing import echo_function
+from Testing import echo_single_test
+
+
+def test_field_values():
+    echo_function("test_field_values")
+    x, y = var('x,y')
+    F = VectorField(x, 2*y, xvalues=(x, 1, 2, 2), yvalues=(y, 0, 1, 2))
+    assert_equal(len(F.draw_vectors), len(F.draw_points))
+    for v, P in zip(F.draw_vectors, F.draw_points):
+        assert_almost_equal(v.Dx, P.x)
+        assert_almost_equal(v.Dy, 2*P.y)
+
+
+def test_normalize():
+    echo_function("test_normalize")
+    x, y = var('x,y')
+    F = VectorField(x, 2*y, xvalues=(x, 1, 2, 2), yvalues=(y, 0, 1, 2))
+
+    echo_single_test("same length")
+    F.normalize(1)
+    xs, ys, vx, vy = F.vector_arrays()
+    for u, v in zip(vx, vy):
+        assert_almost_equal(u**2+v**2, 1)
+
+    echo_single_test("proportional")
+    F.normalize(2, proportional=True)
+    xs, ys, vx, vy = F.vector_arrays()
+    assert_almost_equal(max(vx**2+vy**2), 4)
+
+    echo_single_test("normalize after draw_vectors")
+    G = VectorField(x, 2*y, xvalues=(x, 1, 2, 2), yvalues=(y, 0, 1, 2))
+    G.draw_vectors
+    G.normalize(1)
+    for v in G.draw_vectors:
+        assert_almost_equal(v.Dx**2+v.Dy**2, 1)
+
+
+def testVectorField():
+    test_field_values()
+    test_normalize()